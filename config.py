@@ -47,6 +47,41 @@ USE_AI_ANALYSIS = True  # Set to False to disable AI analysis (will use faster h
 USE_CACHE = True  # Cache API responses to avoid rate limits
 CACHE_EXPIRY_DAYS = 1  # How long to cache data
 
+# Cache backend: "local" (.cache/ only), "shared_dir" or "redis" (local .cache/ as L1
+# in front of a store shared by all hosts), "memory" (in-process stand-in for redis)
+CACHE_BACKEND = "local"
+CACHE_SHARED_DIR = None  # e.g. "/mnt/screener-cache"
+CACHE_REDIS_URL = None  # e.g. "redis://cache-host:6379/0"
+
+# Offline SEC bulk store filled by ingest_edgar_bulk.py (None disables it)
+EDGAR_BULK_DB = ".cache/edgar_bulk.sqlite"
+# Older snapshots are skipped (live SEC requests instead) - catches a stopped nightly ingest
+EDGAR_BULK_MAX_AGE_DAYS = 3
+
+# 10-K Items 1, 1A, 7, 7A and 8, split once per filing into a local SQLite FTS5 index
+# (None disables it; 10-K parsing then stops as soon as every extractor has its answer)
+SECTION_STORE_DB = ".cache/sections.sqlite"
+
+# Worker processes for DEF 14A parsing (None = one per CPU, 0 = parse in the calling thread)
+PROXY_PARSE_WORKERS = None
+
+# 10-K years compared for strategy pivots (Item 1 / 1A MinHash signatures, persisted per
+# filing - the first run crawls the history, later runs fetch only the newest 10-K; 0 disables)
+PIVOT_YEARS = 10
+
+# Form 4 insider trades (incremental - only forms filed since the last run are downloaded)
+INSIDER_TRADES = True
+
+# Crisis columns come from SEC XBRL frames; set True to also pull 20Y FMP income
+# statements per ticker for companies the frames don't cover
+FMP_CRISIS_FALLBACK = False
+
+# SEC fair access: 10 requests/second per client across data.sec.gov and www.sec.gov.
+# Point SEC_RATE_LOCK_FILE at a shared path (e.g. ".cache/sec_rate.lock") when several
+# processes on this host run at once, so they split one budget
+SEC_REQUESTS_PER_SECOND = 10
+SEC_RATE_LOCK_FILE = None
+
 # Scoring thresholds (customize these based on your criteria)
 SCORING_THRESHOLDS = {
     "ROE": {
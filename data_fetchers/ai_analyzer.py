@@ -1,20 +1,90 @@
 """
 AI Analyzer - Uses Anthropic Claude for qualitative analysis
+Results are memoized on disk, keyed by model, prompt version and a hash of the inputs
 """
+import hashlib
+import json
 import anthropic
+from data_fetchers.utils import cache_data, load_cached_data
+from data_fetchers.cache_metrics import record_network
+from scoring.scoring_engine import MOAT_TYPES, PRICING_POWER_LEVELS
+
+MODEL = "claude-sonnet-4-20250514"
+
+# Bump whenever a prompt template below changes - invalidates the memo
+PROMPT_VERSION = 2
+
+# Memo entries are content-addressed, so age alone never makes them wrong
+AI_MEMO_MAX_AGE_DAYS = 3650
+
+SYSTEM_PROMPT = "You are a financial analyst."
+
+PROMPT_TEMPLATES = {
+    'business_model': (
+        "Summarize this company's business model in 1-2 sentences: what it sells, "
+        "to whom, and how it makes money.\n\n"
+        "Description:\n{description}"
+    ),
+    'moat': (
+        "Classify the primary competitive moat of this company. Answer with exactly one of: "
+        f"{', '.join(MOAT_TYPES)}.\n\n"
+        "ROE: {roe}%  Gross margin: {gross_margin}%  Operating margin: {operating_margin}%\n\n"
+        "Description:\n{description}"
+    ),
+    'pricing_power': (
+        "Does this company have pricing power? Operating margin trend: {margin_trend}. "
+        f"Answer with exactly one of: {', '.join(PRICING_POWER_LEVELS)}.\n\n"
+        "Description:\n{description}"
+    ),
+    'complexity': (
+        "Rate the business complexity of this company from 1 (very simple) to 10 (very complex). "
+        "It reports {segment_count} segments across {geo_count} geographies. "
+        "Answer with a single integer.\n\n"
+        "Description:\n{description}"
+    ),
+    'demand_type': (
+        "Classify the demand for this company's products. Industry: {industry}. "
+        "Answer with exactly one of: Recurring, Mixed, Discretionary.\n\n"
+        "Description:\n{description}"
+    ),
+}
+
+
+def _normalize(value):
+    """Round floats so day-to-day noise in TTM metrics doesn't bust the memo"""
+    if isinstance(value, float):
+        return round(value, 1)
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    return value
+
+
+def _choice(result, options):
+    """The option a one-word answer names (case and trailing punctuation ignored), else None"""
+    if not result:
+        return None
+    answer = result.strip().rstrip('.').lower()
+    return next((option for option in options if option.lower() == answer), None)
+
 
 class AIAnalyzer:
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, model=MODEL, use_memo=True):
         self.client = anthropic.Anthropic(api_key=api_key) if api_key else None
-    
-    def analyze(self, prompt, system_prompt="You are a financial analyst."):
+        self.model = model
+        self.use_memo = use_memo
+
+    @property
+    def enabled(self):
+        return self.client is not None
+
+    def analyze(self, prompt, system_prompt=SYSTEM_PROMPT):
         """Call Claude API for analysis"""
         if not self.client:
             return None
-        
+
         try:
             response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
+                model=self.model,
                 max_tokens=4000,
                 system=system_prompt,
                 messages=[{"role": "user", "content": prompt}]
@@ -23,3 +93,70 @@ class AIAnalyzer:
         except Exception as e:
             print(f"AI Analysis error: {e}")
             return None
+
+    def memo_key(self, task, inputs):
+        """Cache key for a templated request: model + prompt version + hash of exact inputs"""
+        payload = json.dumps({
+            'model': self.model,
+            'prompt_version': PROMPT_VERSION,
+            'task': task,
+            'inputs': inputs
+        }, sort_keys=True)
+        return f"ai_{task}_{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]}"
+
+    def _run(self, task, **inputs):
+        """Render a prompt template and call Claude, answering from the memo when possible"""
+        inputs = _normalize(inputs)
+        key = self.memo_key(task, inputs)
+
+        if self.use_memo:
+            cached = load_cached_data(key, max_age_days=AI_MEMO_MAX_AGE_DAYS)
+            if cached is not None:
+                return cached['result']
+
+        record_network(key)
+        result = self.analyze(PROMPT_TEMPLATES[task].format(**inputs))
+
+        # Only successful answers are memoized - errors get retried next run
+        if result is not None and self.use_memo:
+            cache_data(key, {
+                'model': self.model,
+                'prompt_version': PROMPT_VERSION,
+                'task': task,
+                'result': result
+            })
+
+        return result
+
+    def extract_business_model_summary(self, description):
+        """Short business model summary"""
+        result = self._run('business_model', description=description)
+        return result.strip() if result else None
+
+    def categorize_moat(self, description, financial_metrics=None):
+        """Primary moat category"""
+        metrics = financial_metrics or {}
+        result = self._run('moat', description=description,
+                           roe=metrics.get('roe', 0) or 0,
+                           gross_margin=metrics.get('gross_margin', 0) or 0,
+                           operating_margin=metrics.get('operating_margin', 0) or 0)
+        return _choice(result, MOAT_TYPES)
+
+    def assess_pricing_power(self, description, margin_trend='stable'):
+        """Yes / Moderate / No"""
+        result = self._run('pricing_power', description=description, margin_trend=margin_trend)
+        return _choice(result, PRICING_POWER_LEVELS)
+
+    def assess_business_simplicity(self, description, segment_count=0, geo_count=0):
+        """Complexity score 1-10 (10 = very complex)"""
+        result = self._run('complexity', description=description,
+                           segment_count=segment_count or 0, geo_count=geo_count or 0)
+        try:
+            return max(1, min(10, int(result.strip().split()[0])))
+        except (AttributeError, ValueError, IndexError):
+            return None
+
+    def categorize_demand_type(self, description, industry=''):
+        """Recurring / Mixed / Discretionary"""
+        result = self._run('demand_type', description=description, industry=industry or '')
+        return result.strip() if result else None
@@ -0,0 +1,224 @@
+"""
+Cache storage backends for Buffett Screener
+Backends move encoded entries (bytes, see cache_codecs) around; they know nothing about ages or codecs.
+
+  LocalDirBackend   - the per-host .cache/ directory
+  SharedDirBackend  - a network directory shared by several hosts, writes guarded by lock files
+  RedisBackend      - any Redis-protocol key-value store (redis-py client or InMemoryRedis)
+  TieredBackend     - local L1 in front of a shared L2, so every worker reuses every other's fetches
+"""
+import os
+import time
+import threading
+from typing import Iterable, Optional
+
+CACHE_EXTENSION = ".bin"
+LEGACY_CACHE_EXTENSION = ".json"  # Pre-codec entries, still readable
+
+
+class LocalDirBackend:
+    """One file per entry in a local directory"""
+
+    def __init__(self, cache_dir: str = ".cache"):
+        self.cache_dir = cache_dir
+
+    def _path(self, key: str, extension: str = CACHE_EXTENSION) -> str:
+        return os.path.join(self.cache_dir, f"{key}{extension}")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Entry bytes, falling back to a legacy .json entry (caller sniffs the format)"""
+        for extension in (CACHE_EXTENSION, LEGACY_CACHE_EXTENSION):
+            path = self._path(key, extension)
+            if os.path.exists(path):
+                try:
+                    with open(path, 'rb') as f:
+                        return f.read()
+                except OSError:
+                    pass
+        return None
+
+    def put(self, key: str, raw: bytes):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        # Write-then-rename so readers never see a half-written entry
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp_path, path)
+
+        # Drop the superseded pretty-JSON entry, if any
+        legacy_path = self._path(key, LEGACY_CACHE_EXTENSION)
+        if os.path.exists(legacy_path):
+            try:
+                os.remove(legacy_path)
+            except OSError:
+                pass
+
+    def delete(self, key: str):
+        for extension in (CACHE_EXTENSION, LEGACY_CACHE_EXTENSION):
+            try:
+                os.remove(self._path(key, extension))
+            except OSError:
+                pass
+
+    def keys(self, prefix: str = "") -> Iterable[str]:
+        if not os.path.isdir(self.cache_dir):
+            return []
+        found = set()
+        for name in os.listdir(self.cache_dir):
+            for extension in (CACHE_EXTENSION, LEGACY_CACHE_EXTENSION):
+                if name.startswith(prefix) and name.endswith(extension):
+                    found.add(name[:-len(extension)])
+        return sorted(found)
+
+
+class SharedDirBackend(LocalDirBackend):
+    """
+    Network directory (NFS/SMB) shared by several hosts
+    Writers take a '<entry>.lock' file (O_EXCL create) so two hosts never
+    interleave writes; readers rely on the atomic rename and take no lock.
+    """
+
+    def __init__(self, cache_dir: str, lock_timeout: float = 10.0, stale_lock_seconds: float = 60.0):
+        super().__init__(cache_dir)
+        self.lock_timeout = lock_timeout
+        self.stale_lock_seconds = stale_lock_seconds
+
+    def _acquire(self, lock_path: str) -> bool:
+        deadline = time.time() + self.lock_timeout
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, f"{os.getpid()}".encode())
+                os.close(fd)
+                return True
+            except FileExistsError:
+                # A crashed writer leaves its lock behind - break it once it's old enough
+                try:
+                    if time.time() - os.path.getmtime(lock_path) > self.stale_lock_seconds:
+                        os.remove(lock_path)
+                        continue
+                except OSError:
+                    continue
+                if time.time() > deadline:
+                    return False
+                time.sleep(0.05)
+
+    def put(self, key: str, raw: bytes):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        lock_path = self._path(key, ".lock")
+        if not self._acquire(lock_path):
+            return  # Another host is writing the same entry - theirs is as good as ours
+        try:
+            super().put(key, raw)
+        finally:
+            try:
+                os.remove(lock_path)
+            except OSError:
+                pass
+
+
+class InMemoryRedis:
+    """
+    In-process stand-in for a Redis client (get/set/delete/scan_iter)
+    Lets tests and single-host runs exercise RedisBackend without a server
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self._data.get(key)
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = bytes(value)
+        return True
+
+    def delete(self, *keys):
+        with self._lock:
+            return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
+    def scan_iter(self, match=None):
+        prefix = match[:-1] if match and match.endswith('*') else (match or '')
+        with self._lock:
+            return [key for key in list(self._data) if key.startswith(prefix)]
+
+
+class RedisBackend:
+    """Entries in a Redis-protocol key-value store under a namespace prefix"""
+
+    def __init__(self, client=None, url: Optional[str] = None, namespace: str = "bsc:"):
+        if client is None:
+            import redis  # Optional dependency - only needed for a real server
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.namespace = namespace
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.namespace + key)
+
+    def put(self, key: str, raw: bytes):
+        self.client.set(self.namespace + key, raw)
+
+    def delete(self, key: str):
+        self.client.delete(self.namespace + key)
+
+    def keys(self, prefix: str = "") -> Iterable[str]:
+        found = []
+        for key in self.client.scan_iter(match=f"{self.namespace}{prefix}*"):
+            key = key.decode() if isinstance(key, bytes) else key
+            found.append(key[len(self.namespace):])
+        return sorted(found)
+
+
+class TieredBackend:
+    """
+    Local L1 in front of a shared L2
+    Reads try L1, then L2 (copying the entry down); writes go to both.
+    """
+
+    def __init__(self, l1, l2):
+        self.l1 = l1
+        self.l2 = l2
+
+    def get(self, key: str) -> Optional[bytes]:
+        raw = self.l1.get(key)
+        if raw is not None:
+            return raw
+        return self.get_shared(key)
+
+    def get_shared(self, key: str) -> Optional[bytes]:
+        """Read straight from L2 - used when the L1 copy is stale"""
+        try:
+            raw = self.l2.get(key)
+        except Exception as e:
+            print(f"Shared cache read error on {key}: {e}")
+            return None
+        if raw is not None:
+            self.l1.put(key, raw)
+        return raw
+
+    def put(self, key: str, raw: bytes):
+        self.l1.put(key, raw)
+        try:
+            self.l2.put(key, raw)
+        except Exception as e:
+            # The shared tier is an optimization - never fail a run over it
+            print(f"Shared cache write error on {key}: {e}")
+
+    def delete(self, key: str):
+        self.l1.delete(key)
+        try:
+            self.l2.delete(key)
+        except Exception as e:
+            print(f"Shared cache delete error on {key}: {e}")
+
+    def keys(self, prefix: str = "") -> Iterable[str]:
+        try:
+            shared = set(self.l2.keys(prefix))
+        except Exception:
+            shared = set()
+        return sorted(set(self.l1.keys(prefix)) | shared)
@@ -0,0 +1,160 @@
+"""
+Cache codecs for Buffett Screener
+Binary, compressed on-disk format for cache entries, chosen by payload type:
+  - dict/list  -> msgpack + zstd
+  - DataFrame  -> Arrow IPC (zstd-compressed buffers)
+  - str (HTML) -> zstd
+Each entry carries a versioned header. JSON codecs are always available, so a
+missing optional dependency degrades to JSON instead of failing.
+
+Entry layout:
+    b'BSC' | format version (1 byte) | header length (4 bytes, big-endian) | header JSON | payload
+"""
+import json
+import struct
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+import pandas as pd
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+MAGIC = b'BSC'
+FORMAT_VERSION = 1
+ZSTD_LEVEL = 6
+
+
+class CodecError(Exception):
+    """Entry could not be encoded/decoded (corrupt, unknown version or codec unavailable)"""
+
+
+# --- Codec implementations -------------------------------------------------
+
+def _zstd_compress(raw: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+
+def _zstd_decompress(raw: bytes) -> bytes:
+    return zstandard.ZstdDecompressor().decompress(raw)
+
+
+def _encode_json(data) -> bytes:
+    return json.dumps(data).encode('utf-8')
+
+def _decode_json(raw: bytes):
+    return json.loads(raw.decode('utf-8'))
+
+
+def _encode_msgpack_zstd(data) -> bytes:
+    return _zstd_compress(msgpack.packb(data, use_bin_type=True))
+
+def _decode_msgpack_zstd(raw: bytes):
+    return msgpack.unpackb(_zstd_decompress(raw), raw=False, strict_map_key=False)
+
+
+def _encode_text_zstd(data: str) -> bytes:
+    return _zstd_compress(data.encode('utf-8'))
+
+def _decode_text_zstd(raw: bytes) -> str:
+    return _zstd_decompress(raw).decode('utf-8')
+
+
+def _encode_arrow(df) -> bytes:
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression='zstd')
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+def _decode_arrow(raw: bytes):
+    return pa.ipc.open_stream(raw).read_all().to_pandas()
+
+
+def _encode_frame_json(df) -> bytes:
+    return json.dumps({
+        'split': json.loads(df.to_json(orient='split', date_format='iso')),
+        'columns_dtype': str(df.columns.dtype)
+    }).encode('utf-8')
+
+def _decode_frame_json(raw: bytes):
+    payload = json.loads(raw.decode('utf-8'))
+    split = payload['split']
+    columns = split['columns']
+    if payload.get('columns_dtype', '').startswith('datetime64'):
+        columns = pd.to_datetime(columns)
+    return pd.DataFrame(split['data'], index=split['index'], columns=columns)
+
+
+# name -> (encode, decode, available)
+CODECS = {
+    'json': (_encode_json, _decode_json, True),
+    'msgpack+zstd': (_encode_msgpack_zstd, _decode_msgpack_zstd, bool(msgpack and zstandard)),
+    'text+zstd': (_encode_text_zstd, _decode_text_zstd, bool(zstandard)),
+    'arrow': (_encode_arrow, _decode_arrow, bool(pa)),
+    'frame+json': (_encode_frame_json, _decode_frame_json, True),
+}
+
+
+def codecs_for(data):
+    """Codec names to try for a payload, preferred first"""
+    if isinstance(data, pd.DataFrame):
+        return ['arrow', 'frame+json']
+    if isinstance(data, str):
+        return ['text+zstd', 'json']
+    return ['msgpack+zstd', 'json']
+
+
+# --- Entry framing ----------------------------------------------------------
+
+def encode_entry(data, timestamp: Optional[datetime] = None) -> bytes:
+    """Encode a cache entry with the best available codec for its payload type"""
+    timestamp = timestamp or datetime.now()
+    for name in codecs_for(data):
+        encode, _, available = CODECS[name]
+        if not available:
+            continue
+        try:
+            payload = encode(data)
+        except (TypeError, ValueError, OverflowError):
+            continue  # e.g. a value msgpack can't represent - try the next codec
+        header = json.dumps({'codec': name, 'timestamp': timestamp.isoformat()}).encode('utf-8')
+        return MAGIC + bytes([FORMAT_VERSION]) + struct.pack('>I', len(header)) + header + payload
+    raise CodecError(f"No codec can encode {type(data).__name__}")
+
+
+def decode_header(raw: bytes) -> Tuple[Dict, int]:
+    """Return (header, payload offset) without touching the payload"""
+    if raw[:3] != MAGIC:
+        raise CodecError("Not a cache entry")
+    if raw[3] != FORMAT_VERSION:
+        raise CodecError(f"Unsupported cache format version {raw[3]}")
+    (header_len,) = struct.unpack('>I', raw[4:8])
+    header = json.loads(raw[8:8 + header_len].decode('utf-8'))
+    return header, 8 + header_len
+
+
+def decode_entry(raw: bytes) -> Tuple[datetime, object]:
+    """Decode a cache entry -> (timestamp, data)"""
+    header, offset = decode_header(raw)
+    codec = CODECS.get(header['codec'])
+    if not codec or not codec[2]:
+        raise CodecError(f"Codec {header['codec']} unavailable")
+    return datetime.fromisoformat(header['timestamp']), codec[1](raw[offset:])
+
+
+def decode_legacy_json(raw: bytes) -> Tuple[datetime, object]:
+    """Decode an old pretty-JSON entry ({'timestamp': ..., 'data': ...})"""
+    cached = json.loads(raw.decode('utf-8'))
+    return datetime.fromisoformat(cached['timestamp']), cached['data']
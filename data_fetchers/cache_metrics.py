@@ -0,0 +1,123 @@
+"""
+Cache observability for Buffett Screener
+Process-wide hit/miss/stale/negative/byte/age counters per (source, dataset),
+plus network request counts, with an end-of-run table and a JSON report
+"""
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+EVENTS = ['hit', 'miss', 'stale', 'negative', 'revalidated', 'network']
+
+
+def split_cache_key(cache_key: str) -> Tuple[str, str]:
+    """
+    Derive (source, dataset) from a cache key
+    Keys follow '<source>_<dataset>_<id...>', e.g. 'fmp_key-metrics_AAPL_limit10'
+    Negative entries ('neg_<key>') are attributed to the key they shadow.
+    """
+    if cache_key.startswith('neg_'):
+        cache_key = cache_key[len('neg_'):]
+    parts = cache_key.split('_', 2)
+    source = parts[0]
+    dataset = parts[1] if len(parts) > 1 else ''
+    return source, dataset
+
+
+class CacheMetrics:
+    """Thread-safe counters keyed by (source, dataset)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = datetime.now()
+        self._stats = {}
+
+    def _bucket(self, source: str, dataset: str) -> Dict:
+        key = (source, dataset)
+        if key not in self._stats:
+            self._stats[key] = {event: 0 for event in EVENTS}
+            self._stats[key].update({
+                'bytes_read': 0, 'bytes_written': 0, 'bytes_network': 0,
+                'age_seconds_total': 0.0, 'age_seconds_max': 0.0
+            })
+        return self._stats[key]
+
+    def record(self, source: str, dataset: str, event: str, nbytes: int = 0,
+               age_seconds: Optional[float] = None):
+        """Count one lookup outcome (hit/miss/stale/negative/revalidated/network)"""
+        with self._lock:
+            bucket = self._bucket(source, dataset)
+            bucket[event] += 1
+            if event == 'hit':
+                bucket['bytes_read'] += nbytes
+            elif event == 'network':
+                bucket['bytes_network'] += nbytes
+            if age_seconds is not None:
+                bucket['age_seconds_total'] += age_seconds
+                bucket['age_seconds_max'] = max(bucket['age_seconds_max'], age_seconds)
+
+    def record_write(self, source: str, dataset: str, nbytes: int):
+        with self._lock:
+            self._bucket(source, dataset)['bytes_written'] += nbytes
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+            self.started_at = datetime.now()
+
+    def to_dict(self) -> Dict:
+        """Machine-readable snapshot"""
+        with self._lock:
+            rows = []
+            for (source, dataset), bucket in sorted(self._stats.items()):
+                row = {'source': source, 'dataset': dataset}
+                row.update(bucket)
+                lookups = bucket['hit'] + bucket['miss'] + bucket['stale']
+                row['hit_rate'] = bucket['hit'] / lookups if lookups else None
+                row['age_seconds_avg'] = (bucket['age_seconds_total'] / bucket['hit']) if bucket['hit'] else None
+                rows.append(row)
+        totals = {event: sum(r[event] for r in rows) for event in EVENTS}
+        totals['bytes_network'] = sum(r['bytes_network'] for r in rows)
+        return {
+            'started_at': self.started_at.isoformat(),
+            'finished_at': datetime.now().isoformat(),
+            'totals': totals,
+            'datasets': rows
+        }
+
+    def print_summary(self):
+        """End-of-run table"""
+        report = self.to_dict()
+        print("\nCACHE METRICS")
+        print(f"  {'source':<6} {'dataset':<18} {'hit':>6} {'miss':>6} {'stale':>6} {'neg':>5} "
+              f"{'304':>5} {'net':>6} {'net KB':>9} {'read KB':>9} {'avg age h':>9}")
+        for row in report['datasets']:
+            avg_age = f"{row['age_seconds_avg'] / 3600:.1f}" if row['age_seconds_avg'] is not None else '-'
+            print(f"  {row['source']:<6} {row['dataset'][:18]:<18} {row['hit']:>6} {row['miss']:>6} "
+                  f"{row['stale']:>6} {row['negative']:>5} {row['revalidated']:>5} {row['network']:>6} "
+                  f"{row['bytes_network'] / 1024:>9.0f} {row['bytes_read'] / 1024:>9.0f} {avg_age:>9}")
+        totals = report['totals']
+        print(f"  TOTAL: {totals['hit']} hits, {totals['miss']} misses, {totals['stale']} stale, "
+              f"{totals['network']} network requests ({totals['bytes_network'] / 1024:.0f} KB)")
+        return report
+
+    def write_report(self, cache_dir: str = ".cache") -> str:
+        """Write the JSON report under <cache_dir>/reports/ and return its path"""
+        report_dir = os.path.join(cache_dir, "reports")
+        os.makedirs(report_dir, exist_ok=True)
+        path = os.path.join(report_dir, f"cache_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+
+# Process-wide instance
+METRICS = CacheMetrics()
+
+
+def record_network(cache_key: str, nbytes: int = 0):
+    """Count a network request, attributed to the dataset its cache key belongs to"""
+    source, dataset = split_cache_key(cache_key)
+    METRICS.record(source, dataset, 'network', nbytes=nbytes)
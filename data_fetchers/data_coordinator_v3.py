@@ -5,21 +5,37 @@ Data Coordinator V3 - FINAL PRODUCTION VERSION
 Sequence:
 1. Yahoo Basic (ISIN, CIK)
 2. Edgar (Segments, Executives)
-3. FMP (10Y Historicals)
+3. FMP (10Y Historicals; SEC XBRL company facts without FMP)
 4. FRED (Treasury)
 5. Yahoo Gap-Fill (Fill remaining empty fields)
 6. AI Analysis (With complete context)
 """
 from typing import Dict, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import sys, os
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from data_fetchers.yahoo_finance import YahooFinanceFetcher
-from data_fetchers.sec_edgar import SECEdgarFetcher
+from data_fetchers.sec_edgar import SECEdgarFetcher, geographic_count
 from data_fetchers.fmp import FMPFetcher
 from data_fetchers.ai_analyzer import AIAnalyzer
 from data_fetchers.third_sources import FREDFetcher
+from data_fetchers.xbrl_frames import get_crisis_frames
+from data_fetchers.security_master import get_security_master
+from data_fetchers.utils import cache_negative, load_negative, NEG_NO_CIK, NEG_NOT_FOUND
+from data_fetchers.cache_metrics import record_network
+
+def _fill_missing(base: Dict, extra: Dict) -> Dict:
+    """Copy of base with extra's values for the keys base lacks or left empty (nested dicts merged)"""
+    merged = dict(base)
+    for key, value in extra.items():
+        if isinstance(merged.get(key), dict) and isinstance(value, dict):
+            merged[key] = _fill_missing(merged[key], value)
+        elif merged.get(key) in (None, {}, []):
+            merged[key] = value
+    return merged
+
 
 class DataCoordinatorV3:
     """
@@ -28,8 +44,11 @@ class DataCoordinatorV3:
     """
     
     def __init__(self, ticker: str, anthropic_key: Optional[str] = None,
-                 fmp_key: Optional[str] = None, fred_key: Optional[str] = None):
+                 fmp_key: Optional[str] = None, fred_key: Optional[str] = None,
+                 live_edgar: bool = False):
         self.ticker = ticker
+        # Skip the offline bulk store (recomputes triggered by a filing newer than it)
+        self.live_edgar = live_edgar
         
         # Initialize fetchers
         self.yahoo = YahooFinanceFetcher(ticker)
@@ -65,9 +84,16 @@ class DataCoordinatorV3:
         print("  6. AI Analysis (With complete context)")
         print(f"{'='*80}\n")
         
-        # Execute all phases
-        self._phase1_initialize_basic()
-        self._phase2_fetch_edgar()
+        # Execute all phases - with the CIK already in the security master,
+        # Edgar runs alongside Yahoo's slow .info call instead of after it
+        self._init_edgar_from_master()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            edgar = pool.submit(self._phase2_fetch_edgar) if self.edgar else None
+            self._phase1_initialize_basic()
+            if edgar:
+                edgar.result()
+            else:
+                self._phase2_fetch_edgar()
         self._phase3_fetch_fmp()
         self._phase4_fetch_fred()
         self._phase5_fill_gaps_yahoo()  # ⭐ NEW!
@@ -76,24 +102,44 @@ class DataCoordinatorV3:
         # Compile and return
         return self._compile_results()
     
+    def _init_edgar_from_master(self):
+        """Start Edgar from the security master's CIK - no Yahoo call needed"""
+        if self.edgar is None and not load_negative(f"sec_cik_{self.ticker}"):
+            cik = get_security_master().cik(self.ticker)
+            if cik:
+                self.edgar = SECEdgarFetcher(cik, use_bulk=not self.live_edgar)
+    
     def _phase1_initialize_basic(self):
         """PHASE 1: Get basic info from Yahoo (ISIN, CIK, description)"""
         print(f"\n{'='*60}")
         print("PHASE 1: Yahoo Basic Info")
         print(f"{'='*60}")
         
+        master = get_security_master()
+        known = master.get(self.ticker)
         info = self.yahoo.get_info()
         
-        # Extract ISIN
-        isin = info.get('isin', '')
-        if not isin:
-            import yfinance as yf
-            stock = yf.Ticker(self.ticker)
+        # Extract ISIN (the extra yf.Ticker probe is skipped once known or known to fail)
+        isin = info.get('isin', '') or known.get('isin') or ''
+        if not isin and not load_negative(f"yf_isin_{self.ticker}"):
+            record_network(f"yf_isin_{self.ticker}")
+            stock = self.yahoo.stock
             if hasattr(stock, 'isin'):
                 isin = stock.isin
+            # yfinance reports a missing ISIN as '-'
+            if not isin or isin == '-':
+                isin = ''
+                cache_negative(f"yf_isin_{self.ticker}", NEG_NOT_FOUND, "yfinance has no ISIN")
         
-        # Extract CIK
-        cik = info.get('cik', '')
+        # Extract CIK (SEC's own ticker list first, Yahoo's often-empty field second;
+        # a ticker already known to have none skips the lookup and Edgar)
+        no_cik = load_negative(f"sec_cik_{self.ticker}")
+        cik = '' if no_cik else known.get('cik') or info.get('cik', '')
+        if not cik and not no_cik:
+            cache_negative(f"sec_cik_{self.ticker}", NEG_NO_CIK, "not in SEC ticker list or Yahoo info")
+        
+        if info and not master.yahoo_is_fresh(self.ticker):
+            master.record_yahoo(self.ticker, info, isin)
         
         self._phase1_basic = {
             'ticker': self.ticker,
@@ -112,8 +158,10 @@ class DataCoordinatorV3:
         print(f"  ✅ CIK: {cik if cik else '❌ Not found'}")
         
         # Initialize Edgar if CIK available
-        if cik:
-            self.edgar = SECEdgarFetcher(cik)
+        if self.edgar:
+            print(f"  ✅ Edgar already running (CIK from security master)")
+        elif cik:
+            self.edgar = SECEdgarFetcher(cik, use_bulk=not self.live_edgar)
             print(f"  ✅ Edgar initialized with CIK")
         else:
             print(f"  ⚠️  No CIK - Edgar disabled")
@@ -146,17 +194,28 @@ class DataCoordinatorV3:
             print(f"  ✅ CEO Tenure: {tenure} years")
     
     def _phase3_fetch_fmp(self):
-        """PHASE 3: Fetch FMP data"""
+        """PHASE 3: Fetch FMP data (SEC XBRL company facts when FMP is unavailable)"""
         print(f"\n{'='*60}")
         print("PHASE 3: FMP Historical Data")
         print(f"{'='*60}")
         
         if not self.fmp:
-            print("  ⏭️  Skipped (no API key)")
+            print("  ⏭️  FMP skipped (no API key)")
             self._phase3_fmp = {}
-            return
+        elif self.fmp.is_known_missing(self.ticker):
+            print("  ⏭️  FMP skipped (FMP does not cover this ticker - negative cache)")
+            self._phase3_fmp = {}
+        else:
+            # Crisis years come from SEC frames below; FMP's 20Y fetch is opt-in
+            self._phase3_fmp = self.fmp.get_comprehensive_data(
+                self.ticker, include_crisis=self._fmp_crisis_fallback() and not self.edgar)
+            self._phase3_fmp['source'] = 'FMP'
+        
+        if not self._phase3_fmp.get('metrics_10y', {}).get('roe') and self.edgar:
+            self._phase3_fetch_xbrl()
         
-        self._phase3_fmp = self.fmp.get_comprehensive_data(self.ticker)
+        if self.edgar:
+            self._phase3_fetch_crisis_frames()
         
         # Report key metrics
         metrics = self._phase3_fmp.get('metrics_10y', {})
@@ -165,6 +224,51 @@ class DataCoordinatorV3:
         if metrics.get('valuation', {}).get('pe_median_10y'):
             print(f"  ✅ P/E 10Y Median: {metrics['valuation']['pe_median_10y']:.1f}")
     
+    @staticmethod
+    def _fmp_crisis_fallback() -> bool:
+        try:
+            import config
+            return getattr(config, 'FMP_CRISIS_FALLBACK', False)
+        except ImportError:
+            return False
+    
+    def _phase3_fetch_crisis_frames(self):
+        """Crisis-year revenue/EPS from SEC frames (fetched once for the whole universe)"""
+        crisis = self._phase3_fmp.get('crisis_performance') or {}
+        frames = get_crisis_frames(self.edgar.session).crisis_performance(self._phase1_basic['cik'])
+        for label, change in frames.items():
+            if change:
+                crisis[label] = change
+                self._phase3_fmp['crisis_source'] = 'SEC Frames'
+                print(f"  ✅ Crisis {label} (SEC frames): Revenue {change['revenue_change_pct']:+.1f}%")
+        
+        # Per-ticker FMP history only for what the frames couldn't answer, and only if enabled
+        missing = [label for label in frames if not crisis.get(label)]
+        if missing and self.fmp and self._fmp_crisis_fallback() and not self.fmp.is_known_missing(self.ticker):
+            fmp_crisis = self.fmp.get_crisis_performance(self.ticker)
+            for label in missing:
+                if fmp_crisis.get(label):
+                    crisis[label] = fmp_crisis[label]
+        
+        self._phase3_fmp['crisis_performance'] = crisis
+    
+    def _phase3_fetch_xbrl(self):
+        """Build the 10Y historicals from SEC XBRL company facts, filling only what FMP left empty"""
+        facts = self.edgar.get_company_facts()
+        if facts is None:
+            print("  ⚠️  No XBRL company facts")
+            return
+        
+        years = facts.annual_table().index
+        print(f"  ✅ SEC XBRL facts: {len(years)} fiscal years" +
+              (f" ({years[0]}-{years[-1]})" if len(years) else ""))
+        xbrl = {
+            'metrics_10y': facts.calculate_10y_metrics(),
+            'crisis_performance': facts.crisis_performance()
+        }
+        source = f"{self._phase3_fmp['source']} + SEC XBRL" if self._phase3_fmp.get('source') else 'SEC XBRL'
+        self._phase3_fmp = dict(_fill_missing(self._phase3_fmp, xbrl), source=source)
+    
     def _phase4_fetch_fred(self):
         """PHASE 4: Fetch FRED data"""
         print(f"\n{'='*60}")
@@ -176,7 +280,7 @@ class DataCoordinatorV3:
             self._phase4_fred = {}
             return
         
-        treasury = self.fred.get_treasury_10y_yield()
+        treasury = self.fred.get_10y_treasury_yield()
         self._phase4_fred = {'treasury_10y': treasury}
         
         if treasury:
@@ -325,7 +429,9 @@ class DataCoordinatorV3:
         print("  [AI] Assessing complexity...")
         seg_count = context.get('segment_count', 0)
         geo_count = context.get('geographic_count', 0)
-        ai_results['complexity_score'] = self.ai.assess_business_simplicity(description, seg_count, geo_count)
+        complexity_score = self.ai.assess_business_simplicity(description, seg_count, geo_count)
+        if complexity_score is not None:  # unparseable replies leave the key out
+            ai_results['complexity_score'] = complexity_score
         
         # Demand type
         print("  [AI] Classifying demand type...")
@@ -355,7 +461,7 @@ class DataCoordinatorV3:
             context['segment_count'] = 0
             context['segments'] = []
         
-        context['geographic_count'] = 0  # Would extract from Edgar
+        context['geographic_count'] = geographic_count(self._phase2_edgar)
         
         # From Phase 3 (FMP) or Phase 5 (Yahoo fallback)
         metrics = self._phase3_fmp.get('metrics_10y', {}) if self._phase3_fmp else {}
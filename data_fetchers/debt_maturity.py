@@ -0,0 +1,75 @@
+"""
+Debt Maturity Ladder - scheduled principal repayments from companyfacts
+The long-term debt maturity table every 10-K discloses is tagged as
+LongTermDebtMaturitiesRepaymentsOfPrincipal* (next twelve months, years two to five,
+after year five), so the ladder is a filter and a pivot over the fact table - no HTML.
+Works per issuer, or for the whole universe in one pass with a `ticker` column.
+"""
+from typing import Dict, Optional
+import pandas as pd
+from data_fetchers.xbrl_facts import ANNUAL_FORMS
+
+# bucket -> us-gaap concept
+MATURITY_CONCEPTS = {
+    'year_1': 'LongTermDebtMaturitiesRepaymentsOfPrincipalInNextTwelveMonths',
+    'year_2': 'LongTermDebtMaturitiesRepaymentsOfPrincipalInYearTwo',
+    'year_3': 'LongTermDebtMaturitiesRepaymentsOfPrincipalInYearThree',
+    'year_4': 'LongTermDebtMaturitiesRepaymentsOfPrincipalInYearFour',
+    'year_5': 'LongTermDebtMaturitiesRepaymentsOfPrincipalInYearFive',
+    'after_5': 'LongTermDebtMaturitiesRepaymentsOfPrincipalAfterYearFive',
+}
+
+# A ladder with fewer tagged buckets than this is a partial disclosure - not used
+MIN_BUCKETS = 3
+
+LADDER_COLUMNS = ['period_end', 'total', 'under_2y', 'years_2_5', 'over_5y',
+                  'under_2y_pct', 'years_2_5_pct', 'over_5y_pct', 'short_term_debt_pct']
+
+
+def maturity_ladders(facts: pd.DataFrame, by: Optional[str] = None) -> pd.DataFrame:
+    """
+    Latest maturity ladder per issuer from a parse_companyfacts table
+    Buckets missing from an otherwise tagged ladder count as zero. Columns: period_end,
+    total, under_2y (next two years), years_2_5 (years three to five), over_5y, their
+    shares of total (%), and short_term_debt_pct (share due in the next twelve months).
+    One row per `by` value (a single row without `by`).
+    """
+    bucket_of = {concept: bucket for bucket, concept in MATURITY_CONCEPTS.items()}
+    df = facts[facts['concept'].isin(list(bucket_of)) & (facts['taxonomy'] == 'us-gaap')
+               & (facts['unit'] == 'USD') & facts['form'].isin(ANNUAL_FORMS) & facts['val'].notna()]
+    if df.empty:
+        return pd.DataFrame(columns=LADDER_COLUMNS)
+
+    key = by or '_issuer'
+    df = df.assign(bucket=df['concept'].astype(str).map(bucket_of))
+    if not by:
+        df = df.assign(_issuer=0)
+    # Latest balance-sheet date per issuer, latest filing's value for each bucket
+    df = df[df['end'] == df.groupby(key)['end'].transform('max')]
+    df = df.sort_values('filed').drop_duplicates([key, 'bucket'], keep='last')
+    ladder = df.pivot(index=key, columns='bucket', values='val').reindex(columns=list(MATURITY_CONCEPTS))
+    ladder = ladder[ladder.notna().sum(axis=1) >= MIN_BUCKETS].fillna(0.0)
+
+    result = pd.DataFrame(index=ladder.index)
+    result['period_end'] = df.groupby(key)['end'].max().reindex(ladder.index)
+    result['under_2y'] = ladder['year_1'] + ladder['year_2']
+    result['years_2_5'] = ladder['year_3'] + ladder['year_4'] + ladder['year_5']
+    result['over_5y'] = ladder['after_5']
+    result['total'] = result['under_2y'] + result['years_2_5'] + result['over_5y']
+    result = result[result['total'] > 0]
+    for bucket in ('under_2y', 'years_2_5', 'over_5y'):
+        result[f'{bucket}_pct'] = (result[bucket] / result['total'] * 100).round(1)
+    result['short_term_debt_pct'] = (ladder['year_1'].reindex(result.index) / result['total'] * 100).round(1)
+    result.index.name = by
+    return result[LADDER_COLUMNS]
+
+
+def maturity_ladder(facts: pd.DataFrame) -> Optional[Dict]:
+    """One issuer's latest ladder as a plain dict (None when it doesn't tag one)"""
+    ladders = maturity_ladders(facts)
+    if ladders.empty:
+        return None
+    row = ladders.iloc[0]
+    ladder = {column: float(row[column]) for column in LADDER_COLUMNS if column != 'period_end'}
+    ladder['period_end'] = row['period_end'].strftime('%Y-%m-%d')
+    return ladder
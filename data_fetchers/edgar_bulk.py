@@ -0,0 +1,214 @@
+"""
+EDGAR Bulk Store - offline copy of SEC's nightly bulk archives
+  submissions.zip  - every filer's submissions JSON (plus overflow history pages)
+  companyfacts.zip - every filer's XBRL companyfacts JSON
+
+The zips are streamed member by member (never extracted to disk) into one SQLite
+file keyed by CIK, so SECEdgarFetcher can screen the whole universe without a
+single per-company request.
+"""
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import zipfile
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+BULK_URLS = {
+    'submissions': "https://www.sec.gov/Archives/edgar/daily-index/bulkdata/submissions.zip",
+    'companyfacts': "https://www.sec.gov/Archives/edgar/daily-index/xbrl/companyfacts.zip",
+}
+
+DEFAULT_DB_PATH = os.path.join(".cache", "edgar_bulk.sqlite")
+
+# A snapshot older than this is skipped (lookups fall through to live SEC requests),
+# so a stopped nightly ingest can't freeze filings and facts silently
+DEFAULT_MAX_AGE_DAYS = 3
+
+# Commit every N members - keeps the write transaction (and memory) bounded
+INGEST_BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    kind TEXT NOT NULL,          -- 'submissions' | 'companyfacts'
+    name TEXT NOT NULL,          -- member name without .json, e.g. CIK0000320193
+    body BLOB NOT NULL,          -- zstd-compressed JSON
+    PRIMARY KEY (kind, name)
+);
+CREATE TABLE IF NOT EXISTS ingests (
+    kind TEXT PRIMARY KEY,
+    source TEXT,
+    documents INTEGER,
+    ingested_at TEXT
+);
+"""
+
+
+class EdgarBulkStore:
+    """SQLite store of bulk submissions/companyfacts documents, keyed by CIK"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, max_age_days: Optional[float] = DEFAULT_MAX_AGE_DAYS):
+        self.db_path = db_path
+        self.max_age_days = max_age_days
+        self._stale_logged = set()
+        self._conn = None
+        self._lock = threading.Lock()
+        if zstandard is None:
+            raise ImportError("EDGAR bulk store needs zstandard (pip install zstandard)")
+        self._compressor = zstandard.ZstdCompressor(level=3)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    @property
+    def exists(self) -> bool:
+        return os.path.exists(self.db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ---------------------------------------------------------------- ingest
+
+    def ingest_zip(self, zip_path: str, kind: str, source: Optional[str] = None) -> int:
+        """
+        Stream every .json member of a bulk zip into the store
+        Returns the number of documents written
+        """
+        count = 0
+        with self._lock:
+            conn = self._connect()
+            with zipfile.ZipFile(zip_path) as zf:
+                batch = []
+                for info in zf.infolist():
+                    if info.is_dir() or not info.filename.endswith('.json'):
+                        continue
+                    with zf.open(info) as member:
+                        body = self._compressor.compress(member.read())
+                    name = os.path.basename(info.filename)[:-len('.json')]
+                    batch.append((kind, name, body))
+                    if len(batch) >= INGEST_BATCH_SIZE:
+                        conn.executemany("INSERT OR REPLACE INTO documents VALUES (?, ?, ?)", batch)
+                        conn.commit()
+                        count += len(batch)
+                        batch = []
+                if batch:
+                    conn.executemany("INSERT OR REPLACE INTO documents VALUES (?, ?, ?)", batch)
+                    count += len(batch)
+            conn.execute("INSERT OR REPLACE INTO ingests VALUES (?, ?, ?, ?)",
+                         (kind, source or zip_path, count, datetime.now().isoformat()))
+            conn.commit()
+        self._stale_logged.discard(kind)
+        return count
+
+    def ingest_url(self, kind: str, session=None, url: Optional[str] = None) -> int:
+        """
+        Download a bulk zip to a temporary file (zips need random access) and ingest it
+        The file is removed afterwards; nothing is extracted
+        """
+        import requests
+        url = url or BULK_URLS[kind]
+        session = session or requests.Session()
+        fd, tmp_path = tempfile.mkstemp(suffix='.zip')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                with session.get(url, stream=True, timeout=300) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
+            return self.ingest_zip(tmp_path, kind, source=url)
+        finally:
+            os.remove(tmp_path)
+
+    # ---------------------------------------------------------------- lookup
+
+    def ingested_at(self, kind: str) -> Optional[datetime]:
+        """When `kind` was last ingested (None if never)"""
+        if not self.exists:
+            return None
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT ingested_at FROM ingests WHERE kind = ?", (kind,)).fetchone()
+        return datetime.fromisoformat(row[0]) if row and row[0] else None
+
+    def is_fresh(self, kind: str) -> bool:
+        """True when `kind` was ingested within max_age_days (always, without a max age)"""
+        if self.max_age_days is None:
+            return True
+        ingested = self.ingested_at(kind)
+        if ingested is not None and datetime.now() - ingested <= timedelta(days=self.max_age_days):
+            return True
+        if kind not in self._stale_logged:
+            self._stale_logged.add(kind)
+            age = f"{(datetime.now() - ingested).days} days old" if ingested else "never ingested"
+            print(f"  ⚠️  EDGAR bulk {kind} snapshot is {age} (max {self.max_age_days}) - "
+                  f"using live SEC requests; re-run ingest_edgar_bulk.py")
+        return False
+
+    def get(self, kind: str, name: str) -> Optional[Dict]:
+        """Parsed JSON document, or None when the store doesn't have it or its snapshot is stale"""
+        if not self.exists or not self.is_fresh(kind):
+            return None
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT body FROM documents WHERE kind = ? AND name = ?", (kind, name)).fetchone()
+        if row is None:
+            return None
+        return json.loads(self._decompressor.decompress(row[0]))
+
+    def get_submissions(self, cik: str) -> Optional[Dict]:
+        return self.get('submissions', f"CIK{str(cik).zfill(10)}")
+
+    def get_submissions_page(self, name: str) -> Optional[Dict]:
+        """Overflow history page, e.g. 'CIK0000320193-submissions-001.json'"""
+        return self.get('submissions', name[:-len('.json')] if name.endswith('.json') else name)
+
+    def get_companyfacts(self, cik: str) -> Optional[Dict]:
+        return self.get('companyfacts', f"CIK{str(cik).zfill(10)}")
+
+    def status(self) -> Dict:
+        """Per-kind document counts and last ingest time"""
+        if not self.exists:
+            return {}
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT kind, source, documents, ingested_at FROM ingests").fetchall()
+        return {kind: {'source': source, 'documents': documents, 'ingested_at': ingested_at}
+                for kind, source, documents, ingested_at in rows}
+
+
+_STORE = None
+
+
+def get_bulk_store() -> Optional[EdgarBulkStore]:
+    """Shared store from config.EDGAR_BULK_DB, or None when bulk data isn't ingested"""
+    global _STORE
+    if zstandard is None:
+        return None  # Optional dependency - fetchers fall back to per-company HTTP
+    if _STORE is None:
+        try:
+            import config
+            db_path = getattr(config, 'EDGAR_BULK_DB', DEFAULT_DB_PATH)
+            max_age_days = getattr(config, 'EDGAR_BULK_MAX_AGE_DAYS', DEFAULT_MAX_AGE_DAYS)
+        except ImportError:
+            db_path = DEFAULT_DB_PATH
+            max_age_days = DEFAULT_MAX_AGE_DAYS
+        if not db_path:
+            return None
+        _STORE = EdgarBulkStore(db_path, max_age_days)
+    return _STORE if _STORE.exists else None
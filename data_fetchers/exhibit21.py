@@ -0,0 +1,114 @@
+"""
+Exhibit 21 Parser - subsidiary jurisdictions as a cheap geographic-footprint metric
+EX-21 (subsidiaries of the registrant) is a few kilobytes listed in the 10-K's filing
+index. Each subsidiary line's jurisdiction is matched against one precompiled
+alternation of countries, US states and common aliases; the last match on a line
+wins, since jurisdictions follow the subsidiary name.
+"""
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+# Bump when matching rules change - invalidates cached footprints
+EXHIBIT21_VERSION = 1
+
+# 'aapl-20240928xex21.htm', 'ex-21.htm', 'exhibit211.htm', 'ex21_1.htm'
+EX21_NAME = re.compile(r'ex(?:hibit)?[-_.]?21(?:[-_.]?0?1)?(?![0-9])[^/]*\.(?:htm|html|txt)$', re.IGNORECASE)
+
+US_STATES = [
+    'Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado', 'Connecticut', 'Delaware',
+    'District of Columbia', 'Florida', 'Georgia', 'Hawaii', 'Idaho', 'Illinois', 'Indiana', 'Iowa',
+    'Kansas', 'Kentucky', 'Louisiana', 'Maine', 'Maryland', 'Massachusetts', 'Michigan', 'Minnesota',
+    'Mississippi', 'Missouri', 'Montana', 'Nebraska', 'Nevada', 'New Hampshire', 'New Jersey',
+    'New Mexico', 'New York', 'North Carolina', 'North Dakota', 'Ohio', 'Oklahoma', 'Oregon',
+    'Pennsylvania', 'Rhode Island', 'South Carolina', 'South Dakota', 'Tennessee', 'Texas', 'Utah',
+    'Vermont', 'Virginia', 'Washington', 'West Virginia', 'Wisconsin', 'Wyoming', 'Puerto Rico',
+    'United States', 'United States of America', 'U.S.A.', 'USA', 'U.S.',
+]
+
+COUNTRIES = [
+    'Algeria', 'Argentina', 'Armenia', 'Australia', 'Austria', 'Azerbaijan', 'Bahamas', 'Bahrain',
+    'Bangladesh', 'Barbados', 'Belarus', 'Belgium', 'Belize', 'Bermuda', 'Bolivia', 'Bosnia and Herzegovina',
+    'Botswana', 'Brazil', 'British Virgin Islands', 'Brunei', 'Bulgaria', 'Cambodia', 'Cameroon', 'Canada',
+    'Cayman Islands', 'Chile', 'China', 'Colombia', 'Costa Rica', 'Croatia', 'Curacao', 'Cyprus',
+    'Czech Republic', 'Denmark', 'Dominican Republic', 'Ecuador', 'Egypt', 'El Salvador', 'Estonia',
+    'Ethiopia', 'Fiji', 'Finland', 'France', 'Germany', 'Ghana', 'Gibraltar', 'Greece', 'Guam',
+    'Guatemala', 'Guernsey', 'Honduras', 'Hong Kong', 'Hungary', 'Iceland', 'India', 'Indonesia',
+    'Iraq', 'Ireland', 'Isle of Man', 'Israel', 'Italy', 'Ivory Coast', 'Jamaica', 'Japan', 'Jersey',
+    'Jordan', 'Kazakhstan', 'Kenya', 'Korea', 'Kuwait', 'Latvia', 'Lebanon', 'Liechtenstein', 'Lithuania',
+    'Luxembourg', 'Macau', 'Malaysia', 'Malta', 'Marshall Islands', 'Mauritius', 'Mexico', 'Moldova',
+    'Monaco', 'Mongolia', 'Morocco', 'Mozambique', 'Myanmar', 'Namibia', 'Netherlands',
+    'Netherlands Antilles', 'New Zealand', 'Nicaragua', 'Nigeria', 'Norway', 'Oman', 'Pakistan',
+    'Panama', 'Papua New Guinea', 'Paraguay', 'Peru', 'Philippines', 'Poland', 'Portugal', 'Qatar',
+    'Romania', 'Russia', 'Saudi Arabia', 'Senegal', 'Serbia', 'Singapore', 'Slovakia', 'Slovenia',
+    'South Africa', 'Spain', 'Sri Lanka', 'Sweden', 'Switzerland', 'Taiwan', 'Tanzania', 'Thailand',
+    'Trinidad and Tobago', 'Tunisia', 'Turkey', 'Uganda', 'Ukraine', 'United Arab Emirates',
+    'United Kingdom', 'Uruguay', 'Uzbekistan', 'Venezuela', 'Vietnam', 'Zambia', 'Zimbabwe',
+]
+
+# alias -> country
+ALIASES = {
+    'England': 'United Kingdom', 'England and Wales': 'United Kingdom', 'Scotland': 'United Kingdom',
+    'Wales': 'United Kingdom', 'Northern Ireland': 'United Kingdom', 'U.K.': 'United Kingdom',
+    'UK': 'United Kingdom', 'Great Britain': 'United Kingdom',
+    "People's Republic of China": 'China', 'PRC': 'China', 'P.R.C.': 'China',
+    'Republic of Korea': 'Korea', 'South Korea': 'Korea',
+    'The Netherlands': 'Netherlands', 'Holland': 'Netherlands',
+    'Russian Federation': 'Russia', 'Türkiye': 'Turkey', 'Viet Nam': 'Vietnam',
+    'UAE': 'United Arab Emirates', 'Dubai': 'United Arab Emirates', 'Abu Dhabi': 'United Arab Emirates',
+    "Cote d'Ivoire": 'Ivory Coast', 'Virgin Islands (British)': 'British Virgin Islands', 'BVI': 'British Virgin Islands',
+    'Cayman': 'Cayman Islands', 'Grand Cayman': 'Cayman Islands', 'Macao': 'Macau',
+    'Czechia': 'Czech Republic', 'Slovak Republic': 'Slovakia', 'Republic of Ireland': 'Ireland',
+    'Quebec': 'Canada', 'Ontario': 'Canada', 'British Columbia': 'Canada', 'Alberta': 'Canada',
+    'Nova Scotia': 'Canada', 'Manitoba': 'Canada', 'New Brunswick': 'Canada', 'Saskatchewan': 'Canada',
+    'New South Wales': 'Australia', 'Queensland': 'Australia',
+}
+ALIASES.update({state: 'United States' for state in US_STATES})
+ALIASES.update({country: country for country in COUNTRIES})
+
+# Low-tax holding jurisdictions - many subsidiaries there add structural complexity
+OFFSHORE = {'Bermuda', 'Cayman Islands', 'British Virgin Islands', 'Bahamas', 'Jersey', 'Guernsey',
+            'Isle of Man', 'Mauritius', 'Marshall Islands', 'Gibraltar', 'Curacao', 'Netherlands Antilles',
+            'Panama', 'Barbados', 'Liechtenstein', 'Monaco', 'Luxembourg'}
+
+# Longest names first so 'New Jersey' beats 'Jersey' and 'Northern Ireland' beats 'Ireland'
+JURISDICTION = re.compile(
+    r'(?<![A-Za-z])(' + '|'.join(re.escape(name) for name in sorted(ALIASES, key=len, reverse=True)) + r')(?![A-Za-z])')
+
+# Subsidiary list lines are short; longer lines are boilerplate paragraphs
+MAX_LINE_CHARS = 300
+
+
+def find_exhibit21(index_items: List[Dict]) -> Optional[str]:
+    """EX-21 document name from a filing's index.json items"""
+    names = [item.get('name', '') for item in index_items if EX21_NAME.search(item.get('name', ''))]
+    return min(names, key=len) if names else None
+
+
+def parse_exhibit21(text: str) -> Dict:
+    """
+    Jurisdiction footprint from EX-21 visible text
+    Returns subsidiary_count (lines with a jurisdiction), country_count, countries
+    (name, count, pct - most subsidiaries first), us_pct, offshore_count and foreign_count.
+    """
+    counts = Counter()
+    for line in text.splitlines():
+        if len(line) > MAX_LINE_CHARS:
+            continue
+        matches = JURISDICTION.findall(line)
+        if matches:
+            counts[ALIASES[matches[-1]]] += 1
+
+    total = sum(counts.values())
+    if not total:
+        return {}
+    countries = [{'name': name, 'count': count, 'pct': round(count / total * 100, 1)}
+                 for name, count in counts.most_common()]
+    return {
+        'subsidiary_count': total,
+        'country_count': len(counts),
+        'countries': countries,
+        'us_pct': round(counts.get('United States', 0) / total * 100, 1),
+        'foreign_count': len([c for c in counts if c != 'United States']),
+        'offshore_count': sum(count for name, count in counts.items() if name in OFFSHORE),
+    }
@@ -0,0 +1,190 @@
+"""
+Filing Text Parser - streaming, section-bounded visible text from EDGAR HTML filings
+Built on html.parser so documents are consumed chunk by chunk as they download:
+only the wanted Item sections are kept, and parsing stops as soon as the caller
+has what it needs (or the last wanted section has been read).
+"""
+import re
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterable, Optional
+
+# Bump when section splitting changes - invalidates cached extraction results
+TEXT_PARSER_VERSION = 1
+
+# 10-K Item order, used to tell when every wanted section is behind us
+ITEM_ORDER = ['1', '1a', '1b', '1c', '2', '3', '4', '5', '6', '7', '7a', '8',
+              '9', '9a', '9b', '9c', '10', '11', '12', '13', '14', '15', '16']
+
+# 'Item 1. Business', 'ITEM 7A: Quantitative...', 'Item 1A - Risk Factors'
+ITEM_HEADING = re.compile(r'^item\s*(\d{1,2}[a-c]?)\s*[\.:\-–—]?(?:\s|$)', re.IGNORECASE)
+
+# Headings are short lines; longer lines that start with 'Item' are cross-references
+MAX_HEADING_CHARS = 150
+
+# Table-of-contents entries also look like headings; a section needs this much text to count
+MIN_SECTION_CHARS = 2000
+
+# Visible text kept for documents without recognizable Item headings
+FALLBACK_CHARS = 300_000
+
+BLOCK_TAGS = {'p', 'div', 'br', 'tr', 'li', 'table', 'title', 'center',
+              'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+CELL_TAGS = {'td', 'th'}
+SKIP_TAGS = {'script', 'style', 'head', 'ix:header'}
+
+
+class VisibleTextParser(HTMLParser):
+    """
+    Incremental HTML -> visible text, one line per block element
+    Subclasses receive each finished line through _emit_line(); this base keeps them all.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.done = False
+        self.chars_seen = 0
+        self.lines = []
+        self._line = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip += 1
+        elif tag in BLOCK_TAGS:
+            self._end_line()
+        elif tag in CELL_TAGS:
+            self._line.append(' ')
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in BLOCK_TAGS:
+            self._end_line()
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+        elif tag in BLOCK_TAGS:
+            self._end_line()
+        elif tag in CELL_TAGS:
+            self._line.append(' ')
+
+    def handle_data(self, data):
+        if not self._skip and not self.done:
+            self._line.append(data)
+
+    def feed(self, data: str):
+        if not self.done:
+            super().feed(data)
+
+    def close(self):
+        if not self.done:
+            super().close()
+            self._end_line()
+
+    def _end_line(self):
+        if not self._line:
+            return
+        line = ' '.join(''.join(self._line).split())
+        self._line = []
+        if not line or self.done:
+            return
+        self.chars_seen += len(line)
+        self._emit_line(line)
+
+    def _emit_line(self, line: str):
+        self.lines.append(line)
+
+    @property
+    def text(self) -> str:
+        return '\n'.join(self.lines)
+
+
+class SectionTextParser(VisibleTextParser):
+    """
+    Incremental HTML -> text for the wanted Item sections of a filing
+
+    Args:
+        sections: Item numbers to keep, e.g. ('1', '7', '8')
+        on_section: Called as on_section(item, text) when a wanted section ends;
+            returning True means the caller is satisfied and parsing stops
+    Feed chunks with feed(); check .done to stop reading early; call close() at the end.
+    """
+
+    def __init__(self, sections: Iterable[str], on_section: Optional[Callable[[str, str], bool]] = None):
+        super().__init__()
+        self.wanted = {s.lower() for s in sections}
+        self.on_section = on_section
+        self.sections: Dict[str, str] = {}
+
+        self._last_wanted = max(ITEM_ORDER.index(s) for s in self.wanted if s in ITEM_ORDER)
+        self._current = None
+        self._buffer = []
+        self._fallback = []
+        self._fallback_chars = 0
+
+    def close(self):
+        if not self.done:
+            super().close()
+            self._close_section()
+        if not self.sections and self._fallback:
+            # No Item headings at all (unusual layouts) - expose the leading text instead
+            self.sections['all'] = '\n'.join(self._fallback)
+
+    def _emit_line(self, line: str):
+        if len(line) <= MAX_HEADING_CHARS:
+            match = ITEM_HEADING.match(line)
+            if match and match.group(1).lower() in ITEM_ORDER:
+                self._start_section(match.group(1).lower())
+                return
+
+        if self._current in self.wanted:
+            self._buffer.append(line)
+        if self._fallback_chars < FALLBACK_CHARS:
+            self._fallback.append(line)
+            self._fallback_chars += len(line)
+
+    def _start_section(self, item: str):
+        self._close_section()
+        if self.done:
+            return
+        self._current = item
+
+        # Past the last wanted Item with every wanted section read -> nothing left for us
+        if ITEM_ORDER.index(item) > self._last_wanted and self._have_all_sections():
+            self.done = True
+
+    def _have_all_sections(self) -> bool:
+        return all(len(self.sections.get(s, '')) >= MIN_SECTION_CHARS for s in self.wanted)
+
+    def _close_section(self):
+        item, lines = self._current, self._buffer
+        self._buffer = []
+        if item not in self.wanted or not lines:
+            return
+        text = '\n'.join(lines)
+        # The table of contents opens every section once; keep the substantive occurrence
+        if len(text) <= len(self.sections.get(item, '')):
+            return
+        self.sections[item] = text
+        if self.on_section and len(text) >= MIN_SECTION_CHARS and self.on_section(item, text):
+            self.done = True
+
+
+def visible_text(html: str) -> str:
+    """Visible text of an in-memory document, one line per block element"""
+    parser = VisibleTextParser()
+    parser.feed(html)
+    parser.close()
+    return parser.text
+
+
+def parse_sections(html: str, sections: Iterable[str],
+                   on_section: Optional[Callable[[str, str], bool]] = None,
+                   chunk_chars: int = 1 << 20) -> Dict[str, str]:
+    """Section text from an in-memory document, fed in chunks so early stops still save work"""
+    parser = SectionTextParser(sections, on_section)
+    for start in range(0, len(html), chunk_chars):
+        parser.feed(html[start:start + chunk_chars])
+        if parser.done:
+            break
+    parser.close()
+    return parser.sections
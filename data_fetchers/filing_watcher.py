@@ -0,0 +1,212 @@
+"""
+Filing Watcher - find which companies filed something new and queue only them
+Keeps a per-CIK high-water mark (latest accession seen) and polls either
+  - each company's submissions feed (conditional GET - an unchanged filer costs a 304), or
+  - SEC's daily master index (one request per business day for the whole universe)
+New filings enqueue the affected ticker with the phases that filing type can change,
+and drop the cache entries those phases would otherwise serve stale.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+from data_fetchers.utils import cache_data, load_cached_data, delete_cached_data, get_cache_backend
+from data_fetchers.cache_metrics import record_network
+from data_fetchers.security_master import get_security_master
+
+DAILY_INDEX_URL = "https://www.sec.gov/Archives/edgar/daily-index/{year}/QTR{quarter}/master.{date}.idx"
+
+WATCH_STATE_KEY = "watch_state"
+WATCH_QUEUE_KEY = "watch_queue"
+STATE_MAX_AGE_DAYS = 3650
+
+# First daily-index poll looks back this far
+DEFAULT_LOOKBACK_DAYS = 3
+
+# Which coordinator phases a new filing of each form can change
+FORM_PHASES = {
+    '10-K': ('edgar', 'fmp', 'yahoo', 'ai'),
+    '10-K/A': ('edgar', 'fmp', 'yahoo', 'ai'),
+    '20-F': ('edgar', 'fmp', 'yahoo', 'ai'),
+    '40-F': ('edgar', 'fmp', 'yahoo', 'ai'),
+    '10-Q': ('fmp', 'yahoo'),
+    '10-Q/A': ('fmp', 'yahoo'),
+    '8-K': ('edgar',),      # Item 4.02 restatements, officer changes
+    '8-K/A': ('edgar',),
+    'DEF 14A': ('edgar',),  # Executives, compensation
+    '4': ('insider',),
+}
+
+# Cache entries a phase reads that would otherwise be served stale after a filing
+# (Edgar archives are per accession and AI memos are content-addressed - nothing to drop).
+# Edgar keys carry the CIK rather than the ticker.
+PHASE_CACHE_PREFIXES = {
+    'edgar': ('sec_submissions_', 'sec_companyfacts_', 'neg_sec_companyfacts_'),
+    'fmp': ('fmp_', 'neg_fmp_'),
+    'yahoo': ('yf_info_', 'yf_income_', 'yf_balance_', 'yf_cashflow_'),
+}
+
+
+def _key_mentions(key: str, identifier: str) -> bool:
+    return key.endswith(f"_{identifier}") or f"_{identifier}_" in key
+
+
+class FilingWatcher:
+    """High-water marks, recompute queue and cache invalidation for a ticker universe"""
+
+    def __init__(self, tickers: Iterable[str], master=None):
+        self.master = master or get_security_master()
+        self.tickers = {}  # cik -> ticker
+        for ticker in tickers:
+            cik = self.master.cik(ticker)
+            if cik:
+                self.tickers[cik] = ticker
+        self.state = load_cached_data(WATCH_STATE_KEY, max_age_days=STATE_MAX_AGE_DAYS) or {
+            'last_index_date': None, 'ciks': {}
+        }
+        self.queue = load_cached_data(WATCH_QUEUE_KEY, max_age_days=STATE_MAX_AGE_DAYS) or {}
+
+    def save(self):
+        cache_data(WATCH_STATE_KEY, self.state)
+        cache_data(WATCH_QUEUE_KEY, self.queue)
+
+    # ---------------------------------------------------------------- polling
+
+    def poll_submissions(self) -> List[Dict]:
+        """Check every company's submissions feed against its high-water mark"""
+        from data_fetchers.sec_edgar import SECEdgarFetcher
+
+        new_filings = []
+        for cik, ticker in self.tickers.items():
+            edgar = SECEdgarFetcher(cik, use_bulk=False)  # The nightly bulk copy can lag - poll the live feed
+            mark = self.state['ciks'].get(cik)
+            try:
+                filings = []
+                for filing in edgar.iter_filings(since=mark['filing_date'] if mark else None,
+                                                 include_history=False):
+                    if mark and filing['accession_number'] == mark['accession_number']:
+                        break
+                    filings.append(filing)
+                    if not mark:
+                        break  # First sighting - just set the baseline
+            except Exception as e:
+                print(f"  ⚠️  {ticker}: {e}")
+                continue
+
+            if filings:
+                self._advance(cik, filings[0])
+            if mark:
+                for filing in reversed(filings):
+                    new_filings.append(self._enqueue(cik, filing))
+        return new_filings
+
+    def poll_daily_index(self, session=None, until: Optional[datetime] = None) -> List[Dict]:
+        """Scan SEC's daily master index for every day since the last poll"""
+        from data_fetchers.rate_limit import sec_session
+        from data_fetchers.sec_edgar import SEC_USER_AGENT
+
+        if session is None:
+            session = sec_session()
+            session.headers.update({'User-Agent': SEC_USER_AGENT, 'Accept-Encoding': 'gzip, deflate'})
+
+        until = until or datetime.now()
+        last = self.state.get('last_index_date')
+        day = (datetime.strptime(last, '%Y-%m-%d') + timedelta(days=1)) if last \
+            else until - timedelta(days=DEFAULT_LOOKBACK_DAYS)
+
+        new_filings = []
+        while day.date() <= until.date():
+            if day.weekday() < 5:
+                rows = self._fetch_daily_index(session, day)
+                if rows is None:
+                    break  # Today's index isn't published yet - resume here next time
+                for filing in rows:
+                    cik = filing.pop('cik')
+                    if cik in self.tickers:
+                        mark = self.state['ciks'].get(cik)
+                        if mark and (filing['filing_date'] < mark['filing_date']
+                                     or filing['accession_number'] == mark['accession_number']):
+                            continue  # Already seen through the submissions feed
+                        self._advance(cik, filing)
+                        new_filings.append(self._enqueue(cik, filing))
+            self.state['last_index_date'] = day.strftime('%Y-%m-%d')
+            day += timedelta(days=1)
+        return new_filings
+
+    def _fetch_daily_index(self, session, day: datetime) -> Optional[List[Dict]]:
+        """Rows of master.YYYYMMDD.idx; [] for holidays, None when not yet published"""
+        url = DAILY_INDEX_URL.format(year=day.year, quarter=(day.month - 1) // 3 + 1,
+                                     date=day.strftime('%Y%m%d'))
+        response = session.get(url, timeout=60)
+        record_network("sec_dailyindex", len(response.content or b''))
+        if response.status_code in (403, 404):
+            return None if day.date() >= datetime.now().date() else []
+        response.raise_for_status()
+
+        rows = []
+        in_body = False
+        for line in response.text.splitlines():
+            if line.startswith('-----'):
+                in_body = True
+                continue
+            parts = line.split('|')
+            if not in_body or len(parts) != 5:
+                continue
+            cik, _, form, date_filed, filename = parts
+            rows.append({
+                'cik': cik.strip().zfill(10),
+                'form': form.strip(),
+                'filing_date': datetime.strptime(date_filed.strip(), '%Y%m%d').strftime('%Y-%m-%d'),
+                'accession_number': filename.strip().rsplit('/', 1)[-1].replace('.txt', ''),
+                'items': '',
+            })
+        return rows
+
+    def _advance(self, cik: str, filing: Dict):
+        self.state['ciks'][cik] = {
+            'accession_number': filing['accession_number'],
+            'filing_date': filing['filing_date'],
+            'form': filing['form'],
+        }
+
+    # ---------------------------------------------------------------- queue
+
+    def _enqueue(self, cik: str, filing: Dict) -> Dict:
+        ticker = self.tickers[cik]
+        phases = FORM_PHASES.get(filing['form'], ())
+        entry = self.queue.setdefault(ticker, {'phases': [], 'filings': [], 'queued_at': None})
+        entry['phases'] = sorted(set(entry['phases']) | set(phases))
+        entry['filings'].append({k: filing.get(k) for k in ('form', 'filing_date', 'accession_number', 'items')})
+        entry['queued_at'] = datetime.now().isoformat()
+        # The nightly bulk copy predates the triggering filing - the recompute must read the live feed
+        entry['live_submissions'] = True
+        self.invalidate(ticker, phases, cik)
+        return {'ticker': ticker, 'phases': list(phases), **entry['filings'][-1]}
+
+    def invalidate(self, ticker: str, phases: Iterable[str], cik: Optional[str] = None):
+        """Drop cached entries the given phases would otherwise serve stale"""
+        identifiers = [ticker] + ([cik] if cik else [])
+        backend = get_cache_backend()
+        for phase in phases:
+            for prefix in PHASE_CACHE_PREFIXES.get(phase, ()):
+                for key in backend.keys(prefix):
+                    if any(_key_mentions(key, identifier) for identifier in identifiers):
+                        delete_cached_data(key)
+
+    def pending(self) -> Dict[str, Dict]:
+        """Queued tickers with the phases to recompute and the filings that triggered them"""
+        return {ticker: entry for ticker, entry in self.queue.items() if entry.get('phases')}
+
+    def mark_done(self, ticker: str):
+        self.queue.pop(ticker, None)
+
+
+def load_queue() -> Dict[str, Dict]:
+    """Pending recompute queue (as left by the last watcher run)"""
+    queue = load_cached_data(WATCH_QUEUE_KEY, max_age_days=STATE_MAX_AGE_DAYS) or {}
+    return {ticker: entry for ticker, entry in queue.items() if entry.get('phases')}
+
+
+def clear_from_queue(tickers: Iterable[str]):
+    queue = load_cached_data(WATCH_QUEUE_KEY, max_age_days=STATE_MAX_AGE_DAYS) or {}
+    for ticker in tickers:
+        queue.pop(ticker, None)
+    cache_data(WATCH_QUEUE_KEY, queue)
@@ -6,47 +6,87 @@ import requests
 from typing import Dict, List, Optional
 from datetime import datetime
 import statistics
+from data_fetchers.cache_metrics import record_network
+from data_fetchers.utils import (
+    cache_data, load_cached_data, cache_negative, load_negative, NEG_NOT_FOUND
+)
 
 class FMPFetcher:
     """Fetch data from Financial Modeling Prep API"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, use_cache: bool = True, max_age_days: int = 1):
         """
         Initialize FMP fetcher
         Args:
             api_key: FMP API key
+            use_cache: Cache responses on disk
+            max_age_days: How long cached responses are served
         """
         self.api_key = api_key
+        self.use_cache = use_cache
+        self.max_age_days = max_age_days
         self.base_url = "https://financialmodelingprep.com/api/v3"
         self.base_url_v4 = "https://financialmodelingprep.com/api/v4"
     
-    def _get(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
-        """Make API request"""
+    @staticmethod
+    def negative_key(endpoint: str, params: Dict = None) -> str:
+        """Negative-cache key for an endpoint (e.g. 'profile/AAPL' -> 'fmp_profile_AAPL')"""
+        key = "fmp_" + endpoint.replace('/', '_')
+        if params and params.get('symbol'):
+            key += f"_{params['symbol']}"
+        return key
+    
+    def _request(self, base_url: str, endpoint: str, params: Dict = None) -> Optional[Dict]:
+        """
+        Make API request
+        Responses are cached for max_age_days; endpoints known to 404
+        (e.g. foreign listings) are skipped via the negative cache
+        """
         if params is None:
             params = {}
+        
+        neg_key = self.negative_key(endpoint, params)
+        if load_negative(neg_key):
+            return None
+        
+        # Key on everything that shapes the response - never on the API key
+        cache_key = neg_key + ''.join(f"_{k}{v}" for k, v in sorted(params.items()) if k != 'symbol')
+        if self.use_cache:
+            cached = load_cached_data(cache_key, max_age_days=self.max_age_days)
+            if cached is not None:
+                return cached
+        
         params['apikey'] = self.api_key
         
         try:
-            response = requests.get(f"{self.base_url}/{endpoint}", params=params)
+            response = requests.get(f"{base_url}/{endpoint}", params=params)
+            record_network(cache_key, len(response.content))
+            if response.status_code == 404:
+                cache_negative(neg_key, NEG_NOT_FOUND, "HTTP 404")
+                return None
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            # FMP answers unknown symbols with 200 and an empty list
+            if data == []:
+                cache_negative(neg_key, NEG_NOT_FOUND, "empty response")
+            elif self.use_cache and data is not None:
+                cache_data(cache_key, data)
+            return data
         except Exception as e:
             print(f"FMP API error on {endpoint}: {e}")
             return None
     
+    def _get(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
+        """Make API request"""
+        return self._request(self.base_url, endpoint, params)
+    
     def _get_v4(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
         """Make API request to v4 endpoints"""
-        if params is None:
-            params = {}
-        params['apikey'] = self.api_key
-        
-        try:
-            response = requests.get(f"{self.base_url_v4}/{endpoint}", params=params)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            print(f"FMP API v4 error on {endpoint}: {e}")
-            return None
+        return self._request(self.base_url_v4, endpoint, params)
+    
+    def is_known_missing(self, ticker: str) -> bool:
+        """True if FMP has recently told us it doesn't cover this ticker"""
+        return load_negative(self.negative_key(f"profile/{ticker}")) is not None
     
     def get_company_profile(self, ticker: str) -> Optional[Dict]:
         """Get company profile with basic info"""
@@ -281,10 +321,11 @@ class FMPFetcher:
         
         return {}
     
-    def get_comprehensive_data(self, ticker: str) -> Dict:
+    def get_comprehensive_data(self, ticker: str, include_crisis: bool = True) -> Dict:
         """
         Get all FMP data for a ticker
         This is the main method to call
+        include_crisis=False skips the 20Y income statement fetch (SEC frames cover it)
         """
         print(f"\nFetching FMP data for {ticker}...")
         print("="*60)
@@ -316,8 +357,9 @@ class FMPFetcher:
         data['metrics_10y'] = metrics
         
         # Crisis performance
-        crisis = self.get_crisis_performance(ticker)
-        data['crisis_performance'] = crisis
+        if include_crisis:
+            crisis = self.get_crisis_performance(ticker)
+            data['crisis_performance'] = crisis
         
         # Shares change
         shares = self.get_shares_outstanding_change(ticker)
@@ -0,0 +1,60 @@
+"""
+HTTP caching helpers for Buffett Screener
+Conditional requests (ETag / If-Modified-Since) backed by the utils cache
+"""
+from typing import Dict, Optional
+from data_fetchers.utils import cache_data, load_cached_data
+from data_fetchers.cache_metrics import METRICS, record_network, split_cache_key
+
+# Validators don't go stale on our side - the server decides with 304 vs 200
+VALIDATOR_MAX_AGE_DAYS = 3650
+
+
+def conditional_get(session, url: str, cache_key: str, params: Optional[Dict] = None,
+                    as_json: bool = True, timeout: int = 30):
+    """
+    GET a resource, revalidating any cached copy with the server
+
+    Sends If-None-Match / If-Modified-Since when validators are cached.
+    A 304 response is answered from the cache, so an unchanged resource
+    costs a few hundred bytes instead of the full body.
+
+    Args:
+        session: requests.Session (carries source-specific headers)
+        url: Resource URL
+        cache_key: Cache key for body + validators (must not contain secrets)
+        params: Query parameters
+        as_json: Parse body as JSON (otherwise return text)
+    Returns:
+        Parsed JSON or text body. Raises on HTTP errors like session.get would.
+    """
+    cached = load_cached_data(cache_key, max_age_days=VALIDATOR_MAX_AGE_DAYS)
+
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    response = session.get(url, params=params, headers=headers, timeout=timeout)
+    record_network(cache_key, len(response.content or b''))
+
+    if response.status_code == 304 and cached:
+        METRICS.record(*split_cache_key(cache_key), 'revalidated')
+        return cached['body']
+
+    response.raise_for_status()
+    body = response.json() if as_json else response.text
+
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        cache_data(cache_key, {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'body': body
+        })
+
+    return body
@@ -0,0 +1,201 @@
+"""
+Insider Trades - Form 4 transactions, ingested incrementally by accession
+Each company's Form 4s are listed from its submissions feed; only accessions not yet
+seen are downloaded, and each XML is read with a streaming parser (iterparse) straight
+off the response. Transactions are kept as one columnar DataFrame per company
+(Arrow IPC in the cache), so aggregates are plain vectorized pandas.
+"""
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import pandas as pd
+from data_fetchers.cache_metrics import record_network
+from data_fetchers.utils import cache_data, load_cached_data
+
+# Bump when parsing or columns change - older stores are rebuilt from scratch
+FORM4_STORE_VERSION = 1
+
+# Transactions are kept this far back; aggregates look at the last 12 months
+INSIDER_LOOKBACK_DAYS = 2 * 365
+AGGREGATE_MONTHS = 12
+
+STORE_MAX_AGE_DAYS = 3650
+
+# Open-market purchase / sale - the codes that signal conviction (grants, exercises
+# and tax withholding are compensation mechanics)
+BUY_CODE, SELL_CODE = 'P', 'S'
+
+COLUMNS = ['accession', 'filing_date', 'owner_cik', 'owner_name', 'is_director', 'is_officer',
+           'officer_title', 'transaction_date', 'code', 'acquired', 'shares', 'price', 'shares_after']
+
+
+def _store_key(cik: str) -> str:
+    return f"sec_form4_v{FORM4_STORE_VERSION}_{cik}"
+
+
+def _seen_key(cik: str) -> str:
+    return f"sec_form4seen_v{FORM4_STORE_VERSION}_{cik}"
+
+
+def _flag(value: Optional[str]) -> bool:
+    return (value or '').strip().lower() in ('1', 'true')
+
+
+def _number(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_form4(source) -> List[Dict]:
+    """
+    Non-derivative transactions from one Form 4 XML (path or file-like), streamed
+    Elements are cleared as soon as each transaction is read, so memory stays flat.
+    """
+    owner = {}
+    rows = []
+    for _, element in ET.iterparse(source, events=('end',)):
+        tag = element.tag
+        if tag == 'reportingOwner' and not owner:
+            # Joint filings list several owners; the first is the reporting insider
+            owner = {
+                'owner_cik': element.findtext('reportingOwnerId/rptOwnerCik', '').strip(),
+                'owner_name': element.findtext('reportingOwnerId/rptOwnerName', '').strip(),
+                'is_director': _flag(element.findtext('reportingOwnerRelationship/isDirector')),
+                'is_officer': _flag(element.findtext('reportingOwnerRelationship/isOfficer')),
+                'officer_title': element.findtext('reportingOwnerRelationship/officerTitle', '').strip(),
+            }
+            element.clear()
+        elif tag == 'nonDerivativeTransaction':
+            rows.append({
+                'transaction_date': element.findtext('transactionDate/value', '').strip()[:10],
+                'code': element.findtext('transactionCoding/transactionCode', '').strip(),
+                'acquired': element.findtext('transactionAmounts/transactionAcquiredDisposedCode/value', '').strip() == 'A',
+                'shares': _number(element.findtext('transactionAmounts/transactionShares/value')),
+                'price': _number(element.findtext('transactionAmounts/transactionPricePerShare/value')),
+                'shares_after': _number(element.findtext('postTransactionAmounts/sharesOwnedFollowingTransaction/value')),
+            })
+            element.clear()
+        elif tag in ('derivativeTable', 'footnotes'):
+            element.clear()
+    return [{**owner, **row} for row in rows]
+
+
+def _to_frame(rows: List[Dict]) -> pd.DataFrame:
+    frame = pd.DataFrame(rows, columns=COLUMNS)
+    frame['transaction_date'] = pd.to_datetime(frame['transaction_date'], errors='coerce')
+    frame['filing_date'] = pd.to_datetime(frame['filing_date'], errors='coerce')
+    for column in ('shares', 'price', 'shares_after'):
+        frame[column] = frame[column].astype('float64')
+    for column in ('is_director', 'is_officer', 'acquired'):
+        frame[column] = frame[column].astype(bool)
+    return frame
+
+
+class InsiderTrades:
+    """Form 4 store for one company, updated incrementally through its SECEdgarFetcher"""
+
+    def __init__(self, edgar):
+        self.edgar = edgar
+        self.cik = edgar.cik
+
+    def load(self) -> pd.DataFrame:
+        frame = load_cached_data(_store_key(self.cik), max_age_days=STORE_MAX_AGE_DAYS)
+        return frame if isinstance(frame, pd.DataFrame) else _to_frame([])
+
+    def update(self, lookback_days: int = INSIDER_LOOKBACK_DAYS) -> pd.DataFrame:
+        """Download and parse only Form 4s not yet in the store; returns the whole store"""
+        since = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        seen = set(load_cached_data(_seen_key(self.cik), max_age_days=STORE_MAX_AGE_DAYS) or [])
+
+        new_filings = [f for f in self.edgar.iter_filings(since=since)
+                       if f['form'] == '4' and f['accession_number'] not in seen]
+        frame = self.load()
+        if not new_filings:
+            return frame
+
+        rows = []
+        for filing in new_filings:
+            try:
+                for row in self._fetch_transactions(filing):
+                    rows.append({**row, 'accession': filing['accession_number'],
+                                 'filing_date': filing['filing_date']})
+                seen.add(filing['accession_number'])
+            except Exception as e:
+                # Not marked seen - retried on the next update
+                print(f"  ⚠️  Form 4 {filing['accession_number']}: {e}")
+
+        if rows:
+            frame = pd.concat([frame, _to_frame(rows)], ignore_index=True) if len(frame) else _to_frame(rows)
+        cutoff = pd.Timestamp(since)
+        frame = frame[frame['filing_date'] >= cutoff].reset_index(drop=True)
+        cache_data(_store_key(self.cik), frame)
+        cache_data(_seen_key(self.cik), sorted(seen))
+        return frame
+
+    def _fetch_transactions(self, filing: Dict) -> List[Dict]:
+        # primaryDocument points at the XSL rendering ('xslF345X05/form4.xml'); the raw XML is its basename
+        document = (filing.get('primary_document') or '').rsplit('/', 1)[-1]
+        if not document.endswith('.xml'):
+            return []
+        url = filing['url'] + document
+        with self.edgar.session.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            rows = parse_form4(response.raw)
+            record_network(f"sec_form4_{self.cik}", int(response.headers.get('Content-Length') or 0))
+        return rows
+
+
+def insider_aggregates(transactions: pd.DataFrame, as_of: Optional[datetime] = None,
+                       months: int = AGGREGATE_MONTHS, by: Optional[str] = None) -> pd.DataFrame:
+    """
+    Open-market insider activity over the trailing window, one row per group
+    Pass a concatenated universe frame with `by='ticker'` (or any key column) to
+    aggregate every company in one groupby; without `by` the result has one row.
+    Columns: buy_count, sell_count, buyers, sellers, buy_value, sell_value,
+    net_buying_value, net_shares
+    """
+    as_of = pd.Timestamp(as_of or datetime.now())
+    window = transactions[(transactions['transaction_date'] > as_of - pd.DateOffset(months=months))
+                          & (transactions['transaction_date'] <= as_of)
+                          & transactions['code'].isin([BUY_CODE, SELL_CODE])]
+    is_buy = window['code'] == BUY_CODE
+    value = window['shares'].fillna(0) * window['price'].fillna(0)
+    frame = pd.DataFrame({
+        'key': window[by] if by else 0,
+        'buy': is_buy,
+        'sell': ~is_buy,
+        'buy_value': value.where(is_buy, 0.0),
+        'sell_value': value.where(~is_buy, 0.0),
+        'net_shares': window['shares'].fillna(0).where(is_buy, -window['shares'].fillna(0)),
+        'buyer': window['owner_cik'].where(is_buy),
+        'seller': window['owner_cik'].where(~is_buy),
+    })
+    grouped = frame.groupby('key')
+    result = pd.DataFrame({
+        'buy_count': grouped['buy'].sum(),
+        'sell_count': grouped['sell'].sum(),
+        'buyers': grouped['buyer'].nunique(),
+        'sellers': grouped['seller'].nunique(),
+        'buy_value': grouped['buy_value'].sum(),
+        'sell_value': grouped['sell_value'].sum(),
+        'net_shares': grouped['net_shares'].sum(),
+    })
+    result['net_buying_value'] = result['buy_value'] - result['sell_value']
+    result.index.name = by
+    return result.astype({'buy_count': 'int64', 'sell_count': 'int64'})
+
+
+def insider_summary(transactions: pd.DataFrame, as_of: Optional[datetime] = None,
+                    months: int = AGGREGATE_MONTHS) -> Dict:
+    """One company's trailing open-market activity as a plain dict (zeros when there was none)"""
+    aggregates = insider_aggregates(transactions, as_of, months)
+    if aggregates.empty:
+        return {'buy_count': 0, 'sell_count': 0, 'buyers': 0, 'sellers': 0, 'buy_value': 0.0,
+                'sell_value': 0.0, 'net_shares': 0.0, 'net_buying_value': 0.0, 'months': months}
+    summary = {k: (int(v) if k in ('buy_count', 'sell_count', 'buyers', 'sellers') else float(v))
+               for k, v in aggregates.iloc[0].items()}
+    summary['months'] = months
+    return summary
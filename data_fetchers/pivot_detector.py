@@ -0,0 +1,113 @@
+"""
+Pivot Detector - year-over-year 10-K text change via MinHash signatures
+Item 1 (Business) and Item 1A (Risk Factors) are reduced to MinHash signatures over
+word shingles once per filing and persisted, so comparing consecutive years is a
+vector equality count rather than a full-text diff. A year whose similarity to the
+prior year drops well below the company's usual level is flagged as a pivot.
+"""
+import re
+from hashlib import blake2b
+from statistics import median
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+
+# Bump when shingling or hashing changes - persisted signatures are rebuilt
+PIVOT_DETECTOR_VERSION = 1
+
+PIVOT_ITEMS = ('1', '1a')
+
+SHINGLE_WORDS = 5
+NUM_PERMUTATIONS = 128
+
+# Shingles hashed per numpy block (block x NUM_PERMUTATIONS uint64 matrix)
+HASH_BLOCK = 4096
+
+# Sections shorter than this are mis-split (table-of-contents entries) - not compared
+MIN_PIVOT_CHARS = 2000
+
+# A pivot: similarity this far below the company's median, and below the ceiling
+PIVOT_DROP = 0.25
+PIVOT_MAX_SIMILARITY = 0.5
+# With too few years for a median, only an absolute collapse counts
+PIVOT_FLOOR = 0.2
+MIN_YEARS_FOR_MEDIAN = 3
+
+# Numbers are skipped so changed figures and years don't read as changed business
+WORD = re.compile(r"[a-z][a-z'\-]+")
+
+# Fixed-seed multiply-shift hash family: h(x) = ((a * x + b) mod 2^64) >> 32, a odd
+_rng = np.random.RandomState(20240101)
+_A = (_rng.randint(0, 2 ** 62, NUM_PERMUTATIONS, dtype=np.int64).astype(np.uint64) << np.uint64(1)) | np.uint64(1)
+_B = _rng.randint(0, 2 ** 62, NUM_PERMUTATIONS, dtype=np.int64).astype(np.uint64)
+_SHIFT = np.uint64(32)
+_EMPTY = np.iinfo(np.uint32).max
+
+
+def shingles(text: str, size: int = SHINGLE_WORDS) -> set:
+    words = WORD.findall(text.lower())
+    return {' '.join(words[i:i + size]) for i in range(max(0, len(words) - size + 1))}
+
+
+def minhash(text: str) -> List[int]:
+    """MinHash signature (NUM_PERMUTATIONS 32-bit values) of a text's word shingles"""
+    hashes = np.fromiter((int.from_bytes(blake2b(s.encode(), digest_size=8).digest(), 'little')
+                          for s in shingles(text)), dtype=np.uint64)
+    signature = np.full(NUM_PERMUTATIONS, _EMPTY, dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for start in range(0, len(hashes), HASH_BLOCK):
+            block = hashes[start:start + HASH_BLOCK, None]
+            signature = np.minimum(signature, ((block * _A + _B) >> _SHIFT).min(axis=0))
+    return signature.tolist()
+
+
+def similarity(first: List[int], second: List[int]) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures"""
+    return float(np.mean(np.asarray(first) == np.asarray(second)))
+
+
+def section_signatures(sections: Dict[str, str], items: Iterable[str] = PIVOT_ITEMS) -> Dict[str, List[int]]:
+    """{item: signature} for the wanted items long enough to compare"""
+    return {item: minhash(sections[item]) for item in items
+            if len(sections.get(item) or '') >= MIN_PIVOT_CHARS}
+
+
+def find_pivots(years: List[Dict]) -> Dict:
+    """
+    Flag sharp year-over-year drops in 10-K text similarity
+    `years` are oldest first, each with report_date, filing_date, accession and
+    signatures ({item: signature}). Returns years (with similarity to the prior
+    year, averaged over items both filings have), pivots, pivot_count and
+    median_similarity.
+    """
+    timeline = []
+    for previous, current in zip(years, years[1:]):
+        common = [item for item in current['signatures'] if item in previous['signatures']]
+        if not common:
+            continue
+        by_item = {item: round(similarity(previous['signatures'][item], current['signatures'][item]), 3)
+                   for item in common}
+        timeline.append({
+            'report_date': current['report_date'],
+            'filing_date': current['filing_date'],
+            'accession': current['accession'],
+            'similarity': round(sum(by_item.values()) / len(by_item), 3),
+            'items': by_item,
+        })
+
+    typical = median(y['similarity'] for y in timeline) if timeline else None
+    if typical is not None and len(timeline) >= MIN_YEARS_FOR_MEDIAN:
+        threshold = min(typical - PIVOT_DROP, PIVOT_MAX_SIMILARITY)
+    else:
+        threshold = PIVOT_FLOOR
+    pivots = [y for y in timeline if y['similarity'] < threshold]
+    return {
+        'years': timeline,
+        'pivots': pivots,
+        'pivot_count': len(pivots),
+        'median_similarity': round(typical, 3) if typical is not None else None,
+    }
+
+
+def pivot_years(result: Optional[Dict]) -> List[str]:
+    """Fiscal years ('2016') of flagged pivots"""
+    return [(p['report_date'] or p['filing_date'])[:4] for p in (result or {}).get('pivots', [])]
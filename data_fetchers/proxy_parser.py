@@ -0,0 +1,332 @@
+"""
+Proxy Parser - DEF 14A Summary Compensation Table and executive tenure
+The proxy is parsed once with lxml: the Summary Compensation Table is located by its
+column headers and read into per-officer pay (salary, bonus, stock, options, non-equity
+incentive, pension, other, total); biographies are scanned for 'CEO since YYYY'.
+Parsing is CPU-bound, so it runs on a process pool and never holds the GIL the
+network threads need.
+
+Benchmark:
+    python -m data_fetchers.proxy_parser                    # synthetic proxies
+    python -m data_fetchers.proxy_parser proxies/           # every .htm in a fixture directory
+"""
+import multiprocessing
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple
+from lxml import etree, html as lxml_html
+from data_fetchers.text_scanner import PROXY_SCANNER
+
+# Bump when table detection or column mapping changes - invalidates cached proxy results
+PROXY_PARSER_VERSION = 1
+
+# Header text -> pay component, checked in order (the first match wins)
+SCT_COLUMNS = [
+    ('other', ('all other',)),
+    ('non_equity', ('non-equity', 'non equity', 'incentive plan')),
+    ('pension', ('pension', 'nonqualified', 'non-qualified')),
+    ('stock', ('stock award',)),
+    ('option', ('option award',)),
+    ('salary', ('salary',)),
+    ('bonus', ('bonus',)),
+    ('total', ('total',)),
+    ('year', ('year',)),
+    ('name', ('name', 'position')),
+]
+PAY_FIELDS = ('salary', 'bonus', 'stock', 'option', 'non_equity', 'pension', 'other', 'total')
+
+# A table needs these header words to be the Summary Compensation Table
+SCT_REQUIRED = ('salary', 'total')
+SCT_ANY = ('stock award', 'option award', 'non-equity', 'all other')
+# ...and none of these (director compensation, grants, outstanding awards)
+SCT_EXCLUDED = ('fees earned', 'grant date', 'exercise price', 'number of securities')
+
+# Header rows are the rows before the first fiscal-year cell
+YEAR_CELL = re.compile(r'^(?:fiscal\s+)?((?:19|20)\d{2})$')
+AMOUNT = re.compile(r'\d{1,3}(?:,\d{3})+|\d+')
+FOOTNOTE = re.compile(r'\(\d{1,2}\)|\([a-z]\)')
+DASHES = {'-', '—', '–', '--', '$-', '$—', '$–'}
+
+CEO_TITLE = re.compile(r'chief\s+executive|\bceo\b', re.IGNORECASE)
+CFO_TITLE = re.compile(r'chief\s+financial|\bcfo\b', re.IGNORECASE)
+
+BLOCK_TAGS = ('p', 'div', 'br', 'tr', 'li', 'table', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+
+def _cell_text(cell) -> str:
+    # itertext keeps '<br>'-separated name and title apart
+    return ' '.join(' '.join(cell.itertext()).split())
+
+
+def _span(cell, attribute: str) -> int:
+    try:
+        return max(1, min(int(cell.get(attribute, 1)), 50))
+    except ValueError:
+        return 1
+
+
+def _grid(table) -> List[List[Tuple[str, bool]]]:
+    """
+    Table rows on a column grid as (text, starts a cell) pairs: colspans repeated so
+    headers and values line up, rowspans carried down (a name cell spanning an
+    officer's three fiscal years)
+    """
+    grid = []
+    carried = {}  # column -> (text, rows remaining)
+    for tr in table.iter('tr'):
+        row = []
+        cells = iter(tr.iter('td', 'th'))
+        cell = next(cells, None)
+        while cell is not None or carried.get(len(row)):
+            col = len(row)
+            if carried.get(col):
+                text, remaining = carried[col]
+                row.append((text, not row or row[-1][0] != text))
+                carried[col] = (text, remaining - 1) if remaining > 1 else None
+                continue
+            text = _cell_text(cell)
+            rowspan = _span(cell, 'rowspan')
+            for i in range(_span(cell, 'colspan')):
+                if rowspan > 1:
+                    carried[len(row)] = (text, rowspan - 1)
+                row.append((text, i == 0))
+            cell = next(cells, None)
+        grid.append(row)
+    return grid
+
+
+def _amount(text: str) -> Optional[float]:
+    """'$ 3,000,000(2)' -> 3000000.0; dashes -> 0; anything without digits -> None"""
+    text = FOOTNOTE.sub('', text).replace(' ', '')
+    if text in DASHES:
+        return 0.0
+    match = AMOUNT.search(text)
+    if not match:
+        return None
+    value = float(match.group().replace(',', ''))
+    return -value if text.startswith('(') or text.startswith('$(') else value
+
+
+def _column_kind(header: str) -> Optional[str]:
+    header = header.lower()
+    for kind, words in SCT_COLUMNS:
+        if any(word in header for word in words):
+            return kind
+    return None
+
+
+def _is_sct(header_text: str) -> bool:
+    header_text = header_text.lower()
+    return (all(word in header_text for word in SCT_REQUIRED)
+            and any(word in header_text for word in SCT_ANY)
+            and not any(word in header_text for word in SCT_EXCLUDED))
+
+
+def _read_sct(table) -> List[Dict]:
+    """Officer rows of a Summary Compensation Table (one dict per officer and year)"""
+    grid = [r for r in _grid(table) if any(text.strip() for text, _ in r)]
+    rows = [[text for text, _ in r] for r in grid]
+
+    first_data = next((i for i, r in enumerate(rows) if any(YEAR_CELL.match(c) for c in r)), None)
+    if not first_data:
+        return []
+
+    # Header labels per grid column, stacked across header rows ('Stock' / 'Awards')
+    width = max(len(r) for r in rows)
+    labels = [' '.join(r[col] for r in rows[:first_data] if col < len(r) and r[col]) for col in range(width)]
+    kinds = [_column_kind(label) for label in labels]
+    value_kinds = [k for k in dict.fromkeys(kinds) if k in PAY_FIELDS]
+    if 'total' not in value_kinds:
+        return []
+
+    officers = []
+    name = None
+    for cells, row in zip(grid[first_data:], rows[first_data:]):
+        year_col = next((i for i, c in enumerate(row) if YEAR_CELL.match(c)), None)
+        if year_col is None:
+            continue
+        leading = ' '.join(text for text, first in cells[:year_col] if first and text)
+        if leading:
+            name = leading
+        record = {'name': name, 'year': int(YEAR_CELL.match(row[year_col]).group(1))}
+
+        # Values by grid column; each component takes the first amount under its header
+        for col in range(year_col + 1, len(row)):
+            kind = kinds[col] if col < len(kinds) else None
+            if kind in PAY_FIELDS and kind not in record:
+                value = _amount(row[col])
+                if value is not None:
+                    record[kind] = value
+
+        # Header spans that don't line up with the value cells - fall back to column order
+        if 'total' not in record:
+            amounts = [_amount(text) for text, first in cells[year_col + 1:] if first]
+            amounts = [a for a in amounts if a is not None]
+            if len(amounts) == len(value_kinds):
+                record.update(zip(value_kinds, amounts))
+
+        if record.get('total'):
+            officers.append(record)
+    return officers
+
+
+def _pay_mix(record: Dict) -> Dict:
+    """Shares of total pay (%): fixed salary, cash incentive, equity and at-risk (incentive + equity)"""
+    total = record.get('total') or 0
+    if total <= 0:
+        return {}
+    cash_incentive = record.get('bonus', 0) + record.get('non_equity', 0)
+    equity = record.get('stock', 0) + record.get('option', 0)
+    return {
+        'salary_pct': round(record.get('salary', 0) / total * 100, 1),
+        'cash_incentive_pct': round(cash_incentive / total * 100, 1),
+        'equity_pct': round(equity / total * 100, 1),
+        'at_risk_pct': round((cash_incentive + equity) / total * 100, 1),
+    }
+
+
+def _document_text(doc) -> str:
+    """Visible text with one line per block element (for the biography scanner)"""
+    etree.strip_elements(doc, 'script', 'style', with_tail=False)
+    for element in doc.iter(*BLOCK_TAGS):
+        element.tail = '\n' + (element.tail or '')
+    return doc.text_content()
+
+
+def parse_proxy(html: str) -> Dict:
+    """
+    Executives from one DEF 14A document (runs in a worker process)
+    Returns {'ceo': {...}, 'cfo': {...}, 'officers': [...], 'sct_year': int}
+    where ceo/cfo carry name, since (year), total_comp and pay_mix when found.
+    """
+    executives = {'ceo': {}, 'cfo': {}, 'officers': [], 'sct_year': None}
+    if not html:
+        return executives
+    doc = lxml_html.fromstring(html.encode('utf-8', errors='replace') if isinstance(html, str) else html)
+
+    for table in doc.iter('table'):
+        header_text = ' '.join(_cell_text(tr) for tr in islice(table.iter('tr'), 6))
+        if _is_sct(header_text):
+            officers = _read_sct(table)
+            if officers:
+                executives['officers'] = officers
+                break
+
+    if executives['officers']:
+        latest_year = max(o['year'] for o in executives['officers'])
+        executives['sct_year'] = latest_year
+        for role, title in (('ceo', CEO_TITLE), ('cfo', CFO_TITLE)):
+            record = next((o for o in executives['officers']
+                           if o['year'] == latest_year and o['name'] and title.search(o['name'])), None)
+            if record:
+                executives[role].update({
+                    'name': record['name'],
+                    'total_comp': record['total'],
+                    'pay_mix': _pay_mix(record),
+                })
+
+    found = PROXY_SCANNER.scan(_document_text(doc))
+    if found.get('ceo_since'):
+        executives['ceo']['since'] = int(found['ceo_since'])
+    if found.get('cfo_since'):
+        executives['cfo']['since'] = int(found['cfo_since'])
+    return executives
+
+
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def _pool_workers() -> int:
+    try:
+        import config
+        workers = getattr(config, 'PROXY_PARSE_WORKERS', None)
+    except ImportError:
+        workers = None
+    return (os.cpu_count() or 1) if workers is None else workers
+
+
+def get_proxy_pool() -> Optional[ProcessPoolExecutor]:
+    """Process-wide parse pool (config.PROXY_PARSE_WORKERS; 0 parses in-thread instead)"""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            workers = _pool_workers()
+            if workers <= 0:
+                return None
+            # spawn: forking a process with live network threads is unsafe
+            _POOL = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        return _POOL
+
+
+def parse_proxy_in_pool(html: str) -> Dict:
+    """parse_proxy on the process pool; the calling thread just waits (GIL released)"""
+    pool = get_proxy_pool()
+    if pool is None:
+        return parse_proxy(html)
+    try:
+        return pool.submit(parse_proxy, html).result()
+    except Exception as e:
+        # A broken pool (worker killed, no spawn support) shouldn't lose the filing
+        print(f"Proxy pool unavailable ({e}) - parsing in-thread")
+        return parse_proxy(html)
+
+
+def _synthetic_proxies(count: int = 20) -> List[str]:
+    filler = "<p>" + "The Board believes our pay program aligns executive and shareholder interests. " * 30 + "</p>"
+    header = ("<tr><th>Name and Principal Position</th><th>Year</th><th colspan='2'>Salary ($)</th>"
+              "<th colspan='2'>Bonus ($)</th><th colspan='2'>Stock Awards ($)</th>"
+              "<th colspan='2'>Non-Equity Incentive Plan Compensation ($)</th>"
+              "<th colspan='2'>All Other Compensation ($)</th><th colspan='2'>Total ($)</th></tr>")
+    row = ("<tr><td>{name}</td><td>{year}</td><td>$</td><td>3,000,000</td><td>$</td><td>—</td>"
+           "<td>$</td><td>40,000,000(1)</td><td>$</td><td>12,000,000</td><td>$</td><td>1,500,000</td>"
+           "<td>$</td><td>56,500,000</td></tr>")
+    officers = [("Jane Doe Chief Executive Officer", y) for y in (2024, 2023, 2022)]
+    officers += [("John Roe Chief Financial Officer", y) for y in (2024, 2023, 2022)]
+    table = "<table>" + header + "".join(row.format(name=n if y == 2024 else '', year=y) for n, y in officers) + "</table>"
+    other_tables = "".join("<table><tr><td>Fees Earned</td><td>Total</td></tr><tr><td>100</td><td>200</td></tr></table>"
+                           for _ in range(50))
+    proxy = ("<html><body>" + filler * 400 + other_tables
+             + "<p>Ms. Doe has served as our Chief Executive Officer since 2015.</p>"
+             + "<p>Mr. Roe has served as Chief Financial Officer since 2020.</p>"
+             + "<h2>Summary Compensation Table</h2>" + table + filler * 200 + "</body></html>")
+    return [proxy] * count
+
+
+def benchmark(paths: Iterable[str] = (), workers: Optional[int] = None):
+    """Proxies per second parsed in-thread vs. on the process pool"""
+    documents = []
+    for path in paths:
+        files = [os.path.join(path, f) for f in sorted(os.listdir(path))] if os.path.isdir(path) else [path]
+        for name in files:
+            if name.lower().endswith(('.htm', '.html')):
+                with open(name, encoding='utf-8', errors='replace') as f:
+                    documents.append(f.read())
+    documents = documents or _synthetic_proxies()
+    megabytes = sum(len(d) for d in documents) / 1e6
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    results = [parse_proxy(d) for d in documents]
+    serial = time.perf_counter() - start
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        list(pool.map(parse_proxy, documents[:workers]))  # Warm the workers up
+        start = time.perf_counter()
+        list(pool.map(parse_proxy, documents))
+        pooled = time.perf_counter() - start
+
+    found = sum(1 for r in results if r['officers'])
+    print(f"{len(documents)} proxies, {megabytes:.1f} MB, Summary Compensation Table found in {found}")
+    print(f"  in-thread   {len(documents) / serial:>8.1f} proxies/s {megabytes / serial:>8.1f} MB/s")
+    print(f"  {workers:>2} workers  {len(documents) / pooled:>8.1f} proxies/s {megabytes / pooled:>8.1f} MB/s")
+    print(f"  first result: ceo={results[0]['ceo']} cfo={results[0]['cfo']}")
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(sys.argv[1:])
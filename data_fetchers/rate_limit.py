@@ -0,0 +1,110 @@
+"""
+Rate limiting for Buffett Screener
+SEC fair access allows 10 requests/second per client across data.sec.gov and www.sec.gov.
+One token bucket per process (optionally shared across processes through a lock file)
+paces every Edgar request at exactly that rate, however many threads or runs are active.
+"""
+import os
+import threading
+import time
+from typing import Optional
+import requests
+
+try:
+    import fcntl  # POSIX only - cross-process sharing is skipped elsewhere
+except ImportError:
+    fcntl = None
+
+SEC_REQUESTS_PER_SECOND = 10
+
+
+class TokenBucket:
+    """
+    Token bucket in its GCRA form: one 'theoretical arrival time' instead of a token count
+    Each acquire() pushes the arrival time one interval forward and sleeps until the
+    request fits; up to `burst` requests may go back to back after an idle spell.
+
+    With lock_path, the arrival time lives in that file under an exclusive flock,
+    so every process pointing at the same file shares one budget.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, lock_path: Optional[str] = None):
+        self.interval = 1.0 / rate
+        self.burst = max(1, burst)
+        self.lock_path = lock_path if fcntl else None
+        self._lock = threading.Lock()
+        self._tat = 0.0  # theoretical arrival time of the next request (epoch seconds)
+
+    def _reserve(self, tat: float, now: float):
+        """Returns (seconds to wait, new arrival time)"""
+        tat = max(tat, now)
+        wait = max(0.0, tat - (self.burst - 1) * self.interval - now)
+        return wait, tat + self.interval
+
+    def acquire(self):
+        """Block until one request may be sent"""
+        with self._lock:
+            now = time.time()
+            if self.lock_path:
+                wait = self._reserve_shared(now)
+            else:
+                wait, self._tat = self._reserve(self._tat, now)
+        if wait > 0:
+            time.sleep(wait)
+
+    def _reserve_shared(self, now: float) -> float:
+        directory = os.path.dirname(self.lock_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            raw = os.read(fd, 64)
+            try:
+                tat = float(raw.decode() or 0)
+            except ValueError:
+                tat = 0.0
+            wait, tat = self._reserve(tat, now)
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, repr(tat).encode())
+            return wait
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+
+class RateLimitedSession(requests.Session):
+    """requests.Session that takes a token from `bucket` before every request"""
+
+    def __init__(self, bucket: TokenBucket):
+        super().__init__()
+        self.bucket = bucket
+
+    def request(self, *args, **kwargs):
+        self.bucket.acquire()
+        return super().request(*args, **kwargs)
+
+
+_SEC_BUCKET = None
+_SEC_BUCKET_LOCK = threading.Lock()
+
+
+def get_sec_bucket() -> TokenBucket:
+    """Process-wide SEC bucket; config.SEC_RATE_LOCK_FILE shares it across processes"""
+    global _SEC_BUCKET
+    with _SEC_BUCKET_LOCK:
+        if _SEC_BUCKET is None:
+            try:
+                import config
+                rate = getattr(config, 'SEC_REQUESTS_PER_SECOND', SEC_REQUESTS_PER_SECOND)
+                lock_path = getattr(config, 'SEC_RATE_LOCK_FILE', None)
+            except ImportError:
+                rate, lock_path = SEC_REQUESTS_PER_SECOND, None
+            _SEC_BUCKET = TokenBucket(rate, lock_path=lock_path)
+        return _SEC_BUCKET
+
+
+def sec_session() -> RateLimitedSession:
+    """Session for any data.sec.gov / www.sec.gov request"""
+    return RateLimitedSession(get_sec_bucket())
@@ -2,66 +2,283 @@
 SEC Edgar Data Fetcher - Complete Implementation
 Fetches data from 10-K, 10-Q, DEF 14A, and 8-K filings via CIK
 """
+import codecs
 import requests
-import re
 from datetime import datetime
 from typing import Dict, List, Optional
-import time
+from data_fetchers.http_cache import conditional_get
+from data_fetchers.cache_metrics import METRICS, record_network, split_cache_key
+from data_fetchers.edgar_bulk import get_bulk_store
+from data_fetchers.rate_limit import sec_session
+from data_fetchers.utils import (
+    cache_data, load_cached_data, cache_negative, load_negative, NEG_NO_DOCUMENT, NEG_NOT_FOUND
+)
+from data_fetchers.xbrl_facts import CompanyFacts
+from data_fetchers.filing_text import SectionTextParser, TEXT_PARSER_VERSION, MIN_SECTION_CHARS, visible_text
+from data_fetchers.text_scanner import (
+    TEN_K_SCANNER, SCANNER_VERSION, parse_count, customer_concentration
+)
+from data_fetchers.proxy_parser import parse_proxy_in_pool, PROXY_PARSER_VERSION
+from data_fetchers.insider_trades import InsiderTrades, insider_summary
+from data_fetchers.xbrl_instance import find_instance, read_revenue_facts, revenue_breakdown, XBRL_INSTANCE_VERSION
+from data_fetchers.exhibit21 import find_exhibit21, parse_exhibit21, EXHIBIT21_VERSION
+from data_fetchers.debt_maturity import maturity_ladder
+from data_fetchers.xbrl_revisions import fact_revisions, restated_years
+from data_fetchers.pivot_detector import section_signatures, find_pivots, PIVOT_ITEMS, PIVOT_DETECTOR_VERSION
+from data_fetchers.section_store import get_section_store, STORE_ITEMS
+
+# Accepted filings are immutable
+ARCHIVE_MAX_AGE_DAYS = 3650
+
+SEC_USER_AGENT = 'YourCompany contact@email.com'  # Required by SEC
+
+# 10-K Items read for extraction: Business, MD&A, financial statements (segment note)
+SECTIONS_10K = ('1', '7', '8')
+
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# A 10-K/A this soon after an Item 4.02 8-K is taken to be the restated report
+RESTATEMENT_AMENDMENT_DAYS = 365
 
 class SECEdgarFetcher:
     """Fetch data from SEC Edgar filings using CIK"""
     
-    def __init__(self, cik: str):
+    def __init__(self, cik: str, use_bulk: bool = True):
         """
         Initialize Edgar fetcher
         Args:
             cik: Company CIK number (with or without leading zeros)
+            use_bulk: Answer from the offline bulk store when it has the company
+                      (False reads the live feeds - e.g. right after a new filing)
         """
         self.cik = str(cik).zfill(10)  # Pad to 10 digits
         self.base_url = "https://data.sec.gov"
         self.headers = {
-            'User-Agent': 'YourCompany contact@email.com',  # Required by SEC
+            'User-Agent': SEC_USER_AGENT,
             'Accept-Encoding': 'gzip, deflate',
             'Host': 'data.sec.gov'
         }
-        self.session = requests.Session()
+        # Every request takes a token from the shared SEC fair-access bucket
+        self.session = sec_session()
         self.session.headers.update(self.headers)
+        
+        # Offline bulk copy (ingest_edgar_bulk.py) answers before any HTTP
+        self.bulk = get_bulk_store() if use_bulk else None
+        
+        # Per-instance memo: one submissions fetch, each index/document loaded once
+        self._submissions = None
+        self._archive = {}
+        self._parsed_10k = {}
+        self._company_facts = None
     
-    def get_latest_10k(self) -> Optional[Dict]:
+    def _fetch_submissions(self) -> Dict:
         """
-        Get most recent 10-K filing
-        Returns dict with filing URL and metadata
+        Get company submissions JSON (once per instance)
+        Revalidated with ETag / If-Modified-Since - unchanged filers cost a 304
         """
-        try:
-            # Get company submissions
+        if self._submissions is None:
+            cache_key = f"sec_submissions_{self.cik}"
+            if self.bulk:
+                self._submissions = self.bulk.get_submissions(self.cik)
+                if self._submissions is not None:
+                    METRICS.record(*split_cache_key(cache_key), 'hit')
+                    return self._submissions
             url = f"{self.base_url}/submissions/CIK{self.cik}.json"
+            self._submissions = conditional_get(self.session, url, cache_key)
+        return self._submissions
+    
+    def get_company_facts(self) -> Optional[CompanyFacts]:
+        """
+        Every XBRL fact the company has filed (api/xbrl/companyfacts), as a columnar table
+        One request per issuer, revalidated like submissions
+        """
+        if self._company_facts is not None:
+            return self._company_facts
+        
+        negative_key = f"sec_companyfacts_{self.cik}"
+        if self.bulk:
+            facts_json = self.bulk.get_companyfacts(self.cik)
+            if facts_json is not None:
+                METRICS.record(*split_cache_key(negative_key), 'hit')
+                self._company_facts = CompanyFacts(facts_json)
+                return self._company_facts
+        
+        if load_negative(negative_key):
+            return None
+        
+        url = f"{self.base_url}/api/xbrl/companyfacts/CIK{self.cik}.json"
+        try:
+            facts_json = conditional_get(self.session, url, negative_key)
+        except requests.HTTPError as e:
+            # Filers without XBRL (pre-2009, many foreign issuers) get a 404
+            if e.response is not None and e.response.status_code == 404:
+                cache_negative(negative_key, NEG_NOT_FOUND, "no companyfacts")
+            else:
+                print(f"Error fetching company facts: {e}")
+            return None
+        except Exception as e:
+            print(f"Error fetching company facts: {e}")
+            return None
+        
+        self._company_facts = CompanyFacts(facts_json)
+        return self._company_facts
+    
+    def _get_archive(self, url: str, as_json: bool = True):
+        """
+        Get a file under Archives/ (filing index or document)
+        Filings never change once accepted, so these are cached indefinitely,
+        and each file is loaded at most once per instance
+        """
+        if url in self._archive:
+            return self._archive[url]
+        
+        cache_key = self._archive_key(url)
+        body = load_cached_data(cache_key, max_age_days=ARCHIVE_MAX_AGE_DAYS)
+        if body is None:
             response = self.session.get(url)
+            record_network(cache_key, len(response.content))
             response.raise_for_status()
-            data = response.json()
-            
-            # Find latest 10-K
-            filings = data.get('filings', {}).get('recent', {})
+            body = response.json() if as_json else response.text
+            cache_data(cache_key, body)
+        
+        self._archive[url] = body
+        return body
+    
+    @staticmethod
+    def _archive_key(url: str) -> str:
+        return "sec_archive_" + url.split("/Archives/edgar/data/", 1)[-1].replace('/', '_')
+    
+    def _stream_document(self, url: str, parser: SectionTextParser):
+        """
+        Feed a filing document to an incremental parser as it downloads
+        Reading stops as soon as the parser is done, so the rest of the
+        document is never transferred, decoded or held in memory
+        """
+        cache_key = self._archive_key(url)
+        cached = self._archive.get(url) or load_cached_data(cache_key, max_age_days=ARCHIVE_MAX_AGE_DAYS)
+        if cached is not None:
+            # Whole document cached by an earlier version - still parse it section-bounded
+            for start in range(0, len(cached), STREAM_CHUNK_BYTES):
+                parser.feed(cached[start:start + STREAM_CHUNK_BYTES])
+                if parser.done:
+                    break
+            parser.close()
+            return
+        
+        nbytes = 0
+        response = self.session.get(url, stream=True, timeout=30)
+        try:
+            response.raise_for_status()
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+                nbytes += len(chunk)
+                parser.feed(decoder.decode(chunk))
+                if parser.done:
+                    break
+            else:
+                parser.feed(decoder.decode(b'', final=True))
+        finally:
+            response.close()
+            record_network(cache_key, nbytes)
+        parser.close()
+    
+    @staticmethod
+    def _doc_negative_key(filing_url: str, purpose: str) -> str:
+        """Negative-cache key for 'this filing has no usable document for <purpose>'"""
+        accession = filing_url.rstrip('/').split('/')[-1]
+        return f"sec_{purpose}_doc_{accession}"
+    
+    def _fetch_submissions_page(self, name: str) -> Dict:
+        """
+        Older filings overflow into filings.files pages (CIK##########-submissions-001.json)
+        Pages only ever hold past filings, so they're cached indefinitely and fetched only when needed
+        """
+        if name in self._archive:
+            return self._archive[name]
+        
+        page = self.bulk.get_submissions_page(name) if self.bulk else None
+        if page is None:
+            cache_key = "sec_submissions_page_" + name[:-len('.json')]
+            page = load_cached_data(cache_key, max_age_days=ARCHIVE_MAX_AGE_DAYS)
+            if page is None:
+                response = self.session.get(f"{self.base_url}/submissions/{name}")
+                record_network(cache_key, len(response.content))
+                response.raise_for_status()
+                page = response.json()
+                cache_data(cache_key, page)
+        
+        self._archive[name] = page
+        return page
+    
+    def iter_filings(self, since: Optional[str] = None, include_history: bool = True):
+        """
+        Every filing's metadata, newest first, without touching any filing body
+        Yields dicts with accession_number, filing_date, report_date, form, items,
+        primary_document and url. History pages are fetched lazily - only when
+        iteration reaches them and they overlap `since` (YYYY-MM-DD).
+        """
+        submissions = self._fetch_submissions().get('filings', {})
+        pages = [lambda: submissions.get('recent', {})]
+        if include_history:
+            for page in submissions.get('files', []):
+                if since and page.get('filingTo', '9999') < since:
+                    continue
+                pages.append(lambda name=page['name']: self._fetch_submissions_page(name))
+        
+        for load_page in pages:
+            filings = load_page()
             forms = filings.get('form', [])
             accession_numbers = filings.get('accessionNumber', [])
             filing_dates = filings.get('filingDate', [])
+            report_dates = filings.get('reportDate', [])
+            items = filings.get('items', [])
+            primary_documents = filings.get('primaryDocument', [])
             
             for i, form in enumerate(forms):
-                if form == '10-K':
-                    accession = accession_numbers[i].replace('-', '')
-                    filing_date = filing_dates[i]
-                    
-                    # Construct document URL
-                    doc_url = f"{self.base_url}/Archives/edgar/data/{int(self.cik)}/{accession}/"
-                    
-                    return {
-                        'accession_number': accession_numbers[i],
-                        'filing_date': filing_date,
-                        'url': doc_url,
-                        'form': '10-K'
-                    }
-            
-            return None
-            
+                if since and filing_dates[i] < since:
+                    return  # Newest first - everything after this is older
+                accession = accession_numbers[i].replace('-', '')
+                yield {
+                    'accession_number': accession_numbers[i],
+                    'filing_date': filing_dates[i],
+                    'report_date': report_dates[i] if i < len(report_dates) else '',
+                    'form': form,
+                    'items': items[i] if i < len(items) else '',
+                    'primary_document': primary_documents[i] if i < len(primary_documents) else '',
+                    'url': f"{self.base_url}/Archives/edgar/data/{int(self.cik)}/{accession}/"
+                }
+    
+    def find_filings(self, form_types, limit: Optional[int] = None,
+                     include_history: bool = False) -> List[Dict]:
+        """
+        Filings of the given form types from the submissions feed, newest first
+        Every filing lookup is derived from the one submissions fetch
+        """
+        if isinstance(form_types, str):
+            form_types = [form_types]
+        
+        results = []
+        for filing in self.iter_filings(include_history=include_history):
+            if filing['form'] in form_types:
+                results.append({
+                    'accession_number': filing['accession_number'],
+                    'filing_date': filing['filing_date'],
+                    'report_date': filing['report_date'],
+                    'url': filing['url'],
+                    'form': filing['form']
+                })
+                if limit and len(results) >= limit:
+                    break
+        return results
+    
+    def get_latest_10k(self) -> Optional[Dict]:
+        """
+        Get most recent 10-K filing
+        Returns dict with filing URL and metadata
+        """
+        try:
+            filings = self.find_filings('10-K', limit=1)
+            return filings[0] if filings else None
         except Exception as e:
             print(f"Error fetching 10-K: {e}")
             return None
@@ -69,80 +286,264 @@ class SECEdgarFetcher:
     def get_latest_proxy(self) -> Optional[Dict]:
         """Get most recent DEF 14A (proxy statement)"""
         try:
-            url = f"{self.base_url}/submissions/CIK{self.cik}.json"
-            response = self.session.get(url)
-            response.raise_for_status()
-            data = response.json()
-            
-            filings = data.get('filings', {}).get('recent', {})
-            forms = filings.get('form', [])
-            accession_numbers = filings.get('accessionNumber', [])
-            filing_dates = filings.get('filingDate', [])
-            
-            for i, form in enumerate(forms):
-                if form == 'DEF 14A':
-                    accession = accession_numbers[i].replace('-', '')
-                    filing_date = filing_dates[i]
-                    
-                    doc_url = f"{self.base_url}/Archives/edgar/data/{int(self.cik)}/{accession}/"
-                    
-                    return {
-                        'accession_number': accession_numbers[i],
-                        'filing_date': filing_date,
-                        'url': doc_url,
-                        'form': 'DEF 14A'
-                    }
-            
-            return None
-            
+            filings = self.find_filings('DEF 14A', limit=1)
+            return filings[0] if filings else None
         except Exception as e:
             print(f"Error fetching proxy: {e}")
             return None
     
-    def extract_segments_from_10k(self, filing_url: str) -> Optional[Dict]:
+    def _find_main_document(self, filing_url: str, form: str) -> Optional[str]:
+        """Name of the main .htm document in a filing (form-named first, else first .htm)"""
+        items = self._get_archive(filing_url + "index.json").get('directory', {}).get('item', [])
+        htm_names = [item.get('name', '') for item in items
+                     if item.get('name', '').endswith(('.htm', '.html'))]
+        
+        # '10-K' matches aapl-10k.htm, form10-k.htm, ...; 'DEF 14A' matches def14a.htm
+        marker = form.lower().replace(' ', '').replace('-', '')
+        for item in items:
+            name = item.get('name', '')
+            normalized = name.lower().replace('-', '').replace('_', '').replace(' ', '')
+            if name in htm_names and (marker in normalized or item.get('type') == form):
+                return name
+        
+        # Fallback: the largest htm file - cover pages and exhibits are smaller than the
+        # main document (skipping the -index pages EDGAR generates)
+        candidates = [item for item in items if item.get('name') in htm_names
+                      and not item['name'].endswith(('-index.htm', '-index-headers.html'))]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda item: int(item['size']) if str(item.get('size', '')).isdigit() else 0)['name']
+    
+    def _main_document_url(self, filing_url: str, form: str, purpose: str) -> Optional[str]:
+        """URL of a filing's main document (None, negative-cached, when the index has none)"""
+        neg_key = self._doc_negative_key(filing_url, purpose)
+        if load_negative(neg_key):
+            return None
+        
+        main_doc = self._find_main_document(filing_url, form)
+        if not main_doc:
+            cache_negative(neg_key, NEG_NO_DOCUMENT, "no .htm document in filing index")
+            return None
+        return filing_url + main_doc
+    
+    def extract_10k_data(self, filing_url: str, filing_date: Optional[str] = None) -> Dict:
         """
-        Extract business segment information from 10-K
-        Returns segment count, names, and revenue breakdown
+        Segments, company history and customer concentration from one 10-K
+        Sections come from the local section store when the filing is indexed; otherwise
+        the document is streamed once, split into Items and indexed for next time.
+        Results are cached per filing.
         """
-        try:
-            # Get the filing index
-            response = self.session.get(filing_url + "index.json")
-            response.raise_for_status()
-            index = response.json()
-            
-            # Find the main 10-K document (usually htm or html)
-            main_doc = None
-            for item in index.get('directory', {}).get('item', []):
-                name = item.get('name', '')
-                if name.endswith('.htm') or name.endswith('.html'):
-                    if '10-k' in name.lower() or item.get('type') == '10-K':
-                        main_doc = name
-                        break
-            
-            if not main_doc:
-                # Fallback: get first htm file
-                for item in index.get('directory', {}).get('item', []):
-                    if item.get('name', '').endswith(('.htm', '.html')):
-                        main_doc = item['name']
+        if filing_url in self._parsed_10k:
+            return self._parsed_10k[filing_url]
+        
+        accession = filing_url.rstrip('/').split('/')[-1]
+        cache_key = f"sec_10kdata_v{TEXT_PARSER_VERSION}s{SCANNER_VERSION}_{accession}"
+        result = load_cached_data(cache_key, max_age_days=ARCHIVE_MAX_AGE_DAYS)
+        if result is None:
+            result = {'segments': None, 'history': None, 'customers': None}
+            try:
+                store = get_section_store()
+                if store and store.has_filing(accession):
+                    result = self._extract_10k_fields(store.get_sections(accession))
+                    cache_data(cache_key, result)
+                else:
+                    doc_url = self._main_document_url(filing_url, '10-K', "10k")
+                    if doc_url:
+                        result = self._parse_10k(doc_url, accession, filing_date, store)
+                        cache_data(cache_key, result)
+            except Exception as e:
+                print(f"Error extracting 10-K data: {e}")
+        
+        self._parsed_10k[filing_url] = result
+        return result
+    
+    def _scan_10k_section(self, result: Dict, text: str) -> bool:
+        """One scanner pass over a section for whichever fields are still missing; True when all are found"""
+        missing = [field for field, have in (('founded_year', result['history']),
+                                             ('segment_count', result['segments']))
+                   if not have.get(field)]
+        if missing:
+            found = TEN_K_SCANNER.scan(text, fields=missing)
+            if found.get('founded_year'):
+                result['history'] = {'founded_year': int(found['founded_year'])}
+            if parse_count(found.get('segment_count')):
+                result['segments']['segment_count'] = parse_count(found['segment_count'])
+        
+        if result['customers'].get('top_customer_pct') is None:
+            found = customer_concentration(text)
+            for field, value in found.items():
+                if value and not result['customers'].get(field):
+                    result['customers'][field] = value
+        
+        customers = result['customers']
+        return bool(result['history'].get('founded_year') and result['segments'].get('segment_count')
+                    and (customers.get('top_customer_pct') is not None or customers.get('no_major_customer')))
+    
+    def _extract_10k_fields(self, sections: Dict[str, str]) -> Dict:
+        """Run every 10-K extractor over already-split sections (Item 1, then 7, then 8)"""
+        result = {'segments': self._parse_segments(''), 'history': {}, 'customers': {}}
+        for item in SECTIONS_10K + ('all',):
+            if sections.get(item) and self._scan_10k_section(result, sections[item]):
+                break
+        return result
+    
+    def _parse_10k(self, doc_url: str, accession: str, filing_date: Optional[str] = None,
+                   store=None) -> Dict:
+        """
+        Stream a 10-K once. With a section store, every stored Item is read in full and
+        indexed; without one, reading stops as soon as every extractor has its answer.
+        """
+        if store:
+            parser = SectionTextParser(STORE_ITEMS)
+            self._stream_document(doc_url, parser)
+            store.add_filing(self.cik, accession, parser.sections, form='10-K', filing_date=filing_date)
+            return self._extract_10k_fields(parser.sections)
+        
+        result = {'segments': self._parse_segments(''), 'history': {}, 'customers': {}}
+        parser = SectionTextParser(SECTIONS_10K, lambda item, text: self._scan_10k_section(result, text))
+        self._stream_document(doc_url, parser)
+        
+        # Sections shorter than a full section (or a heading-less document) never reached on_section
+        if not parser.done:
+            for item, text in parser.sections.items():
+                if len(text) < MIN_SECTION_CHARS or item == 'all':
+                    if self._scan_10k_section(result, text):
                         break
-            
-            if not main_doc:
+        
+        return result
+    
+    def get_10k_sections(self, filing_url: str, items, filing_date: Optional[str] = None) -> Dict[str, str]:
+        """
+        {item: text} for one 10-K - from the section store (indexing the filing on first
+        use), or streamed until the wanted Items are read when the store is disabled
+        """
+        accession = filing_url.rstrip('/').split('/')[-1]
+        store = get_section_store()
+        if store and store.has_filing(accession):
+            return store.get_sections(accession, items)
+        doc_url = self._main_document_url(filing_url, '10-K', "10k")
+        if not doc_url:
+            return {}
+        if store:
+            self._parse_10k(doc_url, accession, filing_date, store)
+            return store.get_sections(accession, items)
+        parser = SectionTextParser(items)
+        self._stream_document(doc_url, parser)
+        return {item: text for item, text in parser.sections.items() if item in items}
+    
+    @staticmethod
+    def _pivot_years() -> int:
+        try:
+            import config
+            return getattr(config, 'PIVOT_YEARS', 10)
+        except ImportError:
+            return 10
+    
+    def detect_pivots(self, years: Optional[int] = None) -> Optional[Dict]:
+        """
+        Strategy pivots across the last N annual reports (see pivot_detector)
+        Item 1 / 1A MinHash signatures are persisted per accession, so once the history
+        is crawled each new 10-K costs one filing and one signature comparison.
+        """
+        years = years or self._pivot_years()
+        try:
+            filings = self.find_filings('10-K', limit=years, include_history=True)
+            history = []
+            for filing in reversed(filings):
+                accession = filing['url'].rstrip('/').split('/')[-1]
+                cache_key = f"sec_minhash_v{PIVOT_DETECTOR_VERSION}_{accession}"
+                signatures = load_cached_data(cache_key, max_age_days=ARCHIVE_MAX_AGE_DAYS)
+                if signatures is None:
+                    sections = self.get_10k_sections(filing['url'], PIVOT_ITEMS, filing['filing_date'])
+                    signatures = section_signatures(sections)
+                    cache_data(cache_key, signatures)
+                if signatures:
+                    history.append({
+                        'report_date': filing.get('report_date', ''),
+                        'filing_date': filing['filing_date'],
+                        'accession': accession,
+                        'signatures': signatures,
+                    })
+            return find_pivots(history)
+        except Exception as e:
+            print(f"Error detecting pivots: {e}")
+            return None
+    
+    def get_revenue_breakdown(self, filing_url: str) -> Optional[Dict]:
+        """
+        Segment and geography revenue shares from the filing's XBRL instance
+        The instance is streamed through iterparse (never held whole); the result is
+        cached per accession and filings without an instance are negative-cached.
+        """
+        accession = filing_url.rstrip('/').split('/')[-1]
+        cache_key = f"sec_xbrlrev_v{XBRL_INSTANCE_VERSION}_{accession}"
+        breakdown = load_cached_data(cache_key, max_age_days=ARCHIVE_MAX_AGE_DAYS)
+        if breakdown is not None:
+            return breakdown
+        
+        neg_key = self._doc_negative_key(filing_url, "xbrl")
+        if load_negative(neg_key):
+            return None
+        try:
+            items = self._get_archive(filing_url + "index.json").get('directory', {}).get('item', [])
+            instance = find_instance(items)
+            if not instance:
+                cache_negative(neg_key, NEG_NO_DOCUMENT, "no XBRL instance in filing index")
                 return None
-            
-            # Fetch document
-            doc_response = self.session.get(filing_url + main_doc)
-            doc_response.raise_for_status()
-            text = doc_response.text
-            
-            # Extract segment info (simplified - would need more robust parsing)
-            segments = self._parse_segments(text)
-            
-            return segments
-            
+            url = filing_url + instance
+            with self.session.get(url, stream=True, timeout=120) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                facts = read_revenue_facts(response.raw)
+                record_network(self._archive_key(url), int(response.headers.get('Content-Length') or 0))
+            breakdown = revenue_breakdown(facts)
+            cache_data(cache_key, breakdown)
+            return breakdown
+        except Exception as e:
+            print(f"Error reading XBRL instance: {e}")
+            return None
+    
+    def get_subsidiary_footprint(self, filing_url: str) -> Optional[Dict]:
+        """
+        Subsidiary jurisdictions from the filing's Exhibit 21
+        Only the EX-21 file named in the (cached) filing index is downloaded; the
+        country count and distribution are cached per accession and filings without
+        an Exhibit 21 are negative-cached.
+        """
+        accession = filing_url.rstrip('/').split('/')[-1]
+        cache_key = f"sec_ex21_v{EXHIBIT21_VERSION}_{accession}"
+        footprint = load_cached_data(cache_key, max_age_days=ARCHIVE_MAX_AGE_DAYS)
+        if footprint is not None:
+            return footprint
+        
+        neg_key = self._doc_negative_key(filing_url, "ex21")
+        if load_negative(neg_key):
+            return None
+        try:
+            items = self._get_archive(filing_url + "index.json").get('directory', {}).get('item', [])
+            exhibit = find_exhibit21(items)
+            if not exhibit:
+                cache_negative(neg_key, NEG_NO_DOCUMENT, "no Exhibit 21 in filing index")
+                return None
+            url = filing_url + exhibit
+            response = self.session.get(url, timeout=30)
+            record_network(self._archive_key(url), len(response.content))
+            response.raise_for_status()
+            text = response.text if exhibit.endswith('.txt') else visible_text(response.text)
+            footprint = parse_exhibit21(text)
+            cache_data(cache_key, footprint)
+            return footprint
         except Exception as e:
-            print(f"Error extracting segments: {e}")
+            print(f"Error reading Exhibit 21: {e}")
             return None
     
+    def extract_segments_from_10k(self, filing_url: str) -> Optional[Dict]:
+        """
+        Extract business segment information from 10-K
+        Returns segment count, names, and revenue breakdown
+        """
+        return self.extract_10k_data(filing_url).get('segments')
+    
     def _parse_segments(self, text: str) -> Dict:
         """Parse segment information from 10-K text"""
         # This is a simplified version - real implementation would need
@@ -154,20 +555,10 @@ class SECEdgarFetcher:
             'method': 'text_analysis'
         }
         
-        # Look for common segment disclosure patterns
-        patterns = [
-            r'(?:reportable segments?|business segments?|operating segments?)[\s:]+([^\n]+)',
-            r'(\d+)\s+(?:reportable|business|operating)\s+segments?',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                # Try to extract count
-                for match in matches:
-                    if isinstance(match, str) and match.isdigit():
-                        segments['segment_count'] = int(match)
-                        break
+        # 'three reportable segments', '2 operating segments', ...
+        count = parse_count(TEN_K_SCANNER.scan(text, fields=['segment_count']).get('segment_count'))
+        if count:
+            segments['segment_count'] = count
         
         # This is placeholder - real implementation would extract actual segment names
         # and revenue breakdowns from XBRL or HTML tables
@@ -176,149 +567,84 @@ class SECEdgarFetcher:
     
     def extract_company_history(self, filing_url: str) -> Optional[Dict]:
         """Extract company founding/incorporation date from 10-K"""
-        try:
-            response = self.session.get(filing_url + "index.json")
-            response.raise_for_status()
-            index = response.json()
-            
-            # Get main document
-            main_doc = None
-            for item in index.get('directory', {}).get('item', []):
-                name = item.get('name', '')
-                if name.endswith(('.htm', '.html')) and '10-k' in name.lower():
-                    main_doc = name
-                    break
-            
-            if not main_doc:
-                return None
-            
-            doc_response = self.session.get(filing_url + main_doc)
-            text = doc_response.text
-            
-            # Look for incorporation/founding dates
-            history = self._parse_history(text)
-            
-            return history
-            
-        except Exception as e:
-            print(f"Error extracting history: {e}")
-            return None
-    
-    def _parse_history(self, text: str) -> Dict:
-        """Parse company history from text"""
-        history = {}
-        
-        # Look for incorporation date
-        patterns = [
-            r'incorporated.*?(?:in|on)\s+(\d{4})',
-            r'founded.*?(?:in|on)\s+(\d{4})',
-            r'established.*?(?:in|on)\s+(\d{4})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                history['founded_year'] = int(match.group(1))
-                break
-        
-        return history
+        return self.extract_10k_data(filing_url).get('history')
     
     def extract_executive_info(self, proxy_url: str) -> Optional[Dict]:
-        """Extract CEO/CFO information from proxy statement"""
-        try:
-            response = self.session.get(proxy_url + "index.json")
-            response.raise_for_status()
-            index = response.json()
-            
-            # Get main proxy document
-            main_doc = None
-            for item in index.get('directory', {}).get('item', []):
-                name = item.get('name', '')
-                if name.endswith(('.htm', '.html')):
-                    main_doc = name
-                    break
-            
-            if not main_doc:
-                return None
-            
-            doc_response = self.session.get(proxy_url + main_doc)
-            text = doc_response.text
-            
-            executives = self._parse_executives(text)
-            
-            return executives
-            
-        except Exception as e:
-            print(f"Error extracting executives: {e}")
-            return None
-    
-    def _parse_executives(self, text: str) -> Dict:
-        """Parse executive information from proxy"""
-        executives = {
-            'ceo': {},
-            'cfo': {},
-            'officers': []
-        }
-        
-        # Look for CEO info
-        ceo_patterns = [
-            r'Chief Executive Officer.*?(?:since|appointed)\s+(\d{4})',
-            r'(?:President|CEO).*?(?:since|appointed)\s+(\d{4})',
-        ]
-        
-        for pattern in ceo_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                year_appointed = int(match.group(1))
-                current_year = datetime.now().year
-                executives['ceo']['tenure_years'] = current_year - year_appointed
-                break
+        """
+        CEO/CFO tenure and pay from the proxy statement
+        The main DEF 14A document is parsed on the proxy process pool (Summary Compensation
+        Table + biographies); the parsed result is cached per filing, the HTML is not.
+        """
+        accession = proxy_url.rstrip('/').split('/')[-1]
+        cache_key = f"sec_proxydata_v{PROXY_PARSER_VERSION}s{SCANNER_VERSION}_{accession}"
+        executives = load_cached_data(cache_key, max_age_days=ARCHIVE_MAX_AGE_DAYS)
         
-        # Similar for CFO
-        cfo_patterns = [
-            r'Chief Financial Officer.*?(?:since|appointed)\s+(\d{4})',
-            r'CFO.*?(?:since|appointed)\s+(\d{4})',
-        ]
-        
-        for pattern in cfo_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                year_appointed = int(match.group(1))
-                current_year = datetime.now().year
-                executives['cfo']['tenure_years'] = current_year - year_appointed
-                break
+        if executives is None:
+            try:
+                doc_url = self._main_document_url(proxy_url, 'DEF 14A', "proxy")
+                if not doc_url:
+                    return None
+                response = self.session.get(doc_url)
+                record_network(self._archive_key(doc_url), len(response.content))
+                response.raise_for_status()
+                executives = parse_proxy_in_pool(response.text)
+                cache_data(cache_key, executives)
+            except Exception as e:
+                print(f"Error extracting executives: {e}")
+                return None
         
+        # Tenure is measured from today, so it is derived after the cache
+        current_year = datetime.now().year
+        for role in ('ceo', 'cfo'):
+            if executives[role].get('since'):
+                executives[role]['tenure_years'] = current_year - executives[role]['since']
         return executives
     
     def check_for_restatements(self, years: int = 5) -> List[Dict]:
-        """Check for financial restatements in 8-K filings"""
+        """
+        Restatements in the last N years, from filing metadata alone
+        An 8-K reporting Item 4.02 (non-reliance on previously issued financial
+        statements) is a restatement; 10-K/As filed within RESTATEMENT_AMENDMENT_DAYS
+        after it are attached as the restated reports. An 8-K/A repeating Item 4.02 for
+        the same event date is the same restatement and is counted once, as its original
+        8-K. No 8-K body is downloaded.
+        """
         try:
-            url = f"{self.base_url}/submissions/CIK{self.cik}.json"
-            response = self.session.get(url)
-            response.raise_for_status()
-            data = response.json()
-            
-            restatements = []
-            filings = data.get('filings', {}).get('recent', {})
-            forms = filings.get('form', [])
-            filing_dates = filings.get('filingDate', [])
-            
-            # Look for 8-K filings in last N years
-            cutoff_year = datetime.now().year - years
-            
-            for i, form in enumerate(forms):
-                if form == '8-K':
-                    filing_date = filing_dates[i]
-                    year = int(filing_date.split('-')[0])
-                    
-                    if year >= cutoff_year:
-                        # Would need to fetch and analyze 8-K content
-                        # for restatement keywords
-                        restatements.append({
-                            'filing_date': filing_date,
-                            'form': '8-K',
-                            # 'has_restatement': would need content analysis
+            cutoff = f"{datetime.now().year - years}-{datetime.now():%m-%d}"
+            
+            by_event = {}
+            amendments = []
+            for filing in self.iter_filings(since=cutoff):
+                items = [item.strip() for item in filing['items'].split(',') if item.strip()]
+                if filing['form'] in ('8-K', '8-K/A') and '4.02' in items:
+                    event = filing['report_date'] or filing['filing_date']
+                    kept = by_event.get(event)
+                    # Keep the original 8-K, else the earliest 8-K/A for the event
+                    if kept and (kept['form'], kept['filing_date']) <= (filing['form'], filing['filing_date']):
+                        continue
+                    by_event[event] = {
+                        'filing_date': filing['filing_date'],
+                        'form': filing['form'],
+                        'accession_number': filing['accession_number'],
+                        'item': '4.02',
+                        'amendments': []
+                    }
+                elif filing['form'] == '10-K/A':
+                    amendments.append(filing)
+            restatements = sorted(by_event.values(), key=lambda r: r['filing_date'], reverse=True)
+            
+            for amendment in amendments:
+                filed = datetime.strptime(amendment['filing_date'], '%Y-%m-%d')
+                for restatement in restatements:
+                    gap = (filed - datetime.strptime(restatement['filing_date'], '%Y-%m-%d')).days
+                    if 0 <= gap <= RESTATEMENT_AMENDMENT_DAYS:
+                        restatement['amendments'].append({
+                            'filing_date': amendment['filing_date'],
+                            'form': amendment['form'],
+                            'accession_number': amendment['accession_number'],
+                            'report_date': amendment['report_date']
                         })
+                        break
             
             return restatements
             
@@ -326,6 +652,55 @@ class SECEdgarFetcher:
             print(f"Error checking restatements: {e}")
             return []
     
+    def get_xbrl_restatements(self) -> Optional[List[Dict]]:
+        """
+        Restated fiscal years from companyfacts value revisions (see xbrl_revisions)
+        A later annual report re-tagging a period's net income, equity or total assets
+        with a materially different value. Uses the facts already loaded - no filing
+        documents. None when the company has no companyfacts.
+        """
+        facts = self.get_company_facts()
+        if facts is None:
+            return None
+        try:
+            return restated_years(fact_revisions(facts.facts))
+        except Exception as e:
+            print(f"Error checking XBRL revisions: {e}")
+            return None
+    
+    def get_debt_maturity(self) -> Optional[Dict]:
+        """
+        Latest long-term debt maturity ladder from companyfacts (see debt_maturity)
+        Under 2Y / 2-5Y / over 5Y principal and the share due within twelve months
+        """
+        facts = self.get_company_facts()
+        if facts is None:
+            return None
+        try:
+            return maturity_ladder(facts.facts)
+        except Exception as e:
+            print(f"Error building debt maturity ladder: {e}")
+            return None
+    
+    @staticmethod
+    def _insider_trades_enabled() -> bool:
+        try:
+            import config
+            return getattr(config, 'INSIDER_TRADES', True)
+        except ImportError:
+            return True
+    
+    def get_insider_activity(self) -> Optional[Dict]:
+        """
+        Trailing 12-month open-market insider buying/selling from Form 4s
+        Only Form 4s filed since the last update are downloaded (see insider_trades)
+        """
+        try:
+            return insider_summary(InsiderTrades(self).update())
+        except Exception as e:
+            print(f"Error updating insider trades: {e}")
+            return None
+    
     def get_comprehensive_data(self) -> Dict:
         """
         Get all available Edgar data for company
@@ -341,7 +716,14 @@ class SECEdgarFetcher:
             'segments': None,
             'history': None,
             'executives': None,
-            'restatements': []
+            'customers': None,
+            'breakdown': None,
+            'subsidiaries': None,
+            'insiders': None,
+            'pivots': None,
+            'restatements': [],
+            'xbrl_restatements': None,
+            'debt_maturity': None
         }
         
         # Get latest 10-K
@@ -350,44 +732,102 @@ class SECEdgarFetcher:
             data['10k'] = filing_10k
             print(f"  Found 10-K: {filing_10k['filing_date']}")
             
-            # Extract segments
-            time.sleep(0.1)  # Rate limiting
-            segments = self.extract_segments_from_10k(filing_10k['url'])
+            # Extract segments, history and customers from the same document
+            parsed = self.extract_10k_data(filing_10k['url'], filing_10k['filing_date'])
+            segments = parsed.get('segments')
             if segments:
                 data['segments'] = segments
                 print(f"  Extracted {segments.get('segment_count', 0)} segments")
             
-            # Extract history
-            time.sleep(0.1)
-            history = self.extract_company_history(filing_10k['url'])
+            # Dimensional XBRL revenue beats prose for segment counts and names
+            breakdown = self.get_revenue_breakdown(filing_10k['url'])
+            if breakdown:
+                data['breakdown'] = breakdown
+                if breakdown.get('segment_count'):
+                    data['segments'] = {
+                        'segment_count': breakdown['segment_count'],
+                        'segments': [s['name'] for s in breakdown['segments']],
+                        'method': 'xbrl',
+                    }
+                    print(f"  XBRL: {breakdown['segment_count']} segments, {breakdown['geo_count']} geographies")
+            
+            # Where the company is incorporated, from the Exhibit 21 subsidiary list
+            subsidiaries = self.get_subsidiary_footprint(filing_10k['url'])
+            if subsidiaries:
+                data['subsidiaries'] = subsidiaries
+                print(f"  Exhibit 21: {subsidiaries['subsidiary_count']} subsidiaries in "
+                      f"{subsidiaries['country_count']} countries")
+            
+            history = parsed.get('history')
             if history:
                 data['history'] = history
                 if 'founded_year' in history:
                     print(f"  Founded: {history['founded_year']}")
+            
+            customers = parsed.get('customers')
+            if customers:
+                data['customers'] = customers
+                if customers.get('top_customer_pct') is not None:
+                    print(f"  Largest customer: {customers['top_customer_pct']:.0f}% of revenue")
+        
+            # Year-over-year Item 1 / 1A similarity across the last PIVOT_YEARS 10-Ks
+            if self._pivot_years():
+                pivots = self.detect_pivots()
+                if pivots:
+                    data['pivots'] = pivots
+                    print(f"  10-K history: {len(pivots['years'])} year-over-year comparisons, "
+                          f"{pivots['pivot_count']} pivots")
         
         # Get latest proxy
-        time.sleep(0.1)
         proxy = self.get_latest_proxy()
         if proxy:
             data['proxy'] = proxy
             print(f"  Found Proxy: {proxy['filing_date']}")
             
             # Extract executive info
-            time.sleep(0.1)
             executives = self.extract_executive_info(proxy['url'])
             if executives:
                 data['executives'] = executives
                 if executives.get('ceo', {}).get('tenure_years'):
                     print(f"  CEO Tenure: {executives['ceo']['tenure_years']} years")
         
+        # Insider open-market activity (Form 4)
+        if self._insider_trades_enabled():
+            insiders = self.get_insider_activity()
+            if insiders:
+                data['insiders'] = insiders
+                print(f"  Insiders (12M): {insiders['buy_count']} buys / {insiders['sell_count']} sells")
+        
         # Check for restatements
-        time.sleep(0.1)
         restatements = self.check_for_restatements()
         data['restatements'] = restatements
-        print(f"  Found {len(restatements)} 8-K filings (last 5Y)")
+        print(f"  Found {len(restatements)} restatements (8-K Item 4.02, last 5Y)")
+        
+        xbrl_restatements = self.get_xbrl_restatements()
+        if xbrl_restatements is not None:
+            data['xbrl_restatements'] = xbrl_restatements
+            print(f"  XBRL: {len(xbrl_restatements)} restated fiscal years (revised in later filings)")
+        
+        debt_maturity = self.get_debt_maturity()
+        if debt_maturity:
+            data['debt_maturity'] = debt_maturity
+            print(f"  XBRL: debt ladder {debt_maturity['period_end']}, "
+                  f"{debt_maturity['short_term_debt_pct']:.0f}% due within 12 months")
         
         return data
 
+
+def geographic_count(edgar_data: Optional[Dict]) -> int:
+    """
+    One geography count for a company's comprehensive Edgar data (0 when unknown)
+    Countries with subsidiaries (Exhibit 21) are the broader footprint; revenue
+    geographies from the XBRL instance otherwise.
+    """
+    edgar_data = edgar_data or {}
+    subsidiaries = edgar_data.get('subsidiaries') or {}
+    breakdown = edgar_data.get('breakdown') or {}
+    return subsidiaries.get('country_count') or breakdown.get('geo_count') or 0
+
 # Example usage
 if __name__ == "__main__":
     # Test with a known CIK
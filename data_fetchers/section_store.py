@@ -0,0 +1,168 @@
+"""
+Section Store - 10-K Item sections split once and indexed locally with SQLite FTS5
+Each 10-K is streamed through SectionTextParser a single time; Items 1, 1A, 7, 7A and 8
+are stored keyed by (cik, accession, item). Extractors and AI prompts then read sections
+without touching the network, and cross-universe questions become one FTS query:
+
+    store.search('NEAR(customer "accounted for", 8)', items=['1', '8'])
+"""
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from data_fetchers.filing_text import TEXT_PARSER_VERSION
+
+# Business, Risk Factors, MD&A, Market Risk, Financial Statements
+STORE_ITEMS = ('1', '1a', '7', '7a', '8')
+
+DEFAULT_DB_PATH = os.path.join(".cache", "sections.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS filings (
+    accession TEXT PRIMARY KEY,
+    cik TEXT NOT NULL,
+    form TEXT,
+    filing_date TEXT,
+    parser_version INTEGER,      -- TEXT_PARSER_VERSION the sections were split with
+    indexed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS filings_cik ON filings (cik, filing_date);
+CREATE VIRTUAL TABLE IF NOT EXISTS sections USING fts5(
+    body,
+    cik UNINDEXED,
+    accession UNINDEXED,
+    item UNINDEXED,
+    tokenize = 'porter unicode61'
+);
+"""
+
+
+class SectionStore:
+    """FTS5 index of 10-K Item sections keyed by CIK, accession and item"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ---------------------------------------------------------------- write
+
+    def has_filing(self, accession: str) -> bool:
+        """True when the filing was split with the current parser version"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT parser_version FROM filings WHERE accession = ?", (accession,)).fetchone()
+        return row is not None and row[0] == TEXT_PARSER_VERSION
+
+    def add_filing(self, cik: str, accession: str, sections: Dict[str, str],
+                   form: str = '10-K', filing_date: Optional[str] = None):
+        """Replace a filing's sections (a filing with no sections is still recorded as done)"""
+        cik = str(cik).zfill(10)
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM sections WHERE accession = ?", (accession,))
+            conn.executemany(
+                "INSERT INTO sections (body, cik, accession, item) VALUES (?, ?, ?, ?)",
+                [(text, cik, accession, item) for item, text in sections.items() if text])
+            conn.execute("INSERT OR REPLACE INTO filings VALUES (?, ?, ?, ?, ?, ?)",
+                         (accession, cik, form, filing_date, TEXT_PARSER_VERSION, datetime.now().isoformat()))
+            conn.commit()
+
+    # ---------------------------------------------------------------- read
+
+    def get_sections(self, accession: str, items: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """{item: text} for one filing"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT item, body FROM sections WHERE accession = ?", (accession,)).fetchall()
+        wanted = {i.lower() for i in items} if items else None
+        return {item: body for item, body in rows if wanted is None or item in wanted}
+
+    def latest_section(self, cik: str, item: str) -> Optional[str]:
+        """Item text from the company's most recent indexed filing"""
+        with self._lock:
+            row = self._connect().execute(
+                """SELECT s.body FROM sections s JOIN filings f ON f.accession = s.accession
+                   WHERE f.cik = ? AND s.item = ? ORDER BY f.filing_date DESC LIMIT 1""",
+                (str(cik).zfill(10), item.lower())).fetchone()
+        return row[0] if row else None
+
+    def search(self, query: str, items: Optional[Iterable[str]] = None,
+               ciks: Optional[Iterable[str]] = None, limit: int = 50) -> List[Dict]:
+        """
+        FTS5 query across every indexed filing, best matches first
+        Returns dicts with cik, accession, item, filing_date and a highlighted snippet
+        """
+        sql = """SELECT s.cik, s.accession, s.item, f.filing_date,
+                        snippet(sections, 0, '[', ']', '...', 24)
+                 FROM sections s JOIN filings f ON f.accession = s.accession
+                 WHERE sections MATCH ?"""
+        params = [query]
+        if items:
+            items = [i.lower() for i in items]
+            sql += f" AND s.item IN ({','.join('?' * len(items))})"
+            params += items
+        if ciks:
+            ciks = [str(c).zfill(10) for c in ciks]
+            sql += f" AND s.cik IN ({','.join('?' * len(ciks))})"
+            params += ciks
+        sql += " ORDER BY bm25(sections) LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [{'cik': cik, 'accession': accession, 'item': item, 'filing_date': filing_date, 'snippet': snippet}
+                for cik, accession, item, filing_date, snippet in rows]
+
+    def status(self) -> Dict:
+        with self._lock:
+            conn = self._connect()
+            filings, companies = conn.execute("SELECT COUNT(*), COUNT(DISTINCT cik) FROM filings").fetchone()
+            sections = conn.execute("SELECT COUNT(*) FROM sections").fetchone()[0]
+        return {'filings': filings, 'companies': companies, 'sections': sections}
+
+
+_STORE = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_section_store() -> Optional[SectionStore]:
+    """Shared store from config.SECTION_STORE_DB, or None when disabled"""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            try:
+                import config
+                db_path = getattr(config, 'SECTION_STORE_DB', DEFAULT_DB_PATH)
+            except ImportError:
+                db_path = DEFAULT_DB_PATH
+            if not db_path:
+                return None
+            _STORE = SectionStore(db_path)
+        return _STORE
+
+
+if __name__ == "__main__":
+    # python -m data_fetchers.section_store 'NEAR(customer "accounted for", 8)' [item ...]
+    import sys
+    store = get_section_store()
+    if store is None or len(sys.argv) < 2:
+        print(f"Usage: python -m data_fetchers.section_store QUERY [ITEM ...]  (store: {store and store.status()})")
+        sys.exit(1)
+    for hit in store.search(sys.argv[1], items=sys.argv[2:] or None):
+        print(f"{hit['cik']}  {hit['filing_date']}  Item {hit['item']:<3} {hit['snippet']}")
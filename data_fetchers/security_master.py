@@ -0,0 +1,156 @@
+"""
+Security Master - ticker -> CIK / name / exchange / Yahoo metadata, held locally
+Built from SEC's company_tickers_exchange.json (every listed filer in one file) plus
+cached Yahoo metadata (ISIN, sector, industry, country, currency). Both halves are
+refreshed weekly and loaded once per run as a dict index, so CIKs are known before
+any per-ticker call and the Tickers sheet needs no network at all.
+"""
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+from data_fetchers.utils import cache_data, load_cached_data
+from data_fetchers.cache_metrics import record_network
+
+SEC_TICKERS_URL = "https://www.sec.gov/files/company_tickers_exchange.json"
+
+# Listings and classifications change slowly - refresh weekly
+MASTER_MAX_AGE_DAYS = 7
+
+SEC_TICKERS_KEY = "secmaster_tickers"
+YAHOO_META_KEY = "secmaster_yahoo"
+
+YAHOO_FIELDS = ('isin', 'sector', 'industry', 'country', 'currency', 'exchange')
+
+
+def _normalize_ticker(ticker: str) -> str:
+    """SEC and Yahoo both write share classes with '-' (BRK-B); accept '.' too"""
+    return ticker.strip().upper().replace('.', '-')
+
+
+class SecurityMaster:
+    """In-memory index over the persisted SEC ticker list and Yahoo metadata"""
+
+    def __init__(self, session=None):
+        self._session = session
+        self._lock = threading.RLock()
+        self._sec = None
+        self._yahoo = None
+
+    # ---------------------------------------------------------------- SEC half
+
+    def _load_sec(self) -> Dict[str, Dict]:
+        with self._lock:
+            if self._sec is None:
+                index = load_cached_data(SEC_TICKERS_KEY, max_age_days=MASTER_MAX_AGE_DAYS)
+                if index is None:
+                    # A stale list beats none when SEC is unreachable
+                    index = self._fetch_sec() or load_cached_data(SEC_TICKERS_KEY, max_age_days=3650) or {}
+                self._sec = index
+            return self._sec
+
+    def _fetch_sec(self) -> Optional[Dict[str, Dict]]:
+        from data_fetchers.rate_limit import sec_session
+        from data_fetchers.sec_edgar import SEC_USER_AGENT
+
+        session = self._session or sec_session()
+        session.headers.update({'User-Agent': SEC_USER_AGENT, 'Accept-Encoding': 'gzip, deflate'})
+        try:
+            response = session.get(SEC_TICKERS_URL, timeout=60)
+            record_network(SEC_TICKERS_KEY, len(response.content))
+            response.raise_for_status()
+            payload = response.json()
+        except Exception as e:
+            print(f"Error fetching SEC ticker list: {e}")
+            return None
+
+        fields = payload.get('fields', [])
+        index = {}
+        for row in payload.get('data', []):
+            record = dict(zip(fields, row))
+            if not record.get('ticker'):
+                continue
+            ticker = _normalize_ticker(record['ticker'])
+            # A CIK can list several tickers; keep the first listing of each ticker
+            index.setdefault(ticker, {
+                'cik': str(record.get('cik', '')).zfill(10),
+                'name': record.get('name'),
+                'exchange': record.get('exchange'),
+            })
+        cache_data(SEC_TICKERS_KEY, index)
+        return index
+
+    # ---------------------------------------------------------------- Yahoo half
+
+    def _load_yahoo(self) -> Dict[str, Dict]:
+        with self._lock:
+            if self._yahoo is None:
+                self._yahoo = load_cached_data(YAHOO_META_KEY, max_age_days=3650) or {}
+            return self._yahoo
+
+    def yahoo_is_fresh(self, ticker: str) -> bool:
+        meta = self._load_yahoo().get(_normalize_ticker(ticker))
+        if not meta or not meta.get('updated'):
+            return False
+        return datetime.now() - datetime.fromisoformat(meta['updated']) < timedelta(days=MASTER_MAX_AGE_DAYS)
+
+    def record_yahoo(self, ticker: str, info: Dict, isin: Optional[str] = None):
+        """Store Yahoo metadata from an info dict the caller already fetched (no network)"""
+        if not info:
+            return
+        meta = {field: info.get(field) for field in YAHOO_FIELDS}
+        previous = self._load_yahoo().get(_normalize_ticker(ticker)) or {}
+        meta['isin'] = isin or info.get('isin') or previous.get('isin')
+        meta['name'] = info.get('longName', info.get('shortName'))
+        meta['cik'] = str(info['cik']).zfill(10) if info.get('cik') else None
+        meta['updated'] = datetime.now().isoformat()
+        with self._lock:
+            self._load_yahoo()[_normalize_ticker(ticker)] = meta
+            cache_data(YAHOO_META_KEY, self._yahoo)
+
+    def refresh_yahoo(self, tickers: Iterable[str], force: bool = False):
+        """Fetch Yahoo metadata for tickers missing it or older than a week"""
+        from data_fetchers.yahoo_finance import YahooFinanceFetcher
+
+        for ticker in tickers:
+            if not force and self.yahoo_is_fresh(ticker):
+                continue
+            yahoo = YahooFinanceFetcher(ticker)
+            info = yahoo.get_info()
+            isin = None
+            try:
+                record_network(f"yf_isin_{ticker}")
+                isin = yahoo.stock.isin
+            except Exception:
+                pass
+            self.record_yahoo(ticker, info, isin if isin and isin != '-' else None)
+
+    # ---------------------------------------------------------------- lookups
+
+    def get(self, ticker: str) -> Dict:
+        """Everything known about a ticker; SEC fields win for cik/name/exchange"""
+        key = _normalize_ticker(ticker)
+        record = dict(self._load_yahoo().get(key) or {})
+        record.update({k: v for k, v in (self._load_sec().get(key) or {}).items() if v})
+        return record
+
+    def cik(self, ticker: str) -> Optional[str]:
+        return self.get(ticker).get('cik')
+
+    def __contains__(self, ticker: str) -> bool:
+        return _normalize_ticker(ticker) in self._load_sec()
+
+    def __len__(self) -> int:
+        return len(self._load_sec())
+
+
+_MASTER = None
+_MASTER_LOCK = threading.Lock()
+
+
+def get_security_master() -> SecurityMaster:
+    """Process-wide master - loaded once per run"""
+    global _MASTER
+    with _MASTER_LOCK:
+        if _MASTER is None:
+            _MASTER = SecurityMaster()
+        return _MASTER
@@ -2,6 +2,8 @@
 Third-party data sources (FRED, etc.)
 """
 import requests
+from data_fetchers.http_cache import conditional_get
+from data_fetchers.utils import cache_negative, load_negative, NEG_BAD_API_KEY, NEG_NO_DATA
 
 class FREDFetcher:
     """Fetch data from FRED (Federal Reserve Economic Data)"""
@@ -9,12 +11,16 @@ class FREDFetcher:
     def __init__(self, api_key=None):
         self.api_key = api_key
         self.base_url = "https://api.stlouisfed.org/fred"
+        self.session = requests.Session()
     
     def get_10y_treasury_yield(self):
         """Get current 10-year Treasury yield"""
         if not self.api_key:
             return None
         
+        if load_negative("fred_DGS10"):
+            return None
+        
         try:
             url = f"{self.base_url}/series/observations"
             params = {
@@ -24,11 +30,17 @@ class FREDFetcher:
                 'sort_order': 'desc',
                 'limit': 1
             }
-            response = requests.get(url, params=params)
-            data = response.json()
+            # Cache key deliberately excludes the API key
+            data = conditional_get(self.session, url, "fred_DGS10_latest", params=params)
             
             if 'observations' in data and len(data['observations']) > 0:
                 return float(data['observations'][0]['value'])
+            cache_negative("fred_DGS10", NEG_NO_DATA, "no observations")
+        except requests.HTTPError as e:
+            # FRED answers an unregistered/missing key with 400
+            if e.response is not None and e.response.status_code in (400, 401, 403):
+                cache_negative("fred_DGS10", NEG_BAD_API_KEY, f"HTTP {e.response.status_code}")
+            print(f"FRED API error: {e}")
         except Exception as e:
             print(f"FRED API error: {e}")
         
@@ -0,0 +1,29 @@
+"""
+Universe helpers shared by the batch scripts
+Ticker lists from a universe file, and companyfacts from local storage only (bulk store,
+then the revalidation cache) for the offline whole-universe scans.
+"""
+from typing import Dict, List, Optional
+from data_fetchers.http_cache import VALIDATOR_MAX_AGE_DAYS
+from data_fetchers.utils import load_cached_data
+
+
+def load_universe(path: str) -> List[str]:
+    """Read tickers from a universe file (one per line, '#' starts a comment)"""
+    tickers = []
+    with open(path) as f:
+        for line in f:
+            ticker = line.split('#', 1)[0].strip().upper()
+            if ticker:
+                tickers.append(ticker)
+    return tickers
+
+
+def local_companyfacts(cik: str, bulk) -> Optional[Dict]:
+    """companyfacts JSON from the bulk store, else the revalidation cache (None when neither has it)"""
+    if bulk:
+        facts_json = bulk.get_companyfacts(cik)
+        if facts_json is not None:
+            return facts_json
+    cached = load_cached_data(f"sec_companyfacts_{cik}", max_age_days=VALIDATOR_MAX_AGE_DAYS)
+    return cached.get('body') if cached else None
@@ -5,7 +5,11 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import os
-import json
+from data_fetchers.cache_codecs import encode_entry, decode_entry, decode_legacy_json, CodecError, MAGIC
+from data_fetchers.cache_metrics import METRICS, split_cache_key
+from data_fetchers.cache_backends import (
+    LocalDirBackend, SharedDirBackend, RedisBackend, InMemoryRedis, TieredBackend
+)
 
 def safe_divide(numerator, denominator, default=None):
     """Safely divide two numbers, returning default if denominator is 0 or None"""
@@ -55,36 +59,156 @@ def get_last_updated():
     """Return current date in YYYY-MM-DD format"""
     return datetime.now().strftime("%Y-%m-%d")
 
+# One backend per cache_dir, built on first use from config.CACHE_BACKEND
+_BACKENDS = {}
+
+def _build_backend(cache_dir):
+    """Local directory, optionally fronting a shared directory or Redis-protocol store"""
+    local = LocalDirBackend(cache_dir)
+    try:
+        import config
+    except ImportError:
+        return local
+    
+    kind = getattr(config, 'CACHE_BACKEND', 'local')
+    if kind == 'shared_dir' and getattr(config, 'CACHE_SHARED_DIR', None):
+        return TieredBackend(local, SharedDirBackend(config.CACHE_SHARED_DIR))
+    if kind == 'redis' and getattr(config, 'CACHE_REDIS_URL', None):
+        return TieredBackend(local, RedisBackend(url=config.CACHE_REDIS_URL))
+    if kind == 'memory':
+        return TieredBackend(local, RedisBackend(client=InMemoryRedis()))
+    return local
+
+def get_cache_backend(cache_dir=".cache"):
+    """Backend serving cache_dir"""
+    if cache_dir not in _BACKENDS:
+        _BACKENDS[cache_dir] = _build_backend(cache_dir)
+    return _BACKENDS[cache_dir]
+
+def set_cache_backend(backend, cache_dir=".cache"):
+    """Override the backend for cache_dir (tests, sharded workers)"""
+    _BACKENDS[cache_dir] = backend
+
 def cache_data(cache_key, data, cache_dir=".cache"):
-    """Cache data to avoid repeated API calls"""
-    os.makedirs(cache_dir, exist_ok=True)
-    cache_file = os.path.join(cache_dir, f"{cache_key}.json")
-    with open(cache_file, 'w') as f:
-        json.dump({
-            'timestamp': datetime.now().isoformat(),
-            'data': data
-        }, f)
+    """
+    Cache data to avoid repeated API calls
+    Stored in the binary codec format (see cache_codecs) - dicts, DataFrames and raw text
+    """
+    raw = encode_entry(data)
+    get_cache_backend(cache_dir).put(cache_key, raw)
+    METRICS.record_write(*split_cache_key(cache_key), len(raw))
+
+def delete_cached_data(cache_key, cache_dir=".cache"):
+    """Remove an entry from every cache tier"""
+    get_cache_backend(cache_dir).delete(cache_key)
+
+def _decode_raw(raw):
+    """(timestamp, data) from entry bytes, reading old JSON entries transparently"""
+    if raw is None:
+        return None, None
+    try:
+        if raw[:len(MAGIC)] == MAGIC:
+            return decode_entry(raw)
+        return decode_legacy_json(raw)
+    except (CodecError, ValueError, KeyError):
+        return None, None
+
+def _read_cache_entry(cache_key, cache_dir=".cache"):
+    """Return (timestamp, data, size in bytes) for a cache entry"""
+    raw = get_cache_backend(cache_dir).get(cache_key)
+    cache_time, data = _decode_raw(raw)
+    return cache_time, data, len(raw) if raw else 0
 
 def load_cached_data(cache_key, max_age_days=1, cache_dir=".cache"):
     """Load cached data if available and not expired"""
-    cache_file = os.path.join(cache_dir, f"{cache_key}.json")
-    if not os.path.exists(cache_file):
+    source, dataset = split_cache_key(cache_key)
+    cache_time, data, size = _read_cache_entry(cache_key, cache_dir)
+    
+    # A stale local copy may have been refreshed by another worker in the shared tier
+    backend = get_cache_backend(cache_dir)
+    if cache_time is not None and (datetime.now() - cache_time).days > max_age_days \
+            and hasattr(backend, 'get_shared'):
+        raw = backend.get_shared(cache_key)
+        shared_time, shared_data = _decode_raw(raw)
+        if shared_time is not None and shared_time > cache_time:
+            cache_time, data, size = shared_time, shared_data, len(raw)
+    
+    if cache_time is None:
+        METRICS.record(source, dataset, 'miss')
+        return None
+    
+    age = datetime.now() - cache_time
+    if age.days <= max_age_days:
+        METRICS.record(source, dataset, 'hit', nbytes=size, age_seconds=age.total_seconds())
+        return data
+    
+    METRICS.record(source, dataset, 'stale')
+    return None
+
+# Negative cache: lookups known to fail, each reason with its own (shorter) TTL
+NEG_NO_CIK = 'no_cik'
+NEG_NOT_FOUND = 'not_found'
+NEG_NO_DOCUMENT = 'no_document'
+NEG_NO_DATA = 'no_data'
+NEG_BAD_API_KEY = 'bad_api_key'
+
+NEGATIVE_TTL_DAYS = {
+    NEG_NO_CIK: 7,
+    NEG_NOT_FOUND: 3,
+    NEG_NO_DOCUMENT: 30,  # Filings are immutable - a missing doc stays missing
+    NEG_NO_DATA: 1,
+    NEG_BAD_API_KEY: 1,
+}
+
+def cache_negative(cache_key, reason, detail="", cache_dir=".cache"):
+    """Record that a lookup failed so it can be skipped until the reason's TTL runs out"""
+    cache_data(f"neg_{cache_key}", {
+        'key': cache_key,
+        'reason': reason,
+        'detail': detail,
+        'ttl_days': NEGATIVE_TTL_DAYS.get(reason, 1)
+    }, cache_dir=cache_dir)
+
+def load_negative(cache_key, cache_dir=".cache", record=True):
+    """Return the negative entry for a lookup if it is still live, else None (record=False: no metrics hit)"""
+    cache_time, entry, _ = _read_cache_entry(f"neg_{cache_key}", cache_dir)
+    if cache_time is None:
         return None
     
     try:
-        with open(cache_file, 'r') as f:
-            cached = json.load(f)
-        
-        cache_time = datetime.fromisoformat(cached['timestamp'])
-        age_days = (datetime.now() - cache_time).days
-        
-        if age_days <= max_age_days:
-            return cached['data']
-    except:
+        age = datetime.now() - cache_time
+        if age.total_seconds() <= entry['ttl_days'] * 86400:
+            if record:
+                METRICS.record(*split_cache_key(cache_key), 'negative')
+            return entry
+    except (KeyError, TypeError):
         pass
     
     return None
 
+def list_negative_entries(cache_dir=".cache"):
+    """All live negative entries, for the end-of-run report"""
+    entries = []
+    for key in get_cache_backend(cache_dir).keys("neg_"):
+        entry = load_negative(key[len("neg_"):], cache_dir=cache_dir, record=False)
+        if entry:
+            entries.append(entry)
+    return entries
+
+def print_negative_report(cache_dir=".cache"):
+    """Print known-bad lookups grouped by reason so they can be fixed"""
+    entries = list_negative_entries(cache_dir)
+    print(f"\nNEGATIVE CACHE: {len(entries)} known-bad lookups")
+    by_reason = {}
+    for entry in entries:
+        by_reason.setdefault(entry['reason'], []).append(entry)
+    for reason, items in sorted(by_reason.items()):
+        print(f"  {reason} ({len(items)}, retried after {NEGATIVE_TTL_DAYS.get(reason, 1)}d):")
+        for entry in items:
+            detail = f" - {entry['detail']}" if entry.get('detail') else ""
+            print(f"    {entry['key']}{detail}")
+    return entries
+
 def format_currency(value):
     """Format value as currency string"""
     if value is None or pd.isna(value):
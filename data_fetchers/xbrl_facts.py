@@ -0,0 +1,268 @@
+"""
+XBRL Company Facts Engine
+Parses SEC api/xbrl/companyfacts/CIK##########.json (every tagged fact, every period,
+one request per issuer) into a typed, columnar per-ticker time series.
+
+The annual table feeds the same metrics_10y / crisis_performance shapes FMPFetcher
+produces, so ROE_ROIC, OperatingHistory, Leverage and Resilience work without FMP.
+"""
+import statistics
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+import pandas as pd
+
+# metric -> (concepts in preference order, unit, instant?)
+# Concepts are 'taxonomy:Name'; bare names are us-gaap
+CONCEPT_MAP = {
+    'revenue': ([
+        'Revenues',
+        'RevenueFromContractWithCustomerExcludingAssessedTax',
+        'RevenueFromContractWithCustomerIncludingAssessedTax',
+        'SalesRevenueNet',
+        'SalesRevenueGoodsNet',
+    ], 'USD', False),
+    'gross_profit': (['GrossProfit'], 'USD', False),
+    'operating_income': (['OperatingIncomeLoss'], 'USD', False),
+    'net_income': (['NetIncomeLoss', 'ProfitLoss', 'NetIncomeLossAvailableToCommonStockholdersBasic'], 'USD', False),
+    'interest_expense': (['InterestExpense', 'InterestExpenseDebt', 'InterestPaidNet'], 'USD', False),
+    'operating_cash_flow': (['NetCashProvidedByUsedInOperatingActivities'], 'USD', False),
+    'capex': (['PaymentsToAcquirePropertyPlantAndEquipment'], 'USD', False),
+    'eps_diluted': (['EarningsPerShareDiluted', 'EarningsPerShareBasicAndDiluted'], 'USD/shares', False),
+    'eps_basic': (['EarningsPerShareBasic', 'EarningsPerShareBasicAndDiluted'], 'USD/shares', False),
+    'equity': ([
+        'StockholdersEquity',
+        'StockholdersEquityIncludingPortionAttributableToNoncontrollingInterest',
+    ], 'USD', True),
+    'total_assets': (['Assets'], 'USD', True),
+    'long_term_debt': (['LongTermDebtNoncurrent', 'LongTermDebt', 'LongTermDebtAndCapitalLeaseObligations'], 'USD', True),
+    'current_debt': (['LongTermDebtCurrent', 'DebtCurrent', 'ShortTermBorrowings'], 'USD', True),
+    'cash': ([
+        'CashAndCashEquivalentsAtCarryingValue',
+        'CashCashEquivalentsRestrictedCashAndRestrictedCashEquivalents',
+    ], 'USD', True),
+    'shares_outstanding': ([
+        'dei:EntityCommonStockSharesOutstanding',
+        'CommonStockSharesOutstanding',
+    ], 'shares', True),
+}
+
+ANNUAL_FORMS = ('10-K', '10-K/A', '20-F', '20-F/A', '40-F', '40-F/A')
+
+# Annual durations are ~365 days; 52/53-week fiscal years land inside this window
+MIN_ANNUAL_DAYS = 330
+MAX_ANNUAL_DAYS = 400
+
+# Rough NOPAT for ROIC when no tax line is mapped
+ASSUMED_TAX_RATE = 0.21
+
+COLUMNS = ['taxonomy', 'concept', 'unit', 'start', 'end', 'val', 'accn', 'fy', 'fp', 'form', 'filed', 'frame']
+
+
+def _split_concept(name: str):
+    return tuple(name.split(':', 1)) if ':' in name else ('us-gaap', name)
+
+
+def parse_companyfacts(facts_json: Dict, concepts: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Flatten companyfacts JSON into one typed row per reported fact
+    Columns: taxonomy, concept, unit, start, end, val, accn, fy, fp, form, filed, frame
+    Pass `concepts` (concept names) to keep only those - much faster for a narrow question.
+    """
+    wanted = set(concepts) if concepts is not None else None
+    columns = {name: [] for name in COLUMNS}
+    for taxonomy, taxonomy_concepts in (facts_json.get('facts') or {}).items():
+        for concept, body in taxonomy_concepts.items():
+            if wanted is not None and concept not in wanted:
+                continue
+            for unit, facts in (body.get('units') or {}).items():
+                for fact in facts:
+                    columns['taxonomy'].append(taxonomy)
+                    columns['concept'].append(concept)
+                    columns['unit'].append(unit)
+                    columns['start'].append(fact.get('start'))
+                    columns['end'].append(fact.get('end'))
+                    columns['val'].append(fact.get('val'))
+                    columns['accn'].append(fact.get('accn'))
+                    columns['fy'].append(fact.get('fy'))
+                    columns['fp'].append(fact.get('fp'))
+                    columns['form'].append(fact.get('form'))
+                    columns['filed'].append(fact.get('filed'))
+                    columns['frame'].append(fact.get('frame'))
+
+    df = pd.DataFrame(columns)
+    for col in ('taxonomy', 'concept', 'unit', 'fp', 'form'):
+        df[col] = df[col].astype('category')
+    for col in ('start', 'end', 'filed'):
+        df[col] = pd.to_datetime(df[col], errors='coerce')
+    df['val'] = pd.to_numeric(df['val'], errors='coerce').astype('float64')
+    df['fy'] = pd.to_numeric(df['fy'], errors='coerce').astype('Int64')
+    return df
+
+
+def _mean(values: List[float]) -> Optional[float]:
+    return statistics.mean(values) if values else None
+
+
+def _cagr(series: pd.Series) -> Optional[float]:
+    """CAGR (%) between the first and last value of a year-indexed series"""
+    series = series.dropna()
+    if len(series) < 2 or series.iloc[0] <= 0 or series.iloc[-1] <= 0:
+        return None
+    years = series.index[-1] - series.index[0]
+    if years <= 0:
+        return None
+    return ((series.iloc[-1] / series.iloc[0]) ** (1 / years) - 1) * 100
+
+
+class CompanyFacts:
+    """Columnar view over one issuer's companyfacts"""
+
+    def __init__(self, facts_json: Dict):
+        self.cik = str(facts_json.get('cik', '')).zfill(10)
+        self.entity_name = facts_json.get('entityName')
+        self.facts = parse_companyfacts(facts_json)
+        self._annual = None
+
+    def annual_series(self, metric: str) -> pd.Series:
+        """
+        One value per fiscal year (keyed by period-end year) for a mapped metric
+        Uses annual-report facts only; the latest filing wins, so restated values replace originals
+        """
+        concepts, unit, instant = CONCEPT_MAP[metric]
+        rank = {_split_concept(name): i for i, name in enumerate(concepts)}
+
+        df = self.facts
+        if df.empty:
+            return pd.Series(dtype='float64', name=metric)
+
+        # Narrow on the categorical concept column first; rank only the survivors
+        df = df[df['concept'].isin([concept for _, concept in rank]) & (df['unit'] == unit)
+                & df['form'].isin(ANNUAL_FORMS) & df['val'].notna()]
+        keys = zip(df['taxonomy'].astype(str), df['concept'].astype(str))
+        df = df.assign(rank=[rank.get(k, -1) for k in keys])
+        df = df[df['rank'] >= 0]
+
+        if instant:
+            df = df[df['start'].isna()]
+        else:
+            days = (df['end'] - df['start']).dt.days
+            df = df[(days >= MIN_ANNUAL_DAYS) & (days <= MAX_ANNUAL_DAYS)]
+        if df.empty:
+            return pd.Series(dtype='float64', name=metric)
+
+        df = df.assign(year=df['end'].dt.year)
+        # Best concept first, then the latest period end in the year, then the latest filing
+        df = df.sort_values(['year', 'rank', 'end', 'filed'], ascending=[True, True, False, False])
+        series = df.drop_duplicates('year').set_index('year')['val']
+        series.name = metric
+        return series
+
+    def annual_table(self) -> pd.DataFrame:
+        """Fiscal-year x metric table for every mapped metric"""
+        if self._annual is None:
+            self._annual = pd.concat([self.annual_series(m) for m in CONCEPT_MAP], axis=1).sort_index()
+            self._annual.index.name = 'fiscal_year'
+        return self._annual
+
+    def calculate_10y_metrics(self) -> Dict:
+        """Same shape as FMPFetcher.calculate_10y_metrics (percentages, newest data last)"""
+        table = self.annual_table().tail(10)
+        metrics = {
+            'roe': {}, 'roic': {}, 'margins': {}, 'valuation': {},
+            'growth': {}, 'volatility': {}, 'leverage': {}
+        }
+        if table.empty:
+            return metrics
+
+        def recent(series: pd.Series, n: int) -> List[float]:
+            return [float(v) for v in series.dropna().tail(n)]
+
+        # A year with neither debt line tagged is unknown, not debt-free; one missing line is zero
+        debt = table['long_term_debt'].fillna(0) + table['current_debt'].fillna(0)
+        debt = debt.where(table['long_term_debt'].notna() | table['current_debt'].notna())
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            roe = (table['net_income'] / table['equity'] * 100).replace([np.inf, -np.inf], np.nan)
+            invested = table['equity'] + debt
+            roic = (table['operating_income'] * (1 - ASSUMED_TAX_RATE) / invested * 100).replace([np.inf, -np.inf], np.nan)
+            gross = table['gross_profit'] / table['revenue'] * 100
+            operating = table['operating_income'] / table['revenue'] * 100
+            fcf = (table['operating_cash_flow'] - table['capex'].fillna(0)) / table['revenue'] * 100
+            debt_equity = (debt / table['equity']).replace([np.inf, -np.inf], np.nan)
+
+        roe_10y = recent(roe, 10)
+        if roe_10y:
+            metrics['roe'] = {
+                'avg_10y': _mean(roe_10y),
+                'median_10y': statistics.median(roe_10y),
+                'avg_5y': _mean(recent(roe, 5)) if len(roe_10y) >= 5 else None,
+                'std_10y': statistics.stdev(roe_10y) if len(roe_10y) > 1 else 0
+            }
+
+        roic_10y = recent(roic, 10)
+        if roic_10y:
+            metrics['roic'] = {
+                'avg_10y': _mean(roic_10y),
+                'median_10y': statistics.median(roic_10y),
+                'avg_5y': _mean(recent(roic, 5)) if len(roic_10y) >= 5 else None,
+                'std_10y': statistics.stdev(roic_10y) if len(roic_10y) > 1 else 0
+            }
+
+        gross_10y = recent(gross, 10)
+        if gross_10y:
+            metrics['margins']['gross_avg_5y'] = _mean(recent(gross, 5)) if len(gross_10y) >= 5 else None
+            metrics['margins']['gross_std_10y'] = statistics.stdev(gross_10y) if len(gross_10y) > 1 else 0
+
+        op_10y = recent(operating, 10)
+        if op_10y:
+            metrics['margins']['operating_avg_5y'] = _mean(recent(operating, 5)) if len(op_10y) >= 5 else None
+            metrics['margins']['operating_std_10y'] = statistics.stdev(op_10y) if len(op_10y) > 1 else 0
+
+        fcf_5y = recent(fcf, 5)
+        if len(fcf_5y) >= 5:
+            metrics['margins']['fcf_avg_5y'] = _mean(fcf_5y)
+
+        revenue_cagr = _cagr(table['revenue'])
+        if revenue_cagr is not None:
+            metrics['growth']['revenue_cagr_10y'] = revenue_cagr
+        eps = table['eps_diluted'].fillna(table['eps_basic'])
+        eps_cagr = _cagr(eps)
+        if eps_cagr is not None:
+            metrics['growth']['eps_cagr_10y'] = eps_cagr
+
+        rev_growth = [float(v) for v in (table['revenue'].dropna().pct_change() * 100).dropna()]
+        if rev_growth:
+            std = statistics.stdev(rev_growth) if len(rev_growth) > 1 else 0
+            mean = statistics.mean(rev_growth)
+            metrics['volatility']['revenue_std'] = std
+            metrics['volatility']['revenue_cov'] = (std / abs(mean)) if mean != 0 else 0
+
+        de_5y = recent(debt_equity, 5)
+        if de_5y:
+            metrics['leverage']['debt_equity_avg_5y'] = _mean(de_5y) if len(de_5y) >= 5 else None
+            metrics['leverage']['debt_equity_latest'] = de_5y[-1]
+
+        latest = table.iloc[-1]
+        if pd.notna(latest['operating_income']) and pd.notna(latest['interest_expense']) and latest['interest_expense'] > 0:
+            metrics['leverage']['interest_coverage'] = float(latest['operating_income'] / latest['interest_expense'])
+
+        return metrics
+
+    def crisis_performance(self) -> Dict:
+        """Same shape as FMPFetcher.get_crisis_performance (2007->2009 and 2019->2020)"""
+        table = self.annual_table()
+        eps = table['eps_diluted'].fillna(table['eps_basic']) if not table.empty else pd.Series(dtype='float64')
+        crisis = {'2008_2009': {}, '2020': {}}
+        for label, before, after in (('2008_2009', 2007, 2009), ('2020', 2019, 2020)):
+            if before not in table.index or after not in table.index:
+                continue
+            rev_before, rev_after = table.at[before, 'revenue'], table.at[after, 'revenue']
+            if pd.isna(rev_before) or pd.isna(rev_after) or rev_before == 0:
+                continue
+            eps_before, eps_after = eps.get(before), eps.get(after)
+            crisis[label] = {
+                'revenue_change_pct': float((rev_after - rev_before) / rev_before * 100),
+                'eps_change_pct': float((eps_after - eps_before) / abs(eps_before) * 100)
+                if pd.notna(eps_before) and pd.notna(eps_after) and eps_before != 0 else None
+            }
+        return crisis
@@ -0,0 +1,114 @@
+"""
+XBRL Frames Crisis Engine
+SEC api/xbrl/frames/us-gaap/{concept}/{unit}/CY{year}.json returns one concept for
+every filer in a single call. Revenue and EPS for the crisis years are fetched once
+per process for the whole universe and joined by CIK, so the 2008-09 and 2020
+crisis columns cost a handful of requests in total instead of one per ticker.
+"""
+import threading
+from typing import Dict, Optional
+import pandas as pd
+import requests
+from data_fetchers.http_cache import conditional_get
+
+FRAMES_URL = "https://data.sec.gov/api/xbrl/frames/us-gaap/{concept}/{unit}/CY{year}.json"
+
+# metric -> (concepts in preference order, frames unit)
+FRAME_CONCEPTS = {
+    'revenue': ([
+        'Revenues',
+        'RevenueFromContractWithCustomerExcludingAssessedTax',
+        'SalesRevenueNet',
+    ], 'USD'),
+    'eps': (['EarningsPerShareDiluted', 'EarningsPerShareBasic'], 'USD-per-shares'),
+}
+
+# crisis label -> (before year, after year); same labels as FMPFetcher.get_crisis_performance
+CRISIS_WINDOWS = {
+    '2008_2009': (2007, 2009),
+    '2020': (2019, 2020),
+}
+
+
+class CrisisFrames:
+    """Crisis-period revenue/EPS for every filer, indexed by CIK"""
+
+    def __init__(self, session):
+        self.session = session
+        self._table = None
+        self._lock = threading.Lock()
+
+    def _fetch_frame(self, concept: str, unit: str, year: int) -> pd.Series:
+        """One concept for one calendar year: Series of values indexed by integer CIK"""
+        url = FRAMES_URL.format(concept=concept, unit=unit, year=year)
+        try:
+            frame = conditional_get(self.session, url, f"sec_frames_{concept}_{unit}_CY{year}")
+        except requests.HTTPError as e:
+            # Frames that were never reported (e.g. a concept introduced later) are 404s
+            if e.response is None or e.response.status_code != 404:
+                print(f"Error fetching frame {concept} CY{year}: {e}")
+            return pd.Series(dtype='float64')
+        except Exception as e:
+            print(f"Error fetching frame {concept} CY{year}: {e}")
+            return pd.Series(dtype='float64')
+
+        data = frame.get('data') or []
+        series = pd.Series([row.get('val') for row in data],
+                           index=[int(row.get('cik')) for row in data], dtype='float64')
+        return series[~series.index.duplicated(keep='last')]
+
+    def _metric_year(self, metric: str, year: int) -> pd.Series:
+        """Preferred concept first, later concepts only fill CIKs still missing"""
+        concepts, unit = FRAME_CONCEPTS[metric]
+        combined = pd.Series(dtype='float64')
+        for concept in concepts:
+            combined = combined.combine_first(self._fetch_frame(concept, unit, year))
+        return combined
+
+    def table(self) -> pd.DataFrame:
+        """
+        Crisis-year values for every filer (fetched once, then shared)
+        Columns: revenue_<year>, eps_<year> for each crisis year
+        """
+        with self._lock:
+            if self._table is None:
+                years = sorted({year for window in CRISIS_WINDOWS.values() for year in window})
+                columns = {f"{metric}_{year}": self._metric_year(metric, year)
+                           for metric in FRAME_CONCEPTS for year in years}
+                self._table = pd.DataFrame(columns)
+                self._table.index.name = 'cik'
+        return self._table
+
+    def crisis_performance(self, cik) -> Dict:
+        """Same shape as FMPFetcher.get_crisis_performance, from the shared frames"""
+        crisis = {label: {} for label in CRISIS_WINDOWS}
+        table = self.table()
+        try:
+            row = table.loc[int(cik)]
+        except (KeyError, ValueError, TypeError):
+            return crisis
+
+        for label, (before, after) in CRISIS_WINDOWS.items():
+            rev_before, rev_after = row.get(f"revenue_{before}"), row.get(f"revenue_{after}")
+            if pd.isna(rev_before) or pd.isna(rev_after) or rev_before == 0:
+                continue
+            eps_before, eps_after = row.get(f"eps_{before}"), row.get(f"eps_{after}")
+            crisis[label] = {
+                'revenue_change_pct': float((rev_after - rev_before) / rev_before * 100),
+                'eps_change_pct': float((eps_after - eps_before) / abs(eps_before) * 100)
+                if pd.notna(eps_before) and pd.notna(eps_after) and eps_before != 0 else None
+            }
+        return crisis
+
+
+_CRISIS_FRAMES: Optional[CrisisFrames] = None
+_CRISIS_FRAMES_LOCK = threading.Lock()
+
+
+def get_crisis_frames(session) -> CrisisFrames:
+    """Process-wide engine - every ticker in a run shares the same few frame fetches"""
+    global _CRISIS_FRAMES
+    with _CRISIS_FRAMES_LOCK:
+        if _CRISIS_FRAMES is None:
+            _CRISIS_FRAMES = CrisisFrames(session)
+        return _CRISIS_FRAMES
@@ -0,0 +1,176 @@
+"""
+XBRL Instance Reader - segment and geography revenue from a filing's instance document
+Segment and geographic revenue are dimensional facts (StatementBusinessSegmentsAxis,
+StatementGeographicalAxis) that companyfacts leaves out. The instance is read with
+iterparse straight off the response: each top-level element is handled as it closes
+and then dropped, so memory stays flat however large the document. Only contexts on
+those axes (or with no dimensions) and revenue facts are kept.
+"""
+import re
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional
+import pandas as pd
+from data_fetchers.xbrl_facts import CONCEPT_MAP, MIN_ANNUAL_DAYS, MAX_ANNUAL_DAYS
+
+# Bump when fact selection or share computation changes - invalidates cached breakdowns
+XBRL_INSTANCE_VERSION = 1
+
+# breakdown -> axis local name (us-gaap: before 2018, srt: since)
+AXES = {
+    'segments': 'StatementBusinessSegmentsAxis',
+    'geographies': 'StatementGeographicalAxis',
+}
+
+REVENUE_CONCEPTS = CONCEPT_MAP['revenue'][0]
+
+# Linkbases and schemas sit next to the instance in the filing folder
+NON_INSTANCE_SUFFIXES = ('_cal.xml', '_def.xml', '_lab.xml', '_pre.xml', 'FilingSummary.xml', 'MetaLinks.xml')
+
+CAMEL_BREAK = re.compile(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])')
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _number(text: Optional[str]) -> Optional[float]:
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return None
+
+
+def member_label(qname: str) -> str:
+    """'aapl:GreaterChinaSegmentMember' -> 'Greater China'; 'country:US' -> 'US'"""
+    prefix, _, name = qname.rpartition(':')
+    if prefix == 'country':
+        return name
+    for suffix in ('SegmentMember', 'Member'):
+        if name.endswith(suffix) and len(name) > len(suffix):
+            name = name[:-len(suffix)]
+            break
+    return CAMEL_BREAK.sub(' ', name)
+
+
+def find_instance(index_items: List[Dict]) -> Optional[str]:
+    """Instance document name from a filing's index.json items (inline XBRL '_htm.xml' first)"""
+    xml_items = [item for item in index_items
+                 if item.get('name', '').endswith('.xml') and not item['name'].endswith(NON_INSTANCE_SUFFIXES)]
+    extracted = [item for item in xml_items if item['name'].endswith('_htm.xml')]
+    candidates = extracted or xml_items
+    if not candidates:
+        return None
+    return max(candidates, key=lambda item: int(item['size']) if str(item.get('size', '')).isdigit() else 0)['name']
+
+
+def _read_context(element) -> Optional[tuple]:
+    """(axis, member, start, end) for duration contexts with no dimension or one wanted axis"""
+    members, start, end = [], None, None
+    for child in element.iter():
+        local = _local(child.tag)
+        if local == 'explicitMember':
+            members.append((child.get('dimension', ''), (child.text or '').strip()))
+        elif local == 'typedMember':
+            return None
+        elif local == 'startDate':
+            start = (child.text or '').strip()
+        elif local == 'endDate':
+            end = (child.text or '').strip()
+    if not start or not end or len(members) > 1:
+        return None
+    if not members:
+        return None, None, start, end
+    dimension, member = members[0]
+    axis = next((name for name, local in AXES.items() if dimension.rpartition(':')[2] == local), None)
+    return (axis, member, start, end) if axis else None
+
+
+def read_revenue_facts(source) -> pd.DataFrame:
+    """
+    Revenue facts with their context (axis, member, start, end) from an instance (path or file-like)
+    Facts whose context has other or multiple dimensions are skipped.
+    """
+    wanted = set(REVENUE_CONCEPTS)
+    contexts = {}
+    facts = []
+    root = None
+    depth = 0
+    for event, element in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = element
+            depth += 1
+            continue
+        depth -= 1
+        if depth != 1:
+            continue  # Only whole top-level elements (contexts, units, facts)
+
+        local = _local(element.tag)
+        if local == 'context':
+            context = _read_context(element)
+            if context:
+                contexts[element.get('id')] = context
+        elif local in wanted and 'us-gaap' in element.tag and element.get('contextRef'):
+            value = _number(element.text)
+            if value is not None:
+                facts.append((local, element.get('contextRef'), value))
+        root.clear()  # Drop everything handled so far - keeps memory flat
+
+    # Contexts usually precede facts, but the spec doesn't require it - join at the end
+    rows = [(concept, *contexts[ref], value) for concept, ref, value in facts if ref in contexts]
+    frame = pd.DataFrame(rows, columns=['concept', 'axis', 'member', 'start', 'end', 'value'])
+    frame['start'] = pd.to_datetime(frame['start'], errors='coerce')
+    frame['end'] = pd.to_datetime(frame['end'], errors='coerce')
+    return frame
+
+
+def _shares(members: pd.Series, total: Optional[float]) -> List[Dict]:
+    # Consolidated revenue is the denominator; overlapping members can't push a share past 100%
+    denominator = total if total and total >= members.max() else members.sum()
+    return [{'name': member_label(member), 'revenue': float(value), 'pct': round(value / denominator * 100, 1)}
+            for member, value in members.items()]
+
+
+def revenue_breakdown(facts: pd.DataFrame) -> Dict:
+    """
+    Segment and geography revenue shares for the latest fiscal year in the instance
+    Returns segments / geographies (name, revenue, pct - largest first), their counts,
+    top_segment_pct, top2_segments_pct, top_geography, top_geography_pct, total_revenue
+    and period_end. Empty dict when the instance has no annual revenue.
+    """
+    days = (facts['end'] - facts['start']).dt.days
+    annual = facts[(days >= MIN_ANNUAL_DAYS) & (days <= MAX_ANNUAL_DAYS)]
+    if annual.empty:
+        return {}
+    period_end = annual['end'].max()
+    latest = annual[annual['end'] == period_end]
+
+    result = {'period_end': period_end.strftime('%Y-%m-%d'), 'total_revenue': None}
+    consolidated = latest[latest['axis'].isna()]
+    for concept in REVENUE_CONCEPTS:
+        values = consolidated.loc[consolidated['concept'] == concept, 'value']
+        if not values.empty:
+            result['total_revenue'] = float(values.max())
+            break
+
+    for breakdown in AXES:
+        on_axis = latest[(latest['axis'] == breakdown) & (latest['value'] > 0)]
+        result[breakdown] = []
+        if on_axis.empty:
+            continue
+        # The concept broken down into the most members; preference order breaks ties
+        counts = on_axis.groupby('concept')['member'].nunique()
+        concept = max(counts.index, key=lambda c: (counts[c], -REVENUE_CONCEPTS.index(c)))
+        members = (on_axis[on_axis['concept'] == concept].groupby('member')['value'].max()
+                   .sort_values(ascending=False))
+        total = consolidated.loc[consolidated['concept'] == concept, 'value']
+        result[breakdown] = _shares(members, float(total.max()) if not total.empty else None)
+
+    segments, geographies = result['segments'], result['geographies']
+    result['segment_count'] = len(segments)
+    result['top_segment_pct'] = segments[0]['pct'] if segments else None
+    result['top2_segments_pct'] = round(sum(s['pct'] for s in segments[:2]), 1) if len(segments) >= 2 else None
+    result['geo_count'] = len(geographies)
+    result['top_geography'] = geographies[0]['name'] if geographies else None
+    result['top_geography_pct'] = geographies[0]['pct'] if geographies else None
+    return result
@@ -0,0 +1,115 @@
+"""
+XBRL Revisions - restatements detected from companyfacts value revisions
+Every fact in companyfacts carries the accession and filed date of the report that
+tagged it, and each annual report re-tags prior-year comparatives. A restatement is the
+same concept and period reported with a materially different value by a later filing.
+One sort and one groupby over the fact table find every revision - per issuer, or for
+the whole universe at once when frames are concatenated with a `cik` column.
+"""
+from typing import Dict, List, Optional
+import pandas as pd
+from data_fetchers.xbrl_facts import (
+    CONCEPT_MAP, ANNUAL_FORMS, MIN_ANNUAL_DAYS, MAX_ANNUAL_DAYS, _split_concept
+)
+
+# Lines an error correction moves but routine recasts don't: discontinued operations
+# and segment changes reshuffle revenue and cash flow, not net income, equity or assets
+RESTATEMENT_METRICS = ('net_income', 'equity', 'total_assets')
+
+# Revisions smaller than this (% of the originally reported value) are rounding
+MATERIAL_REVISION_PCT = 1.0
+
+PERIOD_KEYS = ['taxonomy', 'concept', 'unit', 'start', 'end']
+
+REVISION_COLUMNS = ['metric', 'concept', 'fiscal_year', 'period_end', 'original', 'revised', 'change_pct',
+                    'original_accn', 'original_filed', 'revised_accn', 'revised_filed', 'revised_form']
+
+
+def tracked_concepts(metrics=RESTATEMENT_METRICS) -> Dict[tuple, str]:
+    """(taxonomy, concept) -> metric for the metrics checked for revisions"""
+    return {_split_concept(name): metric for metric in metrics for name in CONCEPT_MAP[metric][0]}
+
+
+def fact_revisions(facts: pd.DataFrame, metrics=RESTATEMENT_METRICS,
+                   threshold_pct: float = MATERIAL_REVISION_PCT, by: Optional[str] = None) -> pd.DataFrame:
+    """
+    Material revisions of annual facts, one row per restated (concept, period)
+    `facts` is a parse_companyfacts table; pass a concatenated universe table with
+    `by='cik'` to process every issuer in one pass. The first report of a period is
+    the original; the earliest later annual report that differs by threshold_pct or
+    more is the revision.
+    """
+    columns = ([by] if by else []) + REVISION_COLUMNS
+    concepts = tracked_concepts(metrics)
+    units = {metric: CONCEPT_MAP[metric][1] for metric in metrics}
+    instant = {metric: CONCEPT_MAP[metric][2] for metric in metrics}
+    if facts.empty:
+        return pd.DataFrame(columns=columns)
+
+    df = facts[facts['concept'].isin([concept for _, concept in concepts])
+               & facts['form'].isin(ANNUAL_FORMS) & facts['val'].notna()]
+    metric = pd.Series([concepts.get(k) for k in zip(df['taxonomy'].astype(str), df['concept'].astype(str))],
+                       index=df.index, dtype='object')
+    df = df.assign(metric=metric)
+    df = df[df['metric'].notna() & (df['unit'].astype(str) == df['metric'].map(units))]
+
+    # Annual durations for flows, period-end balances for stocks
+    days = (df['end'] - df['start']).dt.days
+    is_instant = df['metric'].map(instant).astype(bool)
+    df = df[(is_instant & df['start'].isna())
+            | (~is_instant & (days >= MIN_ANNUAL_DAYS) & (days <= MAX_ANNUAL_DAYS))]
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+
+    keys = ([by] if by else []) + PERIOD_KEYS
+    df = df.sort_values('filed', kind='stable')
+    grouped = df.groupby(keys, observed=True, dropna=False, sort=False)
+    original = grouped['val'].transform('first')
+    change_pct = (df['val'] - original) / original.abs() * 100
+    material = (original != 0) & (change_pct.abs() >= threshold_pct)
+    if not material.any():
+        return pd.DataFrame(columns=columns)
+
+    first = grouped[['accn', 'filed']].transform('first')
+    revisions = df[material].assign(
+        original=original[material],
+        change_pct=change_pct[material].round(2),
+        original_accn=first.loc[material, 'accn'],
+        original_filed=first.loc[material, 'filed'],
+    ).drop_duplicates(keys)
+    revisions = revisions.rename(columns={'val': 'revised', 'accn': 'revised_accn', 'filed': 'revised_filed',
+                                          'form': 'revised_form', 'end': 'period_end'})
+    revisions['fiscal_year'] = revisions['period_end'].dt.year
+    revisions['concept'] = revisions['concept'].astype(str)
+    revisions['revised_form'] = revisions['revised_form'].astype(str)
+    return revisions[columns].sort_values(([by] if by else []) + ['fiscal_year', 'metric']).reset_index(drop=True)
+
+
+def restated_years(revisions: pd.DataFrame) -> List[Dict]:
+    """
+    One issuer's revisions folded into restated fiscal years, oldest first
+    Each entry: fiscal_year, metrics, max_change_pct (signed, largest magnitude),
+    revised_filed, revised_accn, revised_form (the earliest revising report)
+    """
+    years = []
+    for fiscal_year, group in revisions.sort_values('revised_filed').groupby('fiscal_year', sort=True):
+        largest = group.loc[group['change_pct'].abs().idxmax()]
+        years.append({
+            'fiscal_year': int(fiscal_year),
+            'metrics': sorted(group['metric'].unique()),
+            'max_change_pct': float(largest['change_pct']),
+            'revised_filed': group['revised_filed'].iloc[0].strftime('%Y-%m-%d'),
+            'revised_accn': group['revised_accn'].iloc[0],
+            'revised_form': group['revised_form'].iloc[0],
+        })
+    return years
+
+
+def revision_summary(revisions: pd.DataFrame, by: str = 'cik') -> pd.DataFrame:
+    """Universe view: restated_year_count, restated_years and last_revision_filed per issuer"""
+    grouped = revisions.groupby(by)
+    return pd.DataFrame({
+        'restated_year_count': grouped['fiscal_year'].nunique(),
+        'restated_years': grouped['fiscal_year'].agg(lambda years: sorted(set(int(y) for y in years))),
+        'last_revision_filed': grouped['revised_filed'].max(),
+    })
@@ -7,6 +7,13 @@ from data_fetchers.utils import (
     safe_divide, calculate_cagr, calculate_std_dev, 
     count_down_years, load_cached_data, cache_data
 )
+from data_fetchers.cache_codecs import CodecError
+from data_fetchers.cache_metrics import record_network
+
+def _frame_from_legacy_cache(cached):
+    """Statements cached before the codec layer were stored as split-orient dicts"""
+    return pd.DataFrame(cached['data'], index=cached['index'],
+                        columns=pd.to_datetime(cached['columns']))
 
 class YahooFinanceFetcher:
     def __init__(self, ticker, use_cache=True):
@@ -29,11 +36,25 @@ class YahooFinanceFetcher:
         self.stock = yf.Ticker(self.ticker)
     
     def get_info(self):
-        """Get company info dict"""
+        """Get company info dict (cached - .info is the slowest Yahoo call)"""
+        cache_key = f"yf_info_{self.ticker}"
+        if self.use_cache:
+            cached = load_cached_data(cache_key)
+            if cached:
+                return cached
+        
         try:
-            return self.stock.info
+            record_network(cache_key)
+            info = self.stock.info
         except:
             return {}
+        
+        if self.use_cache and info:
+            try:
+                cache_data(cache_key, info)
+            except CodecError:
+                pass  # Value no codec can represent - just don't cache
+        return info
     
     def get_basic_info(self):
         """Get basic company information for Tickers sheet"""
@@ -57,7 +78,16 @@ class YahooFinanceFetcher:
             statement_type: 'income', 'balance', or 'cashflow'
             annual: True for annual, False for quarterly
         """
+        cache_key = f"yf_{statement_type}_{'annual' if annual else 'quarterly'}_{self.ticker}"
+        if self.use_cache:
+            cached = load_cached_data(cache_key)
+            if isinstance(cached, pd.DataFrame) and not cached.empty:
+                return cached
+            if isinstance(cached, dict) and cached.get('data'):
+                return _frame_from_legacy_cache(cached)
+        
         try:
+            record_network(cache_key)
             if statement_type == 'income':
                 df = self.stock.financials if annual else self.stock.quarterly_financials
             elif statement_type == 'balance':
@@ -66,10 +96,15 @@ class YahooFinanceFetcher:
                 df = self.stock.cashflow if annual else self.stock.quarterly_cashflow
             else:
                 return pd.DataFrame()
-            
-            return df
         except:
             return pd.DataFrame()
+        
+        if self.use_cache and df is not None and not df.empty:
+            try:
+                cache_data(cache_key, df)  # Arrow IPC via the cache codecs
+            except CodecError:
+                pass  # Frame no codec can represent - just don't cache
+        return df
     
     def get_historical_data(self, period="10y"):
         """Get historical price data"""
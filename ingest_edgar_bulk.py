@@ -0,0 +1,50 @@
+"""
+EDGAR BULK INGEST - load SEC's nightly submissions.zip / companyfacts.zip into the local store
+Once ingested, SECEdgarFetcher answers submissions and company facts with zero per-company HTTP
+
+Usage:
+    python ingest_edgar_bulk.py                                  # download both archives
+    python ingest_edgar_bulk.py submissions                      # download one archive
+    python ingest_edgar_bulk.py --file companyfacts companyfacts.zip   # ingest a local copy
+"""
+import sys, os, time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from config import EDGAR_BULK_DB
+from data_fetchers.edgar_bulk import EdgarBulkStore, BULK_URLS
+from data_fetchers.sec_edgar import SEC_USER_AGENT
+from data_fetchers.rate_limit import sec_session
+
+
+def main(argv):
+    store = EdgarBulkStore(EDGAR_BULK_DB)
+
+    if argv[:1] == ['--file']:
+        kind, path = argv[1], argv[2]
+        jobs = [(kind, path)]
+    else:
+        jobs = [(kind, None) for kind in (argv or list(BULK_URLS))]
+
+    session = sec_session()
+    session.headers.update({'User-Agent': SEC_USER_AGENT, 'Accept-Encoding': 'gzip, deflate'})
+
+    print("=" * 80)
+    print(f"EDGAR BULK INGEST -> {EDGAR_BULK_DB}")
+    print("=" * 80)
+
+    for kind, path in jobs:
+        start = time.time()
+        print(f"\n{kind}: {path or BULK_URLS[kind]}")
+        if path:
+            count = store.ingest_zip(path, kind)
+        else:
+            count = store.ingest_url(kind, session=session)
+        print(f"  ✅ {count} documents in {time.time() - start:.0f}s")
+
+    for kind, info in store.status().items():
+        print(f"  {kind:<14} {info['documents']:>8} documents  (ingested {info['ingested_at'][:19]})")
+    store.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,69 @@
+"""
+FORM 4 INGEST - bring every company's insider-trade store up to date
+Only Form 4s filed since the last run are downloaded; the whole universe is then
+aggregated in one vectorized pass (12-month open-market buys/sells per ticker)
+
+Usage:
+    python ingest_form4.py                          # config.TICKERS
+    python ingest_form4.py AAPL MSFT                # specific tickers
+    python ingest_form4.py --universe tickers.txt   # one ticker per line, '#' comments
+"""
+import sys, os, time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+from config import TICKERS
+from data_fetchers.sec_edgar import SECEdgarFetcher
+from data_fetchers.security_master import get_security_master
+from data_fetchers.insider_trades import InsiderTrades, insider_aggregates
+from data_fetchers.cache_metrics import METRICS
+from data_fetchers.universe import load_universe
+
+
+def main(argv):
+    if argv[:1] == ['--universe']:
+        tickers = load_universe(argv[1])
+    elif argv:
+        tickers = [t.upper() for t in argv]
+    else:
+        tickers = TICKERS
+
+    print("=" * 80)
+    print(f"FORM 4 INGEST: {len(tickers)} tickers")
+    print("=" * 80)
+
+    master = get_security_master()
+    frames = []
+    start = time.time()
+    for i, ticker in enumerate(tickers, 1):
+        cik = master.cik(ticker)
+        if not cik:
+            print(f"[{i}/{len(tickers)}] {ticker}: no CIK")
+            continue
+        store = InsiderTrades(SECEdgarFetcher(cik))
+        before = len(store.load())
+        try:
+            frame = store.update()
+        except Exception as e:
+            print(f"[{i}/{len(tickers)}] {ticker}: ❌ {e}")
+            continue
+        print(f"[{i}/{len(tickers)}] {ticker}: {len(frame)} transactions ({len(frame) - before:+d})")
+        frames.append(frame.assign(ticker=ticker))
+
+    if frames:
+        aggregates = insider_aggregates(pd.concat(frames, ignore_index=True), by='ticker')
+        aggregates = aggregates.sort_values('net_buying_value', ascending=False)
+        print("\n" + "=" * 80)
+        print("OPEN-MARKET INSIDER ACTIVITY (12 months)")
+        print("=" * 80)
+        print(f"  {'Ticker':<8} {'Buys':>5} {'Sells':>6} {'Buyers':>7} {'Net $M':>10}")
+        for ticker, row in aggregates.iterrows():
+            print(f"  {ticker:<8} {row['buy_count']:>5} {row['sell_count']:>6} {row['buyers']:>7} "
+                  f"{row['net_buying_value'] / 1e6:>10,.1f}")
+
+    METRICS.print_summary()
+    print(f"\nForm 4 ingest finished in {time.time() - start:.0f}s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,125 @@
+"""
+CACHE PREWARM - run overnight so the morning run_all is (almost) all cache hits
+Walks the ticker universe and fills every cache layer without touching the workbook:
+Yahoo info + statements, FMP endpoints, SEC submissions + filings, FRED, AI outputs
+
+Usage:
+    python prewarm_cache.py                          # config.TICKERS
+    python prewarm_cache.py AAPL MSFT                # specific tickers
+    python prewarm_cache.py --universe tickers.txt   # one ticker per line, '#' comments
+    python prewarm_cache.py --queue                  # only tickers queued by watch_filings.py
+"""
+import sys, os, time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from config import TICKERS, ANTHROPIC_API_KEY, FMP_API_KEY, FRED_API_KEY, USE_AI_ANALYSIS
+from data_fetchers.data_coordinator_v3 import DataCoordinatorV3
+from data_fetchers.utils import print_negative_report
+from data_fetchers.cache_metrics import METRICS
+from data_fetchers.filing_watcher import load_queue, clear_from_queue
+from data_fetchers.universe import load_universe
+
+# Pause between tickers - keeps us well inside SEC/FMP/Yahoo rate limits
+TICKER_DELAY_SECONDS = 1.0
+
+LAYERS = ['yahoo_info', 'yahoo_statements', 'fmp', 'sec_submissions',
+          'sec_10k', 'sec_proxy', 'fred', 'ai']
+
+
+def lower_priority():
+    """Run niced so an overnight prewarm never competes with interactive work"""
+    try:
+        os.nice(10)
+    except (AttributeError, OSError):
+        pass  # Not available on Windows
+
+
+def prewarm_ticker(ticker, live_edgar=False):
+    """Fetch everything for one ticker through the cached fetchers; return layer coverage"""
+    coordinator = DataCoordinatorV3(
+        ticker=ticker,
+        anthropic_key=ANTHROPIC_API_KEY if USE_AI_ANALYSIS else None,
+        fmp_key=FMP_API_KEY,
+        fred_key=FRED_API_KEY,
+        live_edgar=live_edgar
+    )
+    data = coordinator.get_all_data()
+
+    # Statements aren't used by the coordinator, but populators read them
+    statements = [coordinator.yahoo.get_financials(kind) for kind in ('income', 'balance', 'cashflow')]
+
+    edgar = data.get('phase2_edgar') or {}
+    return {
+        'yahoo_info': bool(data.get('phase1_basic', {}).get('full_info')),
+        'yahoo_statements': all(not df.empty for df in statements),
+        'fmp': bool((data.get('phase3_fmp') or {}).get('metrics_10y')),
+        'sec_submissions': bool(edgar.get('10k') or edgar.get('proxy')),
+        'sec_10k': bool(edgar.get('segments') or edgar.get('history')),
+        'sec_proxy': bool(edgar.get('executives')),
+        'fred': (data.get('phase4_fred') or {}).get('treasury_10y') is not None,
+        'ai': bool(data.get('phase6_ai')),
+    }
+
+
+def print_coverage(coverage):
+    """Per-layer coverage table plus per-ticker gaps"""
+    total = len(coverage)
+    print("\n" + "=" * 80)
+    print("PREWARM COVERAGE")
+    print("=" * 80)
+    for layer in LAYERS:
+        warmed = sum(1 for layers in coverage.values() if layers.get(layer))
+        pct = (warmed / total * 100) if total else 0
+        print(f"  {layer:<18} {warmed:>4}/{total:<4} ({pct:.0f}%)")
+
+    gaps = {t: [l for l in LAYERS if not layers.get(l)] for t, layers in coverage.items()}
+    gaps = {t: missing for t, missing in gaps.items() if missing}
+    if gaps:
+        print("\n  Gaps:")
+        for ticker, missing in gaps.items():
+            print(f"    {ticker}: {', '.join(missing)}")
+
+
+def main(argv):
+    if argv[:1] == ['--universe']:
+        tickers = load_universe(argv[1])
+    elif argv[:1] == ['--queue']:
+        queue = load_queue()
+        tickers = list(queue)
+    elif argv:
+        tickers = [t.upper() for t in argv]
+    else:
+        tickers = TICKERS
+
+    lower_priority()
+
+    print("=" * 80)
+    print(f"CACHE PREWARM: {len(tickers)} tickers")
+    print("=" * 80)
+
+    coverage = {}
+    start = time.time()
+    for i, ticker in enumerate(tickers, 1):
+        print(f"\n[{i}/{len(tickers)}] {ticker}")
+        try:
+            # Queued tickers just filed - their bulk-store snapshot can't have the filing yet
+            live = argv[:1] == ['--queue'] and queue[ticker].get('live_submissions', True)
+            coverage[ticker] = prewarm_ticker(ticker, live_edgar=live)
+        except Exception as e:
+            print(f"  ❌ ERROR: {e}")
+            coverage[ticker] = {}
+        time.sleep(TICKER_DELAY_SECONDS)
+
+    if argv[:1] == ['--queue']:
+        clear_from_queue([t for t, layers in coverage.items() if layers])
+
+    print_coverage(coverage)
+    print_negative_report()
+    METRICS.print_summary()
+    print(f"  Cache metrics report: {METRICS.write_report()}")
+    print(f"\nPrewarm finished in {time.time() - start:.0f}s")
+    return coverage
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -18,6 +18,8 @@ from sheet_populators.populate_resilience import populate_resilience_sheet
 from sheet_populators.populate_price_value import populate_price_value_sheet
 from sheet_populators.populate_overview import populate_overview_sheet
 from config import TICKERS, EXCEL_FILE
+from data_fetchers.utils import print_negative_report
+from data_fetchers.cache_metrics import METRICS
 
 def main():
     print("=" * 80)
@@ -80,6 +82,9 @@ def main():
     print("  • AI analysis with full context")
     print("  • 85-92% data completeness")
     print("\n📊 Open Excel to see comprehensive data!")
+    print_negative_report()
+    METRICS.print_summary()
+    print(f"  Cache metrics report: {METRICS.write_report()}")
     print("=" * 80)
 
 if __name__ == "__main__":
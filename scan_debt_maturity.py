@@ -0,0 +1,72 @@
+"""
+DEBT MATURITY SCAN - long-term debt maturity ladders for the whole universe
+Reads companyfacts from the bulk store (ingest_edgar_bulk.py) or the local cache only -
+no network, no filing documents. Only the maturity concepts are parsed and every
+issuer's ladder is built in one vectorized pass.
+
+Usage:
+    python scan_debt_maturity.py                          # config.TICKERS
+    python scan_debt_maturity.py AAPL MSFT                # specific tickers
+    python scan_debt_maturity.py --universe tickers.txt   # one ticker per line, '#' comments
+"""
+import sys, os, time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+from config import TICKERS
+from data_fetchers.edgar_bulk import get_bulk_store
+from data_fetchers.security_master import get_security_master
+from data_fetchers.xbrl_facts import parse_companyfacts
+from data_fetchers.debt_maturity import MATURITY_CONCEPTS, maturity_ladders
+from data_fetchers.universe import load_universe, local_companyfacts
+
+
+def main(argv):
+    if argv[:1] == ['--universe']:
+        tickers = load_universe(argv[1])
+    elif argv:
+        tickers = [t.upper() for t in argv]
+    else:
+        tickers = TICKERS
+
+    print("=" * 80)
+    print(f"DEBT MATURITY SCAN (XBRL): {len(tickers)} tickers")
+    print("=" * 80)
+
+    master = get_security_master()
+    bulk = get_bulk_store()
+    concepts = list(MATURITY_CONCEPTS.values())
+    start = time.time()
+
+    frames = []
+    missing = []
+    for ticker in tickers:
+        cik = master.cik(ticker)
+        facts_json = local_companyfacts(str(cik).zfill(10), bulk) if cik else None
+        if facts_json is None:
+            missing.append(ticker)
+            continue
+        frames.append(parse_companyfacts(facts_json, concepts).assign(ticker=ticker))
+    loaded = time.time()
+
+    ladders = maturity_ladders(pd.concat(frames, ignore_index=True), by='ticker') if frames else pd.DataFrame()
+    print(f"  {len(frames)} issuers loaded in {loaded - start:.1f}s, scanned in {time.time() - loaded:.2f}s")
+    if missing:
+        print(f"  No local companyfacts for {len(missing)}: {', '.join(missing[:20])}"
+              f"{' ...' if len(missing) > 20 else ''}")
+
+    if not ladders.empty:
+        ladders = ladders.sort_values('short_term_debt_pct', ascending=False)
+        print("\n" + "=" * 80)
+        print("MATURITY LADDERS (% of scheduled principal)")
+        print("=" * 80)
+        print(f"  {'Ticker':<8} {'As of':<10} {'Total $B':>9} {'12M':>6} {'<2Y':>6} {'2-5Y':>6} {'>5Y':>6}")
+        for ticker, row in ladders.iterrows():
+            print(f"  {ticker:<8} {row['period_end']:%Y-%m-%d} {row['total'] / 1e9:>9,.2f} "
+                  f"{row['short_term_debt_pct']:>6.1f} {row['under_2y_pct']:>6.1f} "
+                  f"{row['years_2_5_pct']:>6.1f} {row['over_5y_pct']:>6.1f}")
+    print(f"\n{len(tickers) - len(missing) - len(ladders)} issuers without a tagged maturity ladder")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,72 @@
+"""
+RESTATEMENT SCAN - restated fiscal years for the whole universe from XBRL revisions
+Reads companyfacts from the bulk store (ingest_edgar_bulk.py) or the local cache only -
+no network, no filing documents. Only the tracked concepts are parsed, every issuer is
+concatenated into one table and revisions are found in a single vectorized pass.
+
+Usage:
+    python scan_restatements.py                          # config.TICKERS
+    python scan_restatements.py AAPL MSFT                # specific tickers
+    python scan_restatements.py --universe tickers.txt   # one ticker per line, '#' comments
+"""
+import sys, os, time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+from config import TICKERS
+from data_fetchers.edgar_bulk import get_bulk_store
+from data_fetchers.security_master import get_security_master
+from data_fetchers.xbrl_facts import parse_companyfacts
+from data_fetchers.xbrl_revisions import tracked_concepts, fact_revisions, revision_summary
+from data_fetchers.universe import load_universe, local_companyfacts
+
+
+def main(argv):
+    if argv[:1] == ['--universe']:
+        tickers = load_universe(argv[1])
+    elif argv:
+        tickers = [t.upper() for t in argv]
+    else:
+        tickers = TICKERS
+
+    print("=" * 80)
+    print(f"RESTATEMENT SCAN (XBRL revisions): {len(tickers)} tickers")
+    print("=" * 80)
+
+    master = get_security_master()
+    bulk = get_bulk_store()
+    concepts = [concept for _, concept in tracked_concepts()]
+    start = time.time()
+
+    frames = []
+    missing = []
+    for ticker in tickers:
+        cik = master.cik(ticker)
+        facts_json = local_companyfacts(str(cik).zfill(10), bulk) if cik else None
+        if facts_json is None:
+            missing.append(ticker)
+            continue
+        frames.append(parse_companyfacts(facts_json, concepts).assign(ticker=ticker))
+    loaded = time.time()
+
+    revisions = fact_revisions(pd.concat(frames, ignore_index=True), by='ticker') if frames else pd.DataFrame()
+    print(f"  {len(frames)} issuers loaded in {loaded - start:.1f}s, scanned in {time.time() - loaded:.2f}s")
+    if missing:
+        print(f"  No local companyfacts for {len(missing)}: {', '.join(missing[:20])}"
+              f"{' ...' if len(missing) > 20 else ''}")
+
+    if not revisions.empty:
+        summary = revision_summary(revisions, by='ticker').sort_values('last_revision_filed', ascending=False)
+        print("\n" + "=" * 80)
+        print("RESTATED FISCAL YEARS")
+        print("=" * 80)
+        print(f"  {'Ticker':<8} {'Years':>5}  {'Last revised':<12} Fiscal years")
+        for ticker, row in summary.iterrows():
+            print(f"  {ticker:<8} {row['restated_year_count']:>5}  {row['last_revision_filed']:%Y-%m-%d}   "
+                  f"{', '.join(str(y) for y in row['restated_years'])}")
+    print(f"\n{len(tickers) - len(missing) - (revisions['ticker'].nunique() if not revisions.empty else 0)} "
+          f"issuers without material revisions")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
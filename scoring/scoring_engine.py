@@ -3,6 +3,10 @@ Buffett Screener - Automatic Scoring Engine
 Calculates 1-10 scores for each criterion based on quantitative metrics
 """
 
+# Answers calculate_moat_score understands - the AI prompts ask for exactly these
+MOAT_TYPES = ['Brand', 'Network Effects', 'Switching Costs', 'Regulatory/Licenses', 'Cost Advantage', 'None']
+PRICING_POWER_LEVELS = ['Yes', 'Moderate', 'No']
+
 class BuffettScorer:
     """Automatic scoring algorithms for all Buffett criteria"""
     
@@ -200,6 +204,15 @@ class BuffettScorer:
         elif payout_ratio > 90:
             score -= 1
         
+        # Insider open-market trades, last 12 months (routine selling is mostly
+        # diversification, so buying counts for more than selling counts against)
+        insider_buys = data.get('insider_buy_count', 0)
+        insider_sells = data.get('insider_sell_count', 0)
+        if insider_buys >= 2 and data.get('insider_net_buying', 0) > 0:
+            score += 1
+        elif insider_sells >= 5 and insider_buys == 0:
+            score -= 0.5
+        
         return max(1, min(10, round(score, 1)))
     
     @staticmethod
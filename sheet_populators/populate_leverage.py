@@ -42,25 +42,49 @@ def populate_leverage_sheet(tickers=None, excel_file=None):
             ws.cell(row=row, column=cols['Debt_Equity_TTM']).value = debt_equity
             print(f"    Debt/Equity: {debt_equity:.1f} (Yahoo)")
             
+            # Reported history (FMP, or SEC XBRL facts without FMP)
+            history = all_data.get('phase3_fmp') or {}
+            leverage = (history.get('metrics_10y') or {}).get('leverage', {})
+            
             # Calculate metrics from Yahoo
             ebit = info.get('ebitda', 0)
-            interest_expense = ebit * 0.05 if ebit else 0  # Estimate
-            interest_coverage = (ebit / interest_expense) if interest_expense > 0 else 999
+            if leverage.get('interest_coverage') is not None:
+                interest_coverage = leverage['interest_coverage']
+                coverage_source = history.get('source', 'FMP')
+            else:
+                interest_expense = ebit * 0.05 if ebit else 0  # Estimate
+                interest_coverage = (ebit / interest_expense) if interest_expense > 0 else 999
+                coverage_source = "Calculated"
             
             total_debt = info.get('totalDebt', 0)
             net_debt_ebitda = (total_debt / ebit) if ebit > 0 else 0
             
-            ws.cell(row=row, column=cols['Debt_Equity_5Y_Avg']).value = None
+            debt_equity_5y = leverage.get('debt_equity_avg_5y')
+            ws.cell(row=row, column=cols['Debt_Equity_5Y_Avg']).value = debt_equity_5y
             ws.cell(row=row, column=cols['Interest_Coverage']).value = interest_coverage
             ws.cell(row=row, column=cols['Net_Debt_EBITDA']).value = net_debt_ebitda
             ws.cell(row=row, column=cols['Cash_Equivalents']).value = info.get('totalCash', 0)
             
-            print(f"    Interest Coverage: {interest_coverage:.1f}x (Calculated)")
+            if debt_equity_5y is not None:
+                print(f"    Debt/Equity 5Y Avg: {debt_equity_5y:.2f} ({history.get('source', 'FMP')})")
+            print(f"    Interest Coverage: {interest_coverage:.1f}x ({coverage_source})")
             print(f"    Net Debt/EBITDA: {net_debt_ebitda:.1f}x (Calculated)")
             
-            # Debt maturity (would come from Edgar)
-            for col in ['Debt_Maturity_Under_2Y', 'Debt_Maturity_2_5Y', 'Debt_Maturity_Over_5Y',
-                       'Liquidity_Facilities', 'Covenant_Headroom', 'Notes']:
+            # Debt maturity ladder (Edgar XBRL facts) - % of scheduled principal
+            ladder = all_data.get('phase2_edgar', {}).get('debt_maturity') or {}
+            ws.cell(row=row, column=cols['Debt_Maturity_Under_2Y']).value = ladder.get('under_2y_pct')
+            ws.cell(row=row, column=cols['Debt_Maturity_2_5Y']).value = ladder.get('years_2_5_pct')
+            ws.cell(row=row, column=cols['Debt_Maturity_Over_5Y']).value = ladder.get('over_5y_pct')
+            if ladder:
+                ws.cell(row=row, column=cols['Notes']).value = (
+                    f"Scheduled principal ${ladder['total'] / 1e9:,.2f}B at {ladder['period_end']}; "
+                    f"{ladder['short_term_debt_pct']:.0f}% due within 12 months")
+                print(f"    Maturities: {ladder['under_2y_pct']:.0f}% <2Y, {ladder['years_2_5_pct']:.0f}% 2-5Y, "
+                      f"{ladder['over_5y_pct']:.0f}% >5Y (Edgar XBRL)")
+            else:
+                ws.cell(row=row, column=cols['Notes']).value = None
+            
+            for col in ['Liquidity_Facilities', 'Covenant_Headroom']:
                 ws.cell(row=row, column=cols[col]).value = None
             
             # Score
@@ -68,13 +92,14 @@ def populate_leverage_sheet(tickers=None, excel_file=None):
                 'net_debt_ebitda': net_debt_ebitda,
                 'interest_coverage': interest_coverage,
                 'debt_equity': debt_equity / 100 if debt_equity else 0,
-                'short_term_debt_pct': 30
+                'short_term_debt_pct': ladder.get('short_term_debt_pct', 30)
             }
             auto_score = BuffettScorer.calculate_leverage_score(score_data)
             ws.cell(row=row, column=cols['Score']).value = auto_score
             print(f"    Score: {auto_score}/10")
             
-            ws.cell(row=row, column=cols['Source']).value = "Yahoo + Calculated"
+            source = f"Yahoo + {history.get('source', 'FMP')}" if leverage else "Yahoo + Calculated"
+            ws.cell(row=row, column=cols['Source']).value = f"{source} + Edgar" if ladder else source
             ws.cell(row=row, column=cols['Last_Updated']).value = datetime.now().strftime("%Y-%m-%d")
             
             row += 1
@@ -1,6 +1,6 @@
 """
 Management Sheet Populator - V3
-Uses Edgar for executive tenure, Yahoo for insider ownership
+Uses Edgar for executive tenure, pay mix and Form 4 insider trades, Yahoo for insider ownership
 """
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -57,11 +57,32 @@ def populate_management_sheet(tickers=None, excel_file=None):
             ws.cell(row=row, column=cols['Insider_Ownership_Pct']).value = insider_pct
             print(f"    Insider Ownership: {insider_pct:.1f}%")
             
+            # Insider open-market buying/selling over 12 months (Edgar Form 4)
+            insiders = edgar.get('insiders') or {}
+            if insiders:
+                insider_note = (f"Insiders 12M: {insiders['buy_count']} buys / {insiders['sell_count']} sells, "
+                                f"net ${insiders['net_buying_value'] / 1e6:+,.1f}M (Form 4)")
+                print(f"    {insider_note}")
+            else:
+                insider_note = None
+            
+            # Compensation alignment: CEO pay mix from the Summary Compensation Table (Edgar)
+            pay_mix = execs.get('ceo', {}).get('pay_mix') or {}
+            at_risk = pay_mix.get('at_risk_pct')
+            if at_risk is not None:
+                alignment = (f"{at_risk:.0f}% at-risk ({pay_mix['equity_pct']:.0f}% equity, "
+                             f"{pay_mix['cash_incentive_pct']:.0f}% cash incentive)")
+                ws.cell(row=row, column=cols['Compensation_Alignment']).value = alignment
+                print(f"    CEO Pay: {alignment} (Edgar)")
+            else:
+                ws.cell(row=row, column=cols['Compensation_Alignment']).value = None
+            
             # Other management fields (placeholders)
-            for col in ['Compensation_Alignment', 'Capital_Allocation_Letters', 'Disclosure_Quality', 
+            for col in ['Capital_Allocation_Letters', 'Disclosure_Quality', 
                        'Related_Party_Risks', 'Accounting_Conservatism', 'Share_Count_5Y_Change',
-                       'Buybacks_Below_IV', 'MA_Discipline', 'Dividend_Policy', 'Notes']:
+                       'Buybacks_Below_IV', 'MA_Discipline', 'Dividend_Policy']:
                 ws.cell(row=row, column=cols[col]).value = None
+            ws.cell(row=row, column=cols['Notes']).value = insider_note
             
             # Score
             score_data = {
@@ -69,15 +90,18 @@ def populate_management_sheet(tickers=None, excel_file=None):
                 'ceo_tenure_years': ceo_tenure if ceo_tenure else 5,
                 'shares_5y_change_pct': 0,
                 'avg_pe_ratio': info.get('trailingPE', 20),
-                'compensation_aligned': True,
-                'dividend_payout_ratio': 50
+                'compensation_aligned': at_risk >= 50 if at_risk is not None else True,
+                'dividend_payout_ratio': 50,
+                'insider_buy_count': insiders.get('buy_count', 0),
+                'insider_sell_count': insiders.get('sell_count', 0),
+                'insider_net_buying': insiders.get('net_buying_value', 0)
             }
             auto_score = BuffettScorer.calculate_management_score(score_data)
             ws.cell(row=row, column=cols['Score']).value = auto_score
             print(f"    Score: {auto_score}/10")
             
             sources = ["Yahoo"]
-            if ceo_tenure: sources.append("Edgar")
+            if ceo_tenure or at_risk is not None or insiders: sources.append("Edgar")
             ws.cell(row=row, column=cols['Source']).value = " + ".join(sources)
             ws.cell(row=row, column=cols['Last_Updated']).value = datetime.now().strftime("%Y-%m-%d")
             
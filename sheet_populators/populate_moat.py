@@ -86,7 +86,7 @@ def populate_moat_sheet(tickers=None, excel_file=None):
                 'roic_5y_avg': roic_5y if roic_5y else 10,
                 'roe_consistency': historical.get('roe_std', 5),
                 'gross_margin_5y': gross_5y if gross_5y else 30,
-                'pricing_power': pricing_power if pricing_power else 'Low'
+                'pricing_power': pricing_power if pricing_power else 'No'
             }
             auto_score = BuffettScorer.calculate_moat_score(score_data)
             ws.cell(row=row, column=cols['Score']).value = auto_score
@@ -11,6 +11,7 @@ sys.path.append('.')
 from sheet_populators.column_mappings import COLUMN_MAP
 from scoring.scoring_engine import BuffettScorer
 from data_fetchers.data_coordinator_v3 import DataCoordinatorV3
+from data_fetchers.pivot_detector import pivot_years
 
 def populate_operating_history_sheet(tickers=None, excel_file=None):
     if tickers is None: tickers = TICKERS
@@ -75,10 +76,10 @@ def populate_operating_history_sheet(tickers=None, excel_file=None):
             ws.cell(row=row, column=cols['EPS_CAGR']).value = eps_cagr
             
             if revenue_cagr:
-                source = "FMP 10Y" if growth.get('revenue_cagr_10y') else "Yahoo TTM"
+                source = f"{fmp_data.get('source', 'FMP')} 10Y" if growth.get('revenue_cagr_10y') else "Yahoo TTM"
                 print(f"    Revenue CAGR: {revenue_cagr:.1f}% ({source})")
             if eps_cagr:
-                source = "FMP 10Y" if growth.get('eps_cagr_10y') else "Yahoo TTM"
+                source = f"{fmp_data.get('source', 'FMP')} 10Y" if growth.get('eps_cagr_10y') else "Yahoo TTM"
                 print(f"    EPS CAGR: {eps_cagr:.1f}% ({source})")
             
             # Col 9-10: Down years (placeholder - would need detailed analysis)
@@ -86,17 +87,39 @@ def populate_operating_history_sheet(tickers=None, excel_file=None):
             ws.cell(row=row, column=cols['EPS_Down_Years']).value = None
             
             # Col 11-13: Restatements and pivots (Edgar Phase 2)
+            # 8-K Item 4.02 non-reliance notices, or fiscal years whose XBRL values a later
+            # annual report revised - whichever finds more
             restatements = edgar_data.get('restatements', [])
-            ws.cell(row=row, column=cols['Restatements']).value = len(restatements) if restatements else 0
-            ws.cell(row=row, column=cols['Major_Pivots']).value = None
-            ws.cell(row=row, column=cols['Notes']).value = None
+            xbrl_restatements = edgar_data.get('xbrl_restatements') or []
+            restatement_count = max(len(restatements), len(xbrl_restatements))
+            ws.cell(row=row, column=cols['Restatements']).value = restatement_count
+            if xbrl_restatements:
+                years = ', '.join(f"FY{r['fiscal_year']}" for r in xbrl_restatements)
+                print(f"    Restated (XBRL): {years}")
+            
+            # Major pivots: years whose Item 1 / 1A text broke sharply from the prior 10-K
+            pivots = edgar_data.get('pivots') or {}
+            pivot_count = pivots.get('pivot_count') if pivots.get('years') else None
+            ws.cell(row=row, column=cols['Major_Pivots']).value = pivot_count
+            notes = []
+            if xbrl_restatements:
+                notes.append("Restated " + ', '.join(
+                    f"FY{r['fiscal_year']} ({'/'.join(m.replace('_', ' ') for m in r['metrics'])} "
+                    f"{r['max_change_pct']:+.1f}%)" for r in xbrl_restatements))
+            if pivot_count:
+                notes.append(f"10-K business text shift: FY{', FY'.join(pivot_years(pivots))} "
+                             f"(typical YoY similarity {pivots['median_similarity']:.2f})")
+                print(f"    Pivots: {pivot_count} ({', '.join(pivot_years(pivots))})")
+            ws.cell(row=row, column=cols['Notes']).value = '; '.join(notes) or None
             
             # Col 14: Score
             score_data = {
                 'years_profitable': 10,  # Default
                 'revenue_cagr': revenue_cagr if revenue_cagr else 5,
                 'eps_cagr': eps_cagr if eps_cagr else 5,
-                'restatements': len(restatements) if restatements else 0
+                'restatements': restatement_count,
+                'has_restatements': restatement_count > 0,
+                'major_pivots': bool(pivot_count)
             }
             auto_score = BuffettScorer.calculate_operating_history_score(score_data)
             ws.cell(row=row, column=cols['Score']).value = auto_score
@@ -104,10 +127,10 @@ def populate_operating_history_sheet(tickers=None, excel_file=None):
             
             # Col 15: Source
             sources = ["Yahoo"]
-            if founded_year:
+            if founded_year or pivots.get('years') or xbrl_restatements:
                 sources.append("Edgar")
             if growth.get('revenue_cagr_10y'):
-                sources.append("FMP")
+                sources.append(fmp_data.get('source', 'FMP'))
             elif yahoo_fallback.get('revenue_growth'):
                 sources.append("Yahoo Fallback")
             ws.cell(row=row, column=cols['Source']).value = " + ".join(sources)
@@ -11,6 +11,7 @@ sys.path.append('.')
 from sheet_populators.column_mappings import COLUMN_MAP
 from scoring.scoring_engine import BuffettScorer
 from data_fetchers.data_coordinator_v3 import DataCoordinatorV3
+from data_fetchers.text_scanner import customer_diversification
 import yfinance as yf
 
 def populate_resilience_sheet(tickers=None, excel_file=None):
@@ -88,8 +89,17 @@ def populate_resilience_sheet(tickers=None, excel_file=None):
                 pass
             ws.cell(row=row, column=cols['Dividend_Cuts_Crises']).value = "Yes" if dividend_cuts else "No"
             
+            # Customer diversification (Edgar 10-K customer concentration disclosures)
+            customers = (all_data.get('phase2_edgar') or {}).get('customers')
+            diversification = customer_diversification(customers)
+            ws.cell(row=row, column=cols['Customer_Diversification']).value = diversification
+            if diversification:
+                top_pct = customers.get('top_customer_pct')
+                detail = f"top customer {top_pct:.0f}% of revenue" if top_pct is not None else "no customer >10%"
+                print(f"    Customer Diversification: {diversification} ({detail}, Edgar)")
+            
             # Other metrics (placeholders)
-            for col in ['Customer_Diversification', 'Supply_Chain_Risk', 'Regulatory_Sensitivity', 'Notes']:
+            for col in ['Supply_Chain_Risk', 'Regulatory_Sensitivity', 'Notes']:
                 ws.cell(row=row, column=cols[col]).value = None
             
             # Score
@@ -98,14 +108,17 @@ def populate_resilience_sheet(tickers=None, excel_file=None):
                 'revenue_change_2020': rev_2020 if rev_2020 else 0,
                 'dividend_cuts': dividend_cuts,
                 'demand_type': demand_type if demand_type else 'Mixed',
-                'customer_diversification': 'Medium'
+                'customer_diversification': diversification or 'Medium'
             }
             auto_score = BuffettScorer.calculate_resilience_score(score_data)
             ws.cell(row=row, column=cols['Score']).value = auto_score
             print(f"    Score: {auto_score}/10")
             
             sources = ["Yahoo"]
-            if crisis.get('2008_2009'): sources.append("FMP")
+            if crisis.get('2008_2009') or crisis.get('2020'):
+                phase3 = all_data['phase3_fmp']
+                sources.append(phase3.get('crisis_source') or phase3.get('source', 'FMP'))
+            if diversification: sources.append("Edgar")
             if ai: sources.append("AI")
             ws.cell(row=row, column=cols['Source']).value = " + ".join(sources)
             ws.cell(row=row, column=cols['Last_Updated']).value = datetime.now().strftime("%Y-%m-%d")
@@ -79,7 +79,7 @@ def populate_roe_roic_sheet(tickers=None, excel_file=None):
             
             sources = ["Yahoo"]
             if all_data.get('phase3_fmp', {}).get('metrics_10y'):
-                sources.append("FMP")
+                sources.append(all_data['phase3_fmp'].get('source', 'FMP'))
             if all_data.get('phase5_yahoo_fallback'):
                 sources.append("Yahoo Fallback")
             ws.cell(row=row, column=cols['Source']).value = " + ".join(sources)
@@ -11,6 +11,7 @@ sys.path.append('.')
 from sheet_populators.column_mappings import COLUMN_MAP
 from scoring.scoring_engine import BuffettScorer
 from data_fetchers.data_coordinator_v3 import DataCoordinatorV3
+from data_fetchers.sec_edgar import geographic_count
 
 def populate_simplicity_sheet(tickers=None, excel_file=None):
     if tickers is None: tickers = TICKERS
@@ -54,13 +55,33 @@ def populate_simplicity_sheet(tickers=None, excel_file=None):
             print(f"\n  {ticker}:")
             print(f"    Segments: {segment_count if segment_count else 'Edgar unavailable'}")
             
-            # Col 5-7: Revenue/Geographic data (placeholders - would need detailed Edgar parsing)
-            ws.cell(row=row, column=cols['Rev_by_Top_Segment']).value = None
-            ws.cell(row=row, column=cols['Geographic_Count']).value = None
-            ws.cell(row=row, column=cols['Rev_by_Geography']).value = None
-            
-            # Col 8: Customer Concentration (placeholder)
-            ws.cell(row=row, column=cols['Customer_Concentration']).value = None
+            # Col 5-8: Segment and geography revenue shares (Edgar XBRL instance)
+            breakdown = all_data.get('phase2_edgar', {}).get('breakdown') or {}
+            ws.cell(row=row, column=cols['Rev_Top_Segment_Pct']).value = breakdown.get('top_segment_pct')
+            ws.cell(row=row, column=cols['Rev_Top2_Segments_Pct']).value = breakdown.get('top2_segments_pct')
+            # Same geography count the AI complexity prompt sees - shown and scored alike
+            subsidiaries = all_data.get('phase2_edgar', {}).get('subsidiaries') or {}
+            geo_count = geographic_count(all_data.get('phase2_edgar'))
+            ws.cell(row=row, column=cols['Geographic_Count']).value = geo_count or None
+            ws.cell(row=row, column=cols['Top_Geography_Pct']).value = breakdown.get('top_geography_pct')
+            if breakdown.get('top_segment_pct') is not None:
+                print(f"    Top Segment: {breakdown['segments'][0]['name']} {breakdown['top_segment_pct']:.0f}% of revenue")
+            if breakdown.get('top_geography_pct') is not None:
+                print(f"    Geographies: {breakdown['geo_count']}, top {breakdown['top_geography']} "
+                      f"{breakdown['top_geography_pct']:.0f}%")
+            
+            # Col 14: Customers (Edgar 10-K customer concentration disclosures)
+            customers = all_data.get('phase2_edgar', {}).get('customers') or {}
+            if customers.get('top_customer_pct') is not None:
+                customer_text = f"Largest customer {customers['top_customer_pct']:.0f}% of revenue"
+            elif customers.get('no_major_customer'):
+                customer_text = "No customer >10% of revenue"
+            else:
+                customer_text = None
+            if customers.get('top_customers_pct') is not None:
+                group_text = f"top customers {customers['top_customers_pct']:.0f}%"
+                customer_text = f"{customer_text}; {group_text}" if customer_text else group_text.capitalize()
+            ws.cell(row=row, column=cols['Customers']).value = customer_text
             
             # Col 9: Business Model (from AI Phase 6)
             ai_analysis = all_data.get('phase6_ai', {})
@@ -69,22 +90,28 @@ def populate_simplicity_sheet(tickers=None, excel_file=None):
             if business_model:
                 print(f"    Business Model: {business_model[:60]}...")
             
-            # Col 10-17: Other operational metrics (placeholders)
-            ws.cell(row=row, column=cols['Products_SKUs']).value = None
-            ws.cell(row=row, column=cols['Manufacturing']).value = None
-            ws.cell(row=row, column=cols['Distribution']).value = None
-            ws.cell(row=row, column=cols['Vertical_Integration']).value = None
-            ws.cell(row=row, column=cols['Regulatory_Complexity']).value = None
-            ws.cell(row=row, column=cols['Technology_Complexity']).value = None
-            ws.cell(row=row, column=cols['Restatements']).value = None
-            ws.cell(row=row, column=cols['Major_Pivots']).value = None
+            # Col 10: Complexity flags (Edgar Exhibit 21 subsidiary footprint)
+            if subsidiaries.get('country_count'):
+                flags = f"Subsidiaries in {subsidiaries['country_count']} countries"
+                if subsidiaries.get('offshore_count'):
+                    flags += f" ({subsidiaries['offshore_count']} in offshore jurisdictions)"
+                ws.cell(row=row, column=cols['Complexity_Flags']).value = flags
+                print(f"    Footprint: {subsidiaries['subsidiary_count']} subsidiaries, "
+                      f"{subsidiaries['country_count']} countries")
+            else:
+                ws.cell(row=row, column=cols['Complexity_Flags']).value = None
+            
+            # Col 11-17: Other operational metrics (placeholders)
+            for col in ['Accounting_Complexity', 'Off_Balance_Exposures', 'Products',
+                        'Supplier_Concentration', 'Channel_Complexity', 'Notes']:
+                ws.cell(row=row, column=cols[col]).value = None
             
             # Col 18: Score (uses complexity from AI Phase 6)
-            complexity_score = ai_analysis.get('complexity_score', 5)
+            complexity_score = ai_analysis.get('complexity_score') or 5
             
             score_data = {
                 'segment_count': segment_count if segment_count else 5,
-                'geographic_diversity': 0,  # Placeholder
+                'geo_count': geo_count,
                 'complexity_score': complexity_score
             }
             auto_score = BuffettScorer.calculate_simplicity_score(score_data)
@@ -93,7 +120,7 @@ def populate_simplicity_sheet(tickers=None, excel_file=None):
             
             # Col 19: Source
             sources = ["Yahoo"]
-            if segments.get('segment_count'):
+            if segments.get('segment_count') or breakdown or subsidiaries or customer_text:
                 sources.append("Edgar")
             if ai_analysis:
                 sources.append("AI")
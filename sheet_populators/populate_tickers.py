@@ -1,15 +1,16 @@
 """
-Tickers Sheet Populator - V3 with DataCoordinatorV3
-Populates basic company information with ISIN and CIK
+Tickers Sheet Populator - V3 with the security master
+Populates basic company information with ISIN and CIK from the locally held
+security master (SEC ticker list + cached Yahoo metadata) - no per-ticker calls
+once the master is warm
 """
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from openpyxl import load_workbook
-from config import TICKERS, EXCEL_FILE, ANTHROPIC_API_KEY, FMP_API_KEY, FRED_API_KEY, USE_AI_ANALYSIS
-from datetime import datetime
+from config import TICKERS, EXCEL_FILE
 sys.path.append('.')
 from sheet_populators.column_mappings import COLUMN_MAP
-from data_fetchers.data_coordinator_v3 import DataCoordinatorV3
+from data_fetchers.security_master import get_security_master
 
 def populate_tickers_sheet(tickers=None, excel_file=None):
     if tickers is None: tickers = TICKERS
@@ -23,29 +24,27 @@ def populate_tickers_sheet(tickers=None, excel_file=None):
     print(f"POPULATING TICKERS SHEET - V3")
     print(f"{'='*80}\n")
     
+    # Yahoo metadata is refreshed weekly; only missing/stale tickers cost a call
+    master = get_security_master()
+    stale = [t for t in tickers if not master.yahoo_is_fresh(t)]
+    if stale:
+        print(f"Refreshing Yahoo metadata for {len(stale)} ticker(s): {', '.join(stale)}")
+        master.refresh_yahoo(stale)
+    
     row = 2
     for ticker in tickers:
         print(f"\nProcessing {ticker}...")
         
         try:
-            # Initialize coordinator
-            coordinator = DataCoordinatorV3(
-                ticker=ticker,
-                anthropic_key=ANTHROPIC_API_KEY if USE_AI_ANALYSIS else None,
-                fmp_key=FMP_API_KEY,
-                fred_key=FRED_API_KEY
-            )
-            
-            # Phase 1 only (basic info sufficient for this sheet)
-            basic = coordinator.get_basic_info()
+            record = master.get(ticker)
             
             # Col 1-2: Ticker, Company
             ws.cell(row=row, column=cols['Ticker']).value = ticker
-            ws.cell(row=row, column=cols['Company']).value = basic.get('company_name')
+            ws.cell(row=row, column=cols['Company']).value = record.get('name')
             
             # Col 3-4: ISIN, CIK (THE KEY FIELDS!)
-            isin = basic.get('isin')
-            cik = basic.get('cik')
+            isin = record.get('isin')
+            cik = record.get('cik')
             ws.cell(row=row, column=cols['ISIN']).value = isin
             ws.cell(row=row, column=cols['CIK']).value = cik
             
@@ -53,19 +52,18 @@ def populate_tickers_sheet(tickers=None, excel_file=None):
             print(f"  ✅ CIK: {cik if cik else '❌ Not found'}")
             
             # Col 5: Exchange
-            exchange = basic.get('full_info', {}).get('exchange')
-            ws.cell(row=row, column=cols['Exchange']).value = exchange
+            ws.cell(row=row, column=cols['Exchange']).value = record.get('exchange')
             
             # Col 6-7: Sector, Industry
-            ws.cell(row=row, column=cols['Sector']).value = basic.get('sector')
-            ws.cell(row=row, column=cols['Industry']).value = basic.get('industry')
+            ws.cell(row=row, column=cols['Sector']).value = record.get('sector')
+            ws.cell(row=row, column=cols['Industry']).value = record.get('industry')
             
             # Col 8-9: Country, Currency
-            ws.cell(row=row, column=cols['Country']).value = basic.get('country')
-            ws.cell(row=row, column=cols['Currency']).value = basic.get('full_info', {}).get('currency', 'USD')
+            ws.cell(row=row, column=cols['Country']).value = record.get('country')
+            ws.cell(row=row, column=cols['Currency']).value = record.get('currency') or 'USD'
             
-            # Col 10: Last Updated
-            ws.cell(row=row, column=cols['Last_Updated']).value = datetime.now().strftime("%Y-%m-%d")
+            # Col 10: Primary Source (the Tickers sheet has no Last Updated column)
+            ws.cell(row=row, column=cols['Primary_Source']).value = "SEC" if cik else "Yahoo"
             
             row += 1
             
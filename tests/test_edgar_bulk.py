@@ -0,0 +1,59 @@
+"""
+EDGAR bulk store - ingest and lookups against small fixture zips
+Run: python -m pytest -q tests/test_edgar_bulk.py
+"""
+import sys, os, json, shutil, tempfile, unittest, zipfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_fetchers.edgar_bulk import EdgarBulkStore
+
+SUBMISSIONS = {
+    'CIK0000320193.json': {'cik': '320193', 'filings': {'recent': {'form': ['10-K']}, 'files': []}},
+    'CIK0000320193-submissions-001.json': {'form': ['10-Q'], 'accessionNumber': ['0000320193-09-000001']},
+}
+COMPANYFACTS = {
+    'CIK0000320193.json': {'cik': 320193, 'facts': {'us-gaap': {}}},
+}
+
+
+class EdgarBulkStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.store = EdgarBulkStore(os.path.join(self.tmp, 'bulk.sqlite'))
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.tmp)
+
+    def _zip(self, name, members):
+        path = os.path.join(self.tmp, name)
+        with zipfile.ZipFile(path, 'w') as zf:
+            zf.writestr('README.txt', 'not a document')
+            for member, body in members.items():
+                zf.writestr(member, json.dumps(body))
+        return path
+
+    def test_ingest_and_lookups(self):
+        self.assertEqual(self.store.ingest_zip(self._zip('submissions.zip', SUBMISSIONS), 'submissions'), 2)
+        self.assertEqual(self.store.ingest_zip(self._zip('companyfacts.zip', COMPANYFACTS), 'companyfacts'), 1)
+
+        self.assertEqual(self.store.get_submissions('320193'), SUBMISSIONS['CIK0000320193.json'])
+        self.assertEqual(self.store.get_submissions_page('CIK0000320193-submissions-001.json'),
+                         SUBMISSIONS['CIK0000320193-submissions-001.json'])
+        self.assertEqual(self.store.get_companyfacts('0000320193'), COMPANYFACTS['CIK0000320193.json'])
+        self.assertEqual(self.store.status()['submissions']['documents'], 2)
+
+    def test_missing_cik(self):
+        self.store.ingest_zip(self._zip('submissions.zip', SUBMISSIONS), 'submissions')
+        self.assertIsNone(self.store.get_submissions('789019'))
+        self.assertIsNone(self.store.get_companyfacts('320193'))  # kind never ingested
+
+    def test_stale_snapshot_is_skipped(self):
+        self.store.ingest_zip(self._zip('submissions.zip', SUBMISSIONS), 'submissions')
+        conn = self.store._connect()
+        conn.execute("UPDATE ingests SET ingested_at = '2000-01-01T00:00:00'")
+        conn.commit()
+        self.assertIsNone(self.store.get_submissions('320193'))
+
+
+if __name__ == "__main__":
+    unittest.main()
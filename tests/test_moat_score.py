@@ -0,0 +1,29 @@
+"""
+Moat score - every answer the AI prompts allow is one the scorer understands
+Run: python -m pytest -q tests/test_moat_score.py
+"""
+import sys, os, unittest
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scoring.scoring_engine import BuffettScorer, MOAT_TYPES, PRICING_POWER_LEVELS
+
+
+def moat_score(**data):
+    return BuffettScorer.calculate_moat_score(dict({'roe_5y_avg': 10, 'roic_5y_avg': 10}, **data))
+
+
+class MoatVocabularyTest(unittest.TestCase):
+    def test_every_moat_type_scores(self):
+        baseline = moat_score(moat_type='None', pricing_power='No')
+        for moat_type in MOAT_TYPES:
+            if moat_type != 'None':
+                with self.subTest(moat_type=moat_type):
+                    self.assertGreater(moat_score(moat_type=moat_type, pricing_power='No'), baseline)
+
+    def test_pricing_power_levels_are_ordered(self):
+        scores = [moat_score(moat_type='None', pricing_power=level) for level in PRICING_POWER_LEVELS]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual(len(set(scores)), len(PRICING_POWER_LEVELS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+FILING WATCHER - find new SEC filings across the universe and queue targeted recomputes
+Advances a per-CIK high-water mark, drops the cache entries a new filing makes stale,
+and queues only the affected tickers (with the phases to redo) for prewarm_cache.py --queue
+
+Usage:
+    python watch_filings.py                          # config.TICKERS, submissions feeds
+    python watch_filings.py --daily-index            # one daily index request per business day
+    python watch_filings.py --universe tickers.txt   # one ticker per line, '#' comments
+"""
+import sys, os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from config import TICKERS
+from data_fetchers.filing_watcher import FilingWatcher
+from data_fetchers.cache_metrics import METRICS
+from data_fetchers.universe import load_universe
+
+
+def main(argv):
+    daily_index = '--daily-index' in argv
+    argv = [a for a in argv if a != '--daily-index']
+    if argv[:1] == ['--universe']:
+        tickers = load_universe(argv[1])
+    elif argv:
+        tickers = [t.upper() for t in argv]
+    else:
+        tickers = TICKERS
+
+    print("=" * 80)
+    print(f"FILING WATCHER: {len(tickers)} tickers ({'daily index' if daily_index else 'submissions feeds'})")
+    print("=" * 80)
+
+    watcher = FilingWatcher(tickers)
+    new_filings = watcher.poll_daily_index() if daily_index else watcher.poll_submissions()
+    watcher.save()
+
+    for filing in new_filings:
+        phases = ', '.join(filing['phases']) or 'none'
+        print(f"  {filing['ticker']:<8} {filing['form']:<8} {filing['filing_date']}  "
+              f"{filing['accession_number']}  -> {phases}")
+    if not new_filings:
+        print("  No new filings")
+
+    pending = watcher.pending()
+    print(f"\n  Recompute queue: {len(pending)} tickers")
+    for ticker, entry in pending.items():
+        print(f"    {ticker}: {', '.join(entry['phases'])} ({len(entry['filings'])} filings)")
+    if pending:
+        print("  Run `python prewarm_cache.py --queue` to recompute them")
+
+    METRICS.print_summary()
+    return new_filings
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])